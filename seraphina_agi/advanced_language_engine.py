@@ -1,11 +1,23 @@
 import hashlib
-import base64
 import math
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping, Iterable, Iterator, Tuple, Union, BinaryIO
 from .roman_wheel import RomanDecoderWheel
+from .language_detection import default_detector
+from .result_cache import ResultCache
+from .translation import Translator
+from . import cipher_cache, octabit_cipher
+from .metrics import timed
+from .octabit_cipher import BytesLike, encrypt_bytes, decrypt_bytes
+from .protocol_codecs import Codec, ProtocolError, ProtocolLineDecoder, codec_for
 
 class AdvancedLanguageEngine:
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None, result_cache: Optional[ResultCache] = None):
+        # cache_dir: directory for the persistent cipher table cache
+        # (see cipher_cache); None always recomputes the table.
+        # result_cache: opt-in memoization of process_language results; it may
+        # be shared between engines since keys include the engine version and
+        # cache_generation, which SharedEngine bumps on every reload.
         self.engine_id = 'LANGUAGE_ENGINE_MASTER_8.0.1'
         self.version = 'MASTER-8.0.1'
         self.status = 'initializing'
@@ -71,7 +83,7 @@ class AdvancedLanguageEngine:
             'enabled': True,
             'encryption_key': self._generate_octabit_key(),
             'quantum_salt': self._generate_quantum_salt(),
-            'frequency_cipher': {}
+            'frequency_cipher': MappingProxyType({})
         }
 
         # Roman wheels for spiral modulation
@@ -79,7 +91,13 @@ class AdvancedLanguageEngine:
             RomanDecoderWheel('xy', 432 + i * 3, 580 + i * 10)
             for i in range(4)
         ]
-        self._initialize_octabit_encryption()
+        self._initialize_octabit_encryption(cache_dir)
+        self.protocol_codecs = {code: codec_for(code, meta['kind'])
+                                for code, meta in self.supported_languages['protocol'].items()}
+        self.translator = Translator(self.supported_languages['natural'])
+        self.detector = default_detector()
+        self.result_cache = result_cache
+        self.cache_generation = 0
         self.status = 'active'
 
     def list_supported_codes(self) -> Dict[str, Any]:
@@ -93,8 +111,8 @@ class AdvancedLanguageEngine:
     def explain_coding_capabilities(self) -> Dict[str, Any]:
         features = [
             {'key': 'encryption', 'value': 'Octabit frequency XOR per language'},
-            {'key': 'detection', 'value': 'Simple heuristic (ASCII vs diacritics) for natural lang; programming selection manual'},
-            {'key': 'translation', 'value': 'Placeholder deterministic word substitution for en->es; extendable grid'},
+            {'key': 'detection', 'value': 'Unicode script ranges plus character n-gram profiles for natural lang; programming selection manual'},
+            {'key': 'translation', 'value': 'Phrase-table longest-match substitution per natural language pair (file-loaded tables)'},
             {'key': 'protocol_support', 'value': f"{len(self.supported_languages['protocol'])} protocol codes"},
             {'key': 'programming_count', 'value': len(self.supported_languages['programming'])},
             {'key': 'natural_count', 'value': len(self.supported_languages['natural'])},
@@ -117,7 +135,24 @@ class AdvancedLanguageEngine:
     def _generate_quantum_signature(self, key: List[int]) -> int:
         return sum(v * (i + 1) for i, v in enumerate(key)) % 65536
 
-    def _initialize_octabit_encryption(self):
+    @timed('cipher_table')
+    def _initialize_octabit_encryption(self, cache_dir: Optional[str] = None):
+        digest = None
+        if cache_dir:
+            digest = cipher_cache.table_digest(self.version, self.supported_languages, self.roman_wheels)
+            cached = cipher_cache.load(cache_dir, digest, len(self.roman_wheels))
+            if cached:
+                registry, thetas = cached
+                # Leave the wheels exactly where a full computation would.
+                for wheel, theta in zip(self.roman_wheels, thetas):
+                    wheel.theta = theta
+                self.octabit_encryption['frequency_cipher'] = MappingProxyType(registry)
+                return
+
+        # Built into a private dict, then published as a read-only registry so
+        # one engine can be shared by concurrent request handlers.
+        registry: Dict[str, Mapping[str, Any]] = {}
+
         def add_cipher(code: str, data: Dict[str, Any]):
             base_key = self._generate_frequency_encryption_key(data['frequency'])
             base_hex = bytes(base_key).hex()
@@ -129,13 +164,13 @@ class AdvancedLanguageEngine:
                 mod_bytes = bytes.fromhex(decoded)
             except ValueError:
                 mod_bytes = bytes(len(base_hex) // 2)
-            final_key = [(b ^ base_key[i % len(base_key)]) & 0xFF for i, b in enumerate(mod_bytes)]
-            self.octabit_encryption['frequency_cipher'][code] = {
+            final_key = tuple((b ^ base_key[i % len(base_key)]) & 0xFF for i, b in enumerate(mod_bytes))
+            registry[code] = MappingProxyType({
                 'base_frequency': data['frequency'],
                 'encryption_key': final_key,
-                'quantum_signature': self._generate_quantum_signature(final_key),
+                'quantum_signature': self._generate_quantum_signature(list(final_key)),
                 'octabit_level': 3
-            }
+            })
 
         for lang_dict in [self.supported_languages['natural'],
                          self.supported_languages['programming'],
@@ -143,67 +178,276 @@ class AdvancedLanguageEngine:
             for code, data in lang_dict.items():
                 add_cipher(code, data)
 
-    def _apply_frequency_encryption(self, text: str, cipher: Dict[str, Any]) -> str:
-        key = cipher['encryption_key']
-        data = text.encode('utf-8')
-        out = bytearray(len(data))
-        for i, b in enumerate(data):
-            out[i] = b ^ key[i % len(key)]
-        return base64.b64encode(out).decode('ascii').rstrip('=').replace('+', '-').replace('/', '_')
+        self.octabit_encryption['frequency_cipher'] = MappingProxyType(registry)
+        if digest:
+            cipher_cache.store(cache_dir, digest, registry, [wheel.theta for wheel in self.roman_wheels])
 
-    def _reverse_frequency_encryption(self, encrypted_text: str, cipher: Dict[str, Any]) -> str:
-        key = cipher['encryption_key']
+    @timed('cipher_encrypt')
+    def _apply_frequency_encryption(self, text: Union[str, BytesLike], cipher: Mapping[str, Any]) -> str:
+        data = text.encode('utf-8') if isinstance(text, str) else text
+        return encrypt_bytes(data, cipher['encryption_key'])
+
+    @timed('cipher_decrypt')
+    def _reverse_frequency_encryption(self, encrypted_text: str, cipher: Mapping[str, Any],
+                                      codec: Optional[Codec] = None, encoding: Optional[str] = None) -> str:
         try:
-            enc_data = base64.b64decode(encrypted_text.replace('-', '+').replace('_', '/'))
+            out = decrypt_bytes(encrypted_text, cipher['encryption_key'])
         except Exception:
             return encrypted_text
-        out = bytearray(len(enc_data))
-        for i, b in enumerate(enc_data):
-            out[i] = b ^ key[i % len(key)]
+        if codec is not None and encoding != 'text':
+            try:
+                return codec.decode(out)
+            except ProtocolError:
+                if encoding == 'packed':
+                    raise
         return out.decode('utf-8', errors='ignore')
 
-    def encrypt_with_octabit(self, text: str, language: str) -> str:
+    @timed('encrypt')
+    def encrypt_with_octabit(self, text: Union[str, BytesLike], language: str) -> str:
         cipher = self.octabit_encryption['frequency_cipher'].get(language)
         if not cipher:
             return text
         return self._apply_frequency_encryption(text, cipher)
 
-    def decrypt_with_octabit(self, text: str, language: str) -> str:
+    def decrypt_with_octabit(self, text: str, language: str, encoding: Optional[str] = None) -> str:
+        """
+        Reverse encrypt_with_octabit.
+
+        Protocol messages are unpacked by their codec back to the canonical
+        text. Pass the result's protocol_encoding ('packed' or 'text') to pick
+        the path; without it a token that unpacks is taken as packed.
+
+        Raises:
+            ProtocolError: encoding is 'packed' and the token does not unpack
+        """
         cipher = self.octabit_encryption['frequency_cipher'].get(language)
         if not cipher:
             return text
-        return self._reverse_frequency_encryption(text, cipher)
+        return self._reverse_frequency_encryption(text, cipher, self.protocol_codecs.get(language), encoding)
+
+    def encrypt_into(self, data: BytesLike, language: str, out: BytesLike) -> int:
+        # Raw XOR (no base64) of data into the caller's buffer; out may be data
+        # itself. Unknown languages copy the bytes through unchanged.
+        cipher = self.octabit_encryption['frequency_cipher'].get(language)
+        if not cipher:
+            view = memoryview(data).cast('B')
+            memoryview(out).cast('B')[:len(view)] = view
+            return len(view)
+        return octabit_cipher.xor_into(data, cipher['encryption_key'], out)
 
+    def encode_protocol(self, message: Union[str, BytesLike], code: str) -> bytes:
+        # Validated, packed binary form of one message; raises ProtocolError.
+        return self._protocol_codec(code).encode(message)
+
+    def decode_protocol(self, data: BytesLike, code: str) -> str:
+        return self._protocol_codec(code).decode(data)
+
+    def protocol_decoder(self, code: str, encrypt: bool = True, skip_invalid: bool = False) -> ProtocolLineDecoder:
+        # Line-oriented stream decoder for a protocol code; with encrypt the
+        # packed messages come out XORed with the code's cipher key.
+        key = self.octabit_encryption['frequency_cipher'][code]['encryption_key'] if encrypt else None
+        return ProtocolLineDecoder(self._protocol_codec(code), key, skip_invalid)
+
+    def _protocol_codec(self, code: str) -> Codec:
+        codec = self.protocol_codecs.get(code)
+        if codec is None:
+            raise ProtocolError(f'unknown protocol code {code!r}')
+        return codec
+
+    def _cipher_input(self, text: Union[str, BytesLike],
+                      language: str) -> Tuple[Union[str, BytesLike], Optional[str]]:
+        # (payload, protocol encoding). Protocol messages are encrypted in their
+        # packed binary form ('packed'); input that does not parse as the code's
+        # kind is encrypted as text ('text'). None for non-protocol languages.
+        codec = self.protocol_codecs.get(language)
+        if codec is None:
+            return text, None
+        try:
+            return codec.encode(text), 'packed'
+        except ProtocolError:
+            return text, 'text'
+
+    @timed('stream_encrypt')
+    def encrypt_stream(self, reader: BinaryIO, writer: BinaryIO, language: str,
+                       chunk_size: int = octabit_cipher.STREAM_CHUNK_BYTES) -> int:
+        # Streaming counterpart of encrypt_with_octabit; unknown languages pass through unchanged.
+        cipher = self.octabit_encryption['frequency_cipher'].get(language)
+        if not cipher:
+            return octabit_cipher.copy_stream(reader, writer, chunk_size)
+        return octabit_cipher.encrypt_stream(reader, writer, cipher['encryption_key'], chunk_size)
+
+    @timed('stream_decrypt')
+    def decrypt_stream(self, reader: BinaryIO, writer: BinaryIO, language: str,
+                       chunk_size: int = octabit_cipher.STREAM_CHUNK_BYTES) -> int:
+        cipher = self.octabit_encryption['frequency_cipher'].get(language)
+        if not cipher:
+            return octabit_cipher.copy_stream(reader, writer, chunk_size)
+        return octabit_cipher.decrypt_stream(reader, writer, cipher['encryption_key'], chunk_size)
+
+    @timed('detect')
     def detect_language(self, text: str) -> str:
-        if any(c in text for c in '¿¡ñáéíóú'):
-            return 'es-ES'
-        return 'en-US'
+        return self.detector.detect(text)[0]
+
+    def detect_language_with_confidence(self, text: str) -> Dict[str, Any]:
+        language, confidence = self.detector.detect(text)
+        return {'language': language, 'confidence': confidence}
 
+    @timed('translate')
     def translate(self, text: str, source_lang: str, target_lang: str) -> Dict[str, Any]:
-        if source_lang == target_lang:
-            return {'text': text, 'confidence': 0.95}
-        if source_lang == 'en-US' and target_lang == 'es-ES':
-            trans_map = {'Hello': 'Hola', 'World': 'Mundo', 'world': 'mundo', 'hello': 'hola'}
-            translated = text
-            for eng, esp in trans_map.items():
-                translated = translated.replace(eng, esp)
-            return {'text': f'[ES] {translated}', 'confidence': 0.9}
-        return {'text': f'[{target_lang}] {text}', 'confidence': 0.7}
+        return self.translator.translate(text, source_lang, target_lang)
 
-    def process_language(self, input_text: str, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    @staticmethod
+    def resolve_options(options: Optional[Dict[str, Any]]) -> Tuple[str, str, bool]:
         opts = options or {}
-        source_lang = opts.get('source_language', 'auto')
-        target_lang = opts.get('target_language', 'en-US')
-        encryption_enabled = opts.get('encryption_enabled', True)
+        return (
+            opts.get('source_language', 'auto'),
+            opts.get('target_language', 'en-US'),
+            opts.get('encryption_enabled', True)
+        )
+
+    def process_language(self, input_text: str, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self._process_one(input_text, *self.resolve_options(options))
+
+    @timed('process_bytes')
+    def process_bytes(self, data: BytesLike, options: Optional[Dict[str, Any]] = None,
+                      out: Optional[BytesLike] = None) -> Dict[str, Any]:
+        """
+        Binary counterpart of process_language for bytes-in/bytes-out callers.
+
+        The input is only decoded to str when the language has to be detected
+        or the text translated. Protocol messages are packed by their codec
+        before encryption, as in process_language, and the result carries
+        the protocol_encoding. With encryption on, the output is the
+        ciphertext itself; the translation pass over an encrypted token is
+        skipped.
+
+        Args:
+            data: UTF-8 input (bytes, bytearray, memoryview or mmap)
+            options: process_language options plus 'encoding': 'base64'
+                (default, the encrypted_input token as ASCII) or 'raw'
+                (XORed bytes, no base64 round trip)
+            out: Writable buffer for the output: len(data) bytes for 'raw' (pass
+                data itself to encrypt in place), about 4/3 of that for
+                'base64'. Allocated when None, or for 'raw' when a packed
+                protocol message does not fit.
+
+        Returns:
+            {'detected_language', 'encoding', 'output': memoryview}; encoding
+            is 'utf-8' (translated text) when encryption is disabled. Encrypted
+            protocol codes add 'protocol_encoding': 'packed' or 'text'
 
+        Raises:
+            ValueError: for an unknown encoding or a too small out buffer
+        """
+        source_lang, target_lang, encryption_enabled = self.resolve_options(options)
+        encoding = (options or {}).get('encoding', 'base64')
+        if encoding not in ('base64', 'raw'):
+            raise ValueError(f"encoding must be 'base64' or 'raw', not {encoding!r}")
+        view = memoryview(data).cast('B')
+        text = None
+        detected = source_lang
+        if detected == 'auto':
+            text = str(view, 'utf-8', 'ignore')
+            detected = self.detect_language(text)
+        if not encryption_enabled:
+            if text is None:
+                text = str(view, 'utf-8', 'ignore')
+            output = memoryview(self.translate(text, detected, target_lang)['text'].encode('utf-8'))
+            return {'detected_language': detected, 'encoding': 'utf-8', 'output': self._into(output, out)}
+        payload, protocol_encoding = self._cipher_input(view, detected)
+        payload = memoryview(payload).cast('B')
+        if encoding == 'raw':
+            if out is None or len(memoryview(out)) < len(payload):
+                out = bytearray(len(payload))
+            written = self.encrypt_into(payload, detected, out)
+            result = {'detected_language': detected, 'encoding': 'raw', 'output': memoryview(out).cast('B')[:written]}
+        else:
+            cipher = self.octabit_encryption['frequency_cipher'].get(detected)
+            if cipher:
+                output = octabit_cipher.encode_token_bytes(octabit_cipher.xor_bytes(payload, cipher['encryption_key']))
+            else:
+                output = view
+            result = {'detected_language': detected, 'encoding': 'base64', 'output': self._into(output, out)}
+        if protocol_encoding is not None:
+            result['protocol_encoding'] = protocol_encoding
+        return result
+
+    @staticmethod
+    def _into(output: memoryview, out: Optional[BytesLike]) -> memoryview:
+        if out is None:
+            return output
+        dest = memoryview(out).cast('B')
+        if len(dest) < len(output):
+            raise ValueError(f'output buffer holds {len(dest)} bytes, need {len(output)}')
+        dest[:len(output)] = output
+        return dest[:len(output)]
+
+    def cached_result(self, input_text: str, options: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        # For callers that compute results elsewhere (e.g. a process pool).
+        if self.result_cache is None:
+            return None
+        return self.result_cache.get(self._cache_key(input_text, *self.resolve_options(options)))
+
+    def store_result(self, input_text: str, options: Optional[Dict[str, Any]], result: Dict[str, Any]):
+        if self.result_cache is not None:
+            self.result_cache.put(self._cache_key(input_text, *self.resolve_options(options)), result)
+
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        return self.result_cache.stats() if self.result_cache is not None else None
+
+    def _cache_key(self, input_text: str, source_lang: str, target_lang: str, encryption_enabled: bool) -> bytes:
+        return ResultCache.key(input_text, source_lang, target_lang, encryption_enabled,
+                               f'{self.version}/{self.cache_generation}')
+
+    def process_many(self, texts: Iterable[Union[str, Dict[str, Any]]],
+                     options: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        # Lazily yields one result per item, in input order. Items are plain
+        # strings or {'input': ..., 'options': {...}} records whose options
+        # override the shared batch options.
+        source_lang, target_lang, encryption_enabled = self.resolve_options(options)
+        for item in texts:
+            if isinstance(item, str):
+                yield self._process_one(item, source_lang, target_lang, encryption_enabled)
+                continue
+            item_opts = item.get('options') or {}
+            yield self._process_one(
+                item.get('input', ''),
+                item_opts.get('source_language', source_lang),
+                item_opts.get('target_language', target_lang),
+                item_opts.get('encryption_enabled', encryption_enabled)
+            )
+
+    @timed('process')
+    def _process_one(self, input_text: str, source_lang: str, target_lang: str,
+                     encryption_enabled: bool) -> Dict[str, Any]:
+        cache = self.result_cache
+        if cache is None:
+            return self._compute(input_text, source_lang, target_lang, encryption_enabled)
+        key = self._cache_key(input_text, source_lang, target_lang, encryption_enabled)
+        result = cache.get(key)
+        if result is None:
+            result = self._compute(input_text, source_lang, target_lang, encryption_enabled)
+            cache.put(key, result)
+        return result
+
+    def _compute(self, input_text: str, source_lang: str, target_lang: str,
+                 encryption_enabled: bool) -> Dict[str, Any]:
         detected = self.detect_language(input_text) if source_lang == 'auto' else source_lang
-        enc = self.encrypt_with_octabit(input_text, detected) if encryption_enabled else input_text
+        protocol_encoding = None
+        if encryption_enabled:
+            payload, protocol_encoding = self._cipher_input(input_text, detected)
+            enc = self.encrypt_with_octabit(payload, detected)
+        else:
+            enc = input_text
         trans = self.translate(enc if encryption_enabled else input_text, detected, target_lang)
 
-        return {
+        result = {
             'input': input_text,
             'detected_language': detected,
             'encrypted_input': enc if encryption_enabled and enc != input_text else None,
             'translated_content': trans['text'],
             'translation_confidence': trans['confidence']
-        }
\ No newline at end of file
+        }
+        if protocol_encoding is not None:
+            result['protocol_encoding'] = protocol_encoding
+        return result
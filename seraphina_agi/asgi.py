@@ -0,0 +1,550 @@
+"""
+ASGI application for Seraphina AGI, plus a dependency-free asyncio server.
+EngineASGIApp runs under any ASGI server (uvicorn seraphina_agi.asgi:app, created
+on first access, or uvicorn --factory seraphina_agi.asgi:make_app)
+and serves the same /process, /process/batch, /reload, /health and /metrics
+routes as the threaded server, with request and response bodies streamed.
+AsyncHTTPServer is a small HTTP/1.1 server on asyncio streams: an idle
+keep-alive connection is a parked coroutine rather than a worker thread, so
+thousands of them cost only memory.
+"""
+
+import asyncio
+import json
+import signal
+import threading
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from . import metrics
+from .advanced_language_engine import AdvancedLanguageEngine
+from .async_engine import DEFAULT_EXECUTOR_WORKERS, AsyncLanguageEngine
+from .result_cache import ResultCache
+from .server import (ADMIN_ROUTES, BATCH_FLUSH_ITEMS, DEFAULT_HOST, HTTP_REQUESTS, HTTP_SECONDS, NDJSON_TYPES,
+                     OCTET_STREAM, ROUTES, BatchRecordError, admin_allowed, parse_batch_record, query_options,
+                     resolve_admin_token)
+from .shared_engine import SharedEngine
+
+MAX_BODY_BYTES = 16 * 1024 * 1024
+MAX_HEADER_BYTES = 64 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+DEFAULT_ASYNC_BACKLOG = 2048
+ASYNC_KEEPALIVE_TIMEOUT = 75.0
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 403: 'Forbidden', 404: 'Not Found', 411: 'Length Required',
+            413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+
+class BodyTooLarge(ValueError):
+    pass
+
+
+class EngineASGIApp:
+    def __init__(self, engine: Optional[AsyncLanguageEngine] = None, max_body_bytes: int = MAX_BODY_BYTES,
+                 admin_token: Optional[str] = None):
+        """
+        ASGI 3 application around an AsyncLanguageEngine.
+
+        Args:
+            engine: Engine facade; default builds one lazily on a private pool
+            max_body_bytes: Largest /process body accepted before answering 413
+            admin_token: Bearer token for /reload; default $SERAPHINA_ADMIN_TOKEN,
+                and without one /reload is limited to loopback clients
+        """
+        self.engine = engine or AsyncLanguageEngine()
+        self.max_body_bytes = max_body_bytes
+        self.admin_token = resolve_admin_token(admin_token)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+        started = time.perf_counter()
+        status = []
+
+        async def tracked_send(message: Dict[str, Any]):
+            if message['type'] == 'http.response.start':
+                status.append(message['status'])
+            await send(message)
+
+        try:
+            await self._route(scope, receive, tracked_send)
+        finally:
+            if status and metrics.enabled():
+                route = scope['path'] if scope['path'] in ROUTES else 'other'
+                HTTP_REQUESTS.labels(scope['method'], route, status[0]).inc()
+                HTTP_SECONDS.labels(route).observe(time.perf_counter() - started)
+
+    async def _lifespan(self, receive: Receive, send: Send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                try:
+                    await self.engine.warm()
+                except Exception as e:
+                    await send({'type': 'lifespan.startup.failed', 'message': str(e)})
+                    return
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.engine.close()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _route(self, scope: Scope, receive: Receive, send: Send):
+        method, path = scope['method'], scope['path']
+        query = scope.get('query_string', b'').decode('latin-1')
+        headers = {k.decode('latin-1').lower(): v.decode('latin-1') for k, v in scope.get('headers', [])}
+        content_type = headers.get('content-type', '').split(';', 1)[0].strip()
+        if 'x-tenant-id' in headers:
+            # Never answer a tenant request with the shared cipher keys.
+            await send_json(send, 400, {'error': 'tenants are served by the threaded server only'})
+        elif path in ADMIN_ROUTES and not admin_allowed(self.admin_token, headers.get('authorization'),
+                                                        (scope.get('client') or (None,))[0]):
+            await send_json(send, 403, {'error': 'admin token required' if self.admin_token
+                                        else 'admin routes are limited to loopback clients'})
+        elif method == 'POST' and path == '/process/batch':
+            await self._process_batch(receive, send, query, content_type in NDJSON_TYPES)
+        elif method == 'POST' and path == '/process':
+            if content_type == OCTET_STREAM:
+                await self._process_binary(receive, send, query)
+            else:
+                await self._process_json(receive, send)
+        elif method == 'POST' and path == '/reload':
+            await send_json(send, 200, await self.engine.reload())
+        elif method == 'GET' and path == '/health':
+            await send_json(send, 200, {'status': 'ok', 'engine': self.engine.shared_engine.info(),
+                                        'async': self.engine.stats()})
+        elif method == 'GET' and path == '/metrics' and metrics.enabled():
+            await send_body(send, 200, metrics.REGISTRY.render().encode('utf-8'),
+                            'text/plain; version=0.0.4; charset=utf-8')
+        else:
+            await send_json(send, 404, {'error': 'not found'})
+
+    async def _read_body(self, receive: Receive) -> bytearray:
+        body = bytearray()
+        async for chunk in iter_body(receive):
+            body += chunk
+            if len(body) > self.max_body_bytes:
+                raise BodyTooLarge(f'request body exceeds {self.max_body_bytes} bytes')
+        return body
+
+    async def _process_json(self, receive: Receive, send: Send):
+        try:
+            body = json.loads(await self._read_body(receive))
+            result = await self.engine.process_language(body.get('input', ''), body.get('options', {}))
+        except BodyTooLarge as e:
+            await send_json(send, 413, {'error': str(e)})
+            return
+        except Exception as e:
+            await send_json(send, 400, {'error': str(e)})
+            return
+        await send_json(send, 200, result)
+
+    async def _process_binary(self, receive: Receive, send: Send, query: str):
+        # encoding=raw encrypts the received buffer in place, as the threaded server does.
+        options = query_options(query)
+        try:
+            body = await self._read_body(receive)
+            in_place = body if options.get('encoding') == 'raw' else None
+            result = await self.engine.process_bytes(body, options, out=in_place)
+        except BodyTooLarge as e:
+            await send_json(send, 413, {'error': str(e)})
+            return
+        except Exception as e:
+            await send_json(send, 400, {'error': str(e)})
+            return
+        headers = [(b'x-detected-language', result['detected_language'].encode('latin-1')),
+                   (b'x-encoding', result['encoding'].encode('latin-1'))]
+        if 'protocol_encoding' in result:
+            headers.append((b'x-protocol-encoding', result['protocol_encoding'].encode('latin-1')))
+        await send_body(send, 200, result['output'], OCTET_STREAM, headers)
+
+    async def _process_batch(self, receive: Receive, send: Send, query: str, ndjson: bool):
+        options = query_options(query)
+        if ndjson:
+            records = iter_ndjson(receive)
+        else:
+            try:
+                body = json.loads(await self._read_body(receive))
+                if isinstance(body, dict):
+                    options.update(body.get('options') or {})
+                    body = body.get('inputs')
+                if not isinstance(body, list):
+                    raise ValueError('expected a JSON array or {"inputs": [...]}')
+            except BodyTooLarge as e:
+                await send_json(send, 413, {'error': str(e)})
+                return
+            except Exception as e:
+                await send_json(send, 400, {'error': str(e)})
+                return
+            records = _aiter([r if isinstance(r, (str, dict)) else
+                              BatchRecordError('record must be a string or an object') for r in body])
+
+        await send({'type': 'http.response.start', 'status': 200,
+                    'headers': [(b'content-type', b'application/x-ndjson' if ndjson else b'application/json')]})
+        # Same framing as the threaded server: input order, BATCH_FLUSH_ITEMS
+        # per chunk, bad records become in-place error entries.
+        separator = b'\n' if ndjson else b','
+        first = True
+        pending: List[Any] = []
+
+        async def flush(results: List[Any]):
+            nonlocal first
+            encoded = separator.join(json.dumps(r).encode('utf-8') for r in results)
+            if not encoded:
+                return
+            chunk = encoded + b'\n' if ndjson else (b'[' if first else b',') + encoded
+            first = False
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+
+        async for record in records:
+            if isinstance(record, BatchRecordError):
+                await flush(await self.engine.process_many(pending, options))
+                pending = []
+                await flush([{'error': str(record)}])
+                continue
+            pending.append(record)
+            if len(pending) >= BATCH_FLUSH_ITEMS:
+                await flush(await self.engine.process_many(pending, options))
+                pending = []
+        await flush(await self.engine.process_many(pending, options))
+        await send({'type': 'http.response.body', 'body': b'' if ndjson else (b'[]' if first else b']')})
+
+
+async def iter_body(receive: Receive) -> AsyncIterator[bytes]:
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            raise ConnectionResetError('client disconnected')
+        if message.get('body'):
+            yield message['body']
+        if not message.get('more_body'):
+            return
+
+
+async def iter_ndjson(receive: Receive) -> AsyncIterator[Any]:
+    buffered = b''
+    async for chunk in iter_body(receive):
+        buffered += chunk
+        *lines, buffered = buffered.split(b'\n')
+        for line in lines:
+            if line.strip():
+                yield parse_batch_record(line)
+    if buffered.strip():
+        yield parse_batch_record(buffered)
+
+
+async def _aiter(items: List[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
+async def send_body(send: Send, status: int, body: Any, content_type: str,
+                    headers: Optional[List[Tuple[bytes, bytes]]] = None):
+    await send({'type': 'http.response.start', 'status': status,
+                'headers': [(b'content-type', content_type.encode('latin-1')),
+                            (b'content-length', str(len(body)).encode('ascii'))] + (headers or [])})
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def send_json(send: Send, status: int, payload: Any):
+    await send_body(send, status, json.dumps(payload).encode('utf-8'), 'application/json')
+
+
+class _BadRequest(ValueError):
+    pass
+
+
+class AsyncHTTPServer:
+    def __init__(self, app: Callable, host: str = DEFAULT_HOST, port: int = 8080,
+                 backlog: int = DEFAULT_ASYNC_BACKLOG, keepalive_timeout: float = ASYNC_KEEPALIVE_TIMEOUT):
+        """
+        Minimal HTTP/1.1 server for an ASGI application.
+
+        Args:
+            app: ASGI 3 application
+            host: Bind address
+            port: Port, 0 for any free one (see .port after start())
+            backlog: Listen backlog; accepted connections are never queued behind threads
+            keepalive_timeout: Seconds an idle keep-alive connection is held open
+        """
+        self.app = app
+        self.host = host
+        self.port = port
+        self.backlog = backlog
+        self.keepalive_timeout = keepalive_timeout
+        self.connections = 0
+        self.peak_connections = 0
+        self.requests = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._lifespan: Optional[asyncio.Task] = None
+        self._lifespan_queue: Optional[asyncio.Queue] = None
+
+    async def start(self):
+        await self._startup()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port, backlog=self.backlog,
+                                                  limit=MAX_HEADER_BYTES)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self._shutdown()
+
+    def stats(self) -> Dict[str, Any]:
+        return {'connections': self.connections, 'peak_connections': self.peak_connections,
+                'requests': self.requests, 'backlog': self.backlog}
+
+    async def _startup(self):
+        # Lifespan is optional in ASGI; an app that raises on it just skips startup.
+        self._lifespan_queue = asyncio.Queue()
+        started: asyncio.Future = asyncio.get_running_loop().create_future()
+
+        async def send(message: Dict[str, Any]):
+            if message['type'] == 'lifespan.startup.failed':
+                started.set_exception(RuntimeError(message.get('message') or 'lifespan startup failed'))
+            elif message['type'] == 'lifespan.startup.complete':
+                started.set_result(None)
+
+        async def run():
+            try:
+                await self.app({'type': 'lifespan', 'asgi': {'version': '3.0'}}, self._lifespan_queue.get, send)
+            except Exception:
+                if not started.done():
+                    started.set_result(None)
+
+        self._lifespan = asyncio.ensure_future(run())
+        await self._lifespan_queue.put({'type': 'lifespan.startup'})
+        await started
+
+    async def _shutdown(self):
+        if self._lifespan is not None and not self._lifespan.done():
+            await self._lifespan_queue.put({'type': 'lifespan.shutdown'})
+            await self._lifespan
+        self._lifespan = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        self.peak_connections = max(self.peak_connections, self.connections)
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), self.keepalive_timeout)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, asyncio.LimitOverrunError,
+                        ConnectionError):
+                    return
+                try:
+                    scope, keep_alive, framing = self._parse_head(head, writer)
+                except _BadRequest as e:
+                    writer.write(_plain_response(400, str(e)))
+                    return
+                self.requests += 1
+                if not await self._run_request(scope, reader, writer, keep_alive, framing):
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    def _parse_head(self, head: bytes, writer: asyncio.StreamWriter) -> Tuple[Scope, bool, Tuple[str, int]]:
+        lines = head[:-4].split(b'\r\n')
+        try:
+            method, target, version = lines[0].decode('latin-1').split(' ')
+        except ValueError:
+            raise _BadRequest('malformed request line')
+        if version not in ('HTTP/1.1', 'HTTP/1.0'):
+            raise _BadRequest(f'unsupported version {version}')
+        headers = []
+        for line in lines[1:]:
+            name, sep, value = line.partition(b':')
+            if not sep:
+                raise _BadRequest('malformed header')
+            headers.append((name.strip().lower(), value.strip()))
+        fields = dict(headers)
+        connection = fields.get(b'connection', b'').lower()
+        keep_alive = connection != b'close' if version == 'HTTP/1.1' else connection == b'keep-alive'
+        if fields.get(b'transfer-encoding', b'').lower() == b'chunked':
+            framing = ('chunked', 0)
+        else:
+            try:
+                framing = ('length', int(fields.get(b'content-length', b'0')))
+            except ValueError:
+                raise _BadRequest('invalid Content-Length')
+            if framing[1] < 0:
+                raise _BadRequest('invalid Content-Length')
+        path, _, query = target.partition('?')
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': version[5:], 'method': method.upper(),
+            'scheme': 'http', 'path': path, 'raw_path': path.encode('latin-1'), 'root_path': '',
+            'query_string': query.encode('latin-1'), 'headers': headers,
+            'server': writer.get_extra_info('sockname')[:2], 'client': (writer.get_extra_info('peername') or ())[:2]
+        }
+        return scope, keep_alive, framing
+
+    async def _run_request(self, scope: Scope, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                           keep_alive: bool, framing: Tuple[str, int]) -> bool:
+        # Returns whether the connection can serve another request.
+        mode, remaining = framing
+        body_done = False
+        response: Dict[str, Any] = {'started': False, 'chunked': False, 'done': False, 'pending': None}
+        http10 = scope['http_version'] == '1.0'
+
+        async def receive() -> Dict[str, Any]:
+            nonlocal body_done, remaining
+            if body_done:
+                return {'type': 'http.disconnect'}
+            if mode == 'chunked':
+                size_line = await reader.readline()
+                size = int(size_line.split(b';', 1)[0].strip() or b'0', 16)
+                if size == 0:
+                    while await reader.readline() not in (b'\r\n', b'\n', b''):
+                        pass
+                    body_done = True
+                    return {'type': 'http.request', 'body': b'', 'more_body': False}
+                chunk = await reader.readexactly(size)
+                await reader.readline()
+                return {'type': 'http.request', 'body': chunk, 'more_body': True}
+            if remaining == 0:
+                body_done = True
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+            chunk = await reader.read(min(remaining, READ_CHUNK_BYTES))
+            if not chunk:
+                raise ConnectionResetError('client closed mid-body')
+            remaining -= len(chunk)
+            body_done = remaining == 0
+            return {'type': 'http.request', 'body': chunk, 'more_body': not body_done}
+
+        async def send(message: Dict[str, Any]):
+            nonlocal keep_alive
+            if message['type'] == 'http.response.start':
+                response['started'] = True
+                response['pending'] = message
+                return
+            if message['type'] != 'http.response.body' or response['done']:
+                return
+            body = bytes(message.get('body', b''))
+            more = message.get('more_body', False)
+            out = b''
+            start = response.pop('pending', None)
+            if start is not None:
+                headers = list(start.get('headers', []))
+                names = {bytes(k).lower() for k, _ in headers}
+                if b'content-length' not in names:
+                    if not more:
+                        headers.append((b'content-length', str(len(body)).encode('ascii')))
+                    elif http10:
+                        keep_alive = False
+                    else:
+                        response['chunked'] = True
+                        headers.append((b'transfer-encoding', b'chunked'))
+                headers.append((b'connection', b'keep-alive' if keep_alive else b'close'))
+                out = _status_line(start['status']) + b''.join(
+                    bytes(k) + b': ' + bytes(v) + b'\r\n' for k, v in headers) + b'\r\n'
+            if response['chunked']:
+                if body:
+                    out += b'%x\r\n%s\r\n' % (len(body), body)
+                if not more:
+                    out += b'0\r\n\r\n'
+            else:
+                out += body
+            response['done'] = not more
+            writer.write(out)
+            # Backpressure: a slow reader suspends this coroutine, not a thread.
+            await writer.drain()
+
+        try:
+            await self.app(scope, receive, send)
+        except Exception:
+            if not response['started']:
+                writer.write(_plain_response(500, 'internal server error'))
+            return False
+        if not response['done']:
+            return False
+        if not body_done:
+            # Skip an unread body so the next request starts in sync; chunked
+            # bodies are not worth draining, just close.
+            if mode == 'chunked' or remaining > MAX_BODY_BYTES:
+                return False
+            try:
+                await reader.readexactly(remaining)
+            except asyncio.IncompleteReadError:
+                return False
+        return keep_alive
+
+
+def _status_line(status: int) -> bytes:
+    return f'HTTP/1.1 {status} {_REASONS.get(status, "")}\r\n'.encode('latin-1')
+
+
+def _plain_response(status: int, text: str) -> bytes:
+    body = json.dumps({'error': text}).encode('utf-8')
+    return (_status_line(status) + b'Content-Type: application/json\r\nConnection: close\r\n'
+            b'Content-Length: ' + str(len(body)).encode('ascii') + b'\r\n\r\n' + body)
+
+
+def make_app(workers: int = DEFAULT_EXECUTOR_WORKERS, result_cache: Optional[ResultCache] = None,
+             admin_token: Optional[str] = None) -> EngineASGIApp:
+    shared = SharedEngine(lambda: AdvancedLanguageEngine(result_cache=result_cache))
+    return EngineASGIApp(AsyncLanguageEngine(shared, max_workers=workers), admin_token=admin_token)
+
+
+async def _serve(app: EngineASGIApp, host: str, port: int, backlog: int):
+    server = AsyncHTTPServer(app, host, port, backlog)
+    await server.start()
+    loop = asyncio.get_running_loop()
+    stop = loop.create_future()
+    if hasattr(signal, 'SIGHUP'):
+        loop.add_signal_handler(signal.SIGHUP, lambda: asyncio.ensure_future(app.engine.reload()))
+    try:
+        loop.add_signal_handler(signal.SIGTERM, lambda: stop.done() or stop.set_result(None))
+    except NotImplementedError:
+        pass
+    info = app.engine.shared_engine.info()
+    print(f"[Seraphina AGI] Engine {info['version']} warmed in {info['load_ms']} ms ({info['cipher_count']} ciphers)")
+    print(f'[Seraphina AGI] asyncio HTTP API listening on {host}:{server.port} '
+          f'({app.engine.max_workers} executor threads, backlog {backlog}; POST /process, POST /process/batch, '
+          f'POST /reload, GET /health, GET /metrics)')
+    try:
+        await stop
+    finally:
+        await server.close()
+
+
+def serve(port: int = 8080, host: str = DEFAULT_HOST, workers: int = DEFAULT_EXECUTOR_WORKERS,
+          backlog: int = DEFAULT_ASYNC_BACKLOG, result_cache: Optional[ResultCache] = None,
+          admin_token: Optional[str] = None):
+    app = make_app(workers, result_cache, admin_token)
+    try:
+        asyncio.run(_serve(app, host, port, backlog))
+    except KeyboardInterrupt:
+        pass
+
+
+_app: Optional[EngineASGIApp] = None
+_app_lock = threading.Lock()
+
+
+def __getattr__(name: str) -> Any:
+    # For external ASGI servers: uvicorn seraphina_agi.asgi:app. The app, its
+    # executor and admin token are created on first access rather than at
+    # import; the engine itself is built on lifespan startup or the first request.
+    if name == 'app':
+        global _app
+        with _app_lock:
+            if _app is None:
+                _app = make_app()
+        return _app
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,103 @@
+"""
+asyncio facade for the language engine.
+Small inputs are processed inline on the event loop, where a thread hop
+would cost more than the work itself; larger ones are offloaded to a thread
+pool (or the caller's executor) so the loop keeps serving other tasks.
+"""
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .advanced_language_engine import AdvancedLanguageEngine
+from .octabit_cipher import BytesLike
+from .shared_engine import SharedEngine
+
+# Inputs up to this many characters (bytes for process_bytes) run inline.
+INLINE_MAX_CHARS = 2048
+DEFAULT_EXECUTOR_WORKERS = 4
+
+
+class AsyncLanguageEngine:
+    def __init__(self, engine: Union[AdvancedLanguageEngine, SharedEngine, None] = None,
+                 executor: Optional[Executor] = None, inline_max_chars: int = INLINE_MAX_CHARS,
+                 max_workers: int = DEFAULT_EXECUTOR_WORKERS):
+        """
+        Non-blocking wrapper around one shared engine.
+
+        Args:
+            engine: Engine to wrap, or a SharedEngine so reload() is picked up;
+                default builds an AdvancedLanguageEngine on first use
+            executor: Where large inputs run; default a private thread pool
+            inline_max_chars: Largest input processed directly on the loop
+            max_workers: Threads in the private pool
+        """
+        if isinstance(engine, SharedEngine):
+            self.shared_engine = engine
+        elif engine is not None:
+            self.shared_engine = SharedEngine(lambda: engine)
+        else:
+            self.shared_engine = SharedEngine()
+        self.inline_max_chars = inline_max_chars
+        self._own_executor = executor is None
+        self.max_workers = max_workers if executor is None else getattr(executor, '_max_workers', None)
+        self._executor = executor or ThreadPoolExecutor(max_workers, thread_name_prefix='seraphina-async')
+        self.inline_calls = 0
+        self.offloaded_calls = 0
+
+    @property
+    def engine(self) -> AdvancedLanguageEngine:
+        return self.shared_engine.get()
+
+    async def warm(self) -> Dict[str, Any]:
+        # Building the engine takes a while; keep it off the loop.
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.shared_engine.warm)
+
+    async def reload(self) -> Dict[str, Any]:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.shared_engine.reload)
+
+    async def process_language(self, input_text: str, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return await self._call(len(input_text), 'process_language', input_text, options)
+
+    async def process_bytes(self, data: BytesLike, options: Optional[Dict[str, Any]] = None,
+                            out: Optional[bytearray] = None) -> Dict[str, Any]:
+        return await self._call(memoryview(data).nbytes, 'process_bytes', data, options, out)
+
+    async def process_many(self, texts: Iterable[Union[str, Dict[str, Any]]],
+                           options: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        texts = list(texts)
+        size = sum(len(t) if isinstance(t, str) else len(str(t.get('input', ''))) for t in texts)
+        return await self._call(size, '_process_list', texts, options)
+
+    def _process_list(self, texts: List[Any], options: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return list(self.engine.process_many(texts, options))
+
+    async def _call(self, size: int, method: str, *args):
+        if self._engine_ready() and size <= self.inline_max_chars:
+            self.inline_calls += 1
+            return self._bound(method)(*args)
+        self.offloaded_calls += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: self._bound(method)(*args))
+
+    def _bound(self, method: str):
+        return getattr(self, method) if method.startswith('_') else getattr(self.engine, method)
+
+    def _engine_ready(self) -> bool:
+        # Until the first build finishes even a small call would block the loop.
+        return self.shared_engine.generation > 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {'inline_calls': self.inline_calls, 'offloaded_calls': self.offloaded_calls,
+                'inline_max_chars': self.inline_max_chars}
+
+    def close(self):
+        if self._own_executor:
+            self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> 'AsyncLanguageEngine':
+        await self.warm()
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
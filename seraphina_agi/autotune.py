@@ -0,0 +1,435 @@
+"""
+Autotuner for deployment settings.
+Replays a workload (a recorded request log, or a generated sample) and sweeps
+one knob at a time: HTTP worker threads and result-cache size for serve,
+records per worker-process task for process/serve --processes, and the block
+size of encrypt/decrypt streaming. Each knob keeps the value with the best
+throughput whose latency (serve p99, or the longest wait between process
+results) meets the target; values within NOISE_PCT of the best count as ties
+and the current value, then the cheaper one, wins. The chosen settings are
+measured again in the same run, alternating with the settings in effect now
+(the saved file, or the built-in defaults), and are only written if none of
+their metrics is worse than the current settings' by more than the
+threshold.
+
+The settings file is JSON; serve, process, encrypt and decrypt read its
+"settings" section at startup, and command-line flags override it:
+
+    {"settings": {"serve": {"workers": 8, "cache_mb": 16},
+                  "process": {"batch_size": 32},
+                  "stream": {"chunk_size": 196608}}, ...}
+"""
+
+import io
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .cipher_cache import default_cache_dir
+
+FORMAT_VERSION = 1
+TUNING_ENV = 'SERAPHINA_TUNING'
+TUNING_FILE = 'tuning.json'
+AREAS = ('serve', 'process', 'stream')
+
+DEFAULT_LATENCY_MS = 50.0
+DEFAULT_THRESHOLD_PCT = 10.0
+# Throughputs within this percentage of the best are treated as equal.
+NOISE_PCT = 5.0
+
+# Candidates per knob, cheapest first: fewer threads, less memory, smaller batches.
+WORKER_CANDIDATES = (2, 4, 8, 16, 32)
+CACHE_MB_CANDIDATES = (0, 4, 16, 64)
+BATCH_CANDIDATES = (8, 32, 128, 512)
+CHUNK_CANDIDATES = (64 * 1024, 3 * 64 * 1024, 1024 * 1024, 4 * 1024 * 1024)
+
+Record = Union[str, Dict[str, Any]]
+Settings = Dict[str, Dict[str, Any]]
+Metric = Dict[str, Any]
+
+
+def default_tuning_path() -> Optional[str]:
+    """$SERAPHINA_TUNING, else tuning.json in the cache directory; None when set to 0/off or caching is off."""
+    value = os.environ.get(TUNING_ENV, '')
+    if value.lower() in ('0', 'off', 'false', 'no'):
+        return None
+    if value:
+        return value
+    cache_dir = default_cache_dir()
+    return os.path.join(cache_dir, TUNING_FILE) if cache_dir else None
+
+
+def default_settings() -> Settings:
+    from .octabit_cipher import STREAM_CHUNK_BYTES
+    from .server import DEFAULT_WORKERS
+    from .worker_pool import MAP_CHUNK_ITEMS
+    return {
+        'serve': {'workers': DEFAULT_WORKERS, 'cache_mb': 0},
+        'process': {'batch_size': MAP_CHUNK_ITEMS},
+        'stream': {'chunk_size': STREAM_CHUNK_BYTES}
+    }
+
+
+def load(path: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Read a settings file written by optimize().
+
+    Returns:
+        The parsed file, or None if path is None or does not exist
+
+    Raises:
+        ValueError: The file is not a settings file
+    """
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        try:
+            data = json.load(f)
+        except ValueError as e:
+            raise ValueError(f'{path}: {e}') from None
+    if not isinstance(data, dict) or not isinstance(data.get('settings'), dict):
+        raise ValueError(f'{path}: not a tuning file (no "settings" object)')
+    if data.get('format') != FORMAT_VERSION:
+        raise ValueError(f'{path}: unsupported tuning format {data.get("format")!r}')
+    return data
+
+
+def load_settings(path: Optional[str]) -> Settings:
+    """The "settings" section of a tuning file, or {} without one."""
+    data = load(path)
+    return data['settings'] if data else {}
+
+
+def sample_workload(count: int = 2000) -> List[Record]:
+    # A /process-like log: repeated greetings and templates plus unique messages.
+    from .workload import request_log
+    return [text if options is None else {'input': text, 'options': options}
+            for text, options in request_log(count)]
+
+
+def _split(record: Record) -> Tuple[str, Dict[str, Any]]:
+    if isinstance(record, str):
+        return record, {}
+    return record.get('input', ''), record.get('options') or {}
+
+
+def measure_serve(records: Sequence[Record], workers: int, cache_mb: float, clients: int = 16,
+                  requests: int = 100) -> Dict[str, Any]:
+    """Replay records against an in-process server: req/s, p50/p99 latency and 503s."""
+    from . import load_generator
+    from .result_cache import DEFAULT_MAX_ENTRIES, ResultCache
+    bodies = []
+    for record in records:
+        text, options = _split(record)
+        bodies.append(json.dumps({'input': text, 'options': options}).encode('utf-8'))
+    cache = ResultCache(DEFAULT_MAX_ENTRIES, int(cache_mb * 1024 * 1024)) if cache_mb else None
+    result = load_generator.run(clients=clients, requests=requests, workers=workers, backlog=max(64, clients),
+                          bodies=bodies, result_cache=cache)
+    return {'req_per_s': result['req_per_s'], 'p50_ms': result['p50_ms'], 'p99_ms': result['p99_ms'],
+            'busy': result['busy'], 'failed': result['failed']}
+
+
+def measure_process(pool, records: Sequence[Record], batch_size: int, total: int = 8000) -> Dict[str, Any]:
+    """Records/s through a ProcessEnginePool at one batch size, and the longest wait between two results."""
+    items = [records[i % len(records)] for i in range(total)]
+    stall = 0.0
+    start = last = time.perf_counter()
+    for _ in pool.map(items, chunk_items=batch_size):
+        now = time.perf_counter()
+        stall = max(stall, now - last)
+        last = now
+    return {'records_per_s': round(total / (last - start), 1), 'max_stall_ms': round(stall * 1000, 3)}
+
+
+def measure_stream(engine, data: bytes, chunk_size: int, min_time: float = 0.25) -> Dict[str, Any]:
+    """encrypt_stream MB/s from memory to /dev/null at one block size, over at least min_time seconds."""
+    done = 0
+    with open(os.devnull, 'wb') as sink:
+        start = time.perf_counter()
+        while True:
+            engine.encrypt_stream(io.BytesIO(data), sink, 'en-US', chunk_size)
+            done += len(data)
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+    return {'mb_per_s': round(done / elapsed / 1e6, 1)}
+
+
+def _best_of(rounds: int, measure: Callable[[], Dict[str, Any]], key: str) -> Dict[str, Any]:
+    return max((measure() for _ in range(rounds)), key=lambda m: m[key])
+
+
+def pick(trials: List[Dict[str, Any]], key: str, latency_ms: Optional[float] = None,
+         latency_key: str = 'p99_ms', current: Any = None) -> Dict[str, Any]:
+    """
+    Choose among trials listed cheapest first.
+
+    Keeps trials whose latency_key meets latency_ms (all of them when none
+    does, then the lowest latency wins). Of those within NOISE_PCT of the
+    best key, the current value is kept if present, else the cheapest wins.
+    """
+    within = [t for t in trials if latency_ms is None or t[latency_key] <= latency_ms]
+    if not within:
+        return min(trials, key=lambda t: t[latency_key])
+    best = max(t[key] for t in within)
+    ties = [t for t in within if t[key] >= best * (1 - NOISE_PCT / 100)]
+    return next((t for t in ties if t['value'] == current), ties[0])
+
+
+def _metric(value: float, unit: str, better: str) -> Metric:
+    return {'value': value, 'unit': unit, 'better': better}
+
+
+class Tuner:
+    def __init__(self, records: Sequence[Record], latency_ms: float = DEFAULT_LATENCY_MS, processes: int = 2,
+                 clients: int = 16, quick: bool = False, log: Callable[[str], None] = None):
+        """
+        Measures settings on one workload.
+
+        Args:
+            records: Workload, in process_many's item format (text or {'input', 'options'})
+            latency_ms: Target for serve p99 latency and the longest wait between process results
+            processes: Worker processes for the batch-size sweep
+            clients: Concurrent HTTP clients for the serve sweeps
+            quick: Fewer requests and one round per measurement
+            log: Progress callback (default: silent)
+        """
+        self.records = list(records)
+        if not self.records:
+            raise ValueError('empty workload')
+        self.latency_ms = latency_ms
+        self.processes = max(processes, 1)
+        self.clients = clients
+        self.rounds = 1 if quick else 2
+        self.requests = 40 if quick else 150
+        self.process_total = 2000 if quick else 8000
+        self.stream_bytes = 8 * 1024 * 1024
+        self.stream_seconds = 0.1 if quick else 0.25
+        self.log = log or (lambda message: None)
+        self._pool = None
+        self._engine = None
+        self._stream_data = None
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def __enter__(self) -> 'Tuner':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _process_pool(self):
+        if self._pool is None:
+            from .worker_pool import ProcessEnginePool
+            self._pool = ProcessEnginePool(self.processes, cache_dir=default_cache_dir())
+        return self._pool
+
+    def _stream_setup(self):
+        if self._engine is None:
+            from .advanced_language_engine import AdvancedLanguageEngine
+            self._engine = AdvancedLanguageEngine(cache_dir=default_cache_dir())
+            sample = '\n'.join(_split(r)[0] for r in self.records).encode('utf-8') or b'\0'
+            self._stream_data = (sample * (self.stream_bytes // len(sample) + 1))[:self.stream_bytes]
+        return self._engine, self._stream_data
+
+    def serve(self, workers: int, cache_mb: float) -> Dict[str, Any]:
+        return _best_of(self.rounds, lambda: measure_serve(self.records, workers, cache_mb, self.clients,
+                                                           self.requests), 'req_per_s')
+
+    def process(self, batch_size: int) -> Dict[str, Any]:
+        pool = self._process_pool()
+        return _best_of(self.rounds, lambda: measure_process(pool, self.records, batch_size, self.process_total),
+                        'records_per_s')
+
+    def stream(self, chunk_size: int) -> Dict[str, Any]:
+        engine, data = self._stream_setup()
+        return _best_of(self.rounds + 1, lambda: measure_stream(engine, data, chunk_size, self.stream_seconds),
+                        'mb_per_s')
+
+    def _sweep(self, name: str, candidates: Sequence[Any], current: Any, measure: Callable[[Any], Dict[str, Any]],
+               key: str, latency_key: Optional[str] = 'p99_ms') -> Tuple[Any, List[Dict[str, Any]]]:
+        trials = []
+        for value in sorted(set(candidates) | {current}):
+            trial = {'value': value, **measure(value)}
+            self.log(f'{name}={value}: ' + ', '.join(f'{k} {v}' for k, v in trial.items() if k != 'value'))
+            trials.append(trial)
+        return pick(trials, key, self.latency_ms if latency_key else None, latency_key or 'p99_ms',
+                    current)['value'], trials
+
+    def sweep(self, areas: Sequence[str] = AREAS, start: Optional[Settings] = None) -> Tuple[Settings, Dict]:
+        """
+        Tune each area one knob at a time, starting from start (default: built-in defaults).
+
+        Returns:
+            (settings, {'<area>.<knob>': [trial, ...]})
+        """
+        settings = {area: dict(values) for area, values in (start or default_settings()).items()}
+        sweeps = {}
+        if 'serve' in areas:
+            # Discarded warm-up: the first server run pays first-use costs the others do not.
+            self.serve(settings['serve']['workers'], 0)
+            serve = settings['serve']
+            serve['workers'], sweeps['serve.workers'] = self._sweep(
+                'serve.workers', WORKER_CANDIDATES, serve['workers'], lambda w: self.serve(w, 0), 'req_per_s')
+            serve['cache_mb'], sweeps['serve.cache_mb'] = self._sweep(
+                'serve.cache_mb', CACHE_MB_CANDIDATES, serve['cache_mb'],
+                lambda mb: self.serve(serve['workers'], mb), 'req_per_s')
+        if 'process' in areas:
+            process = settings['process']
+            process['batch_size'], sweeps['process.batch_size'] = self._sweep(
+                'process.batch_size', BATCH_CANDIDATES, process['batch_size'], self.process, 'records_per_s',
+                'max_stall_ms')
+        if 'stream' in areas:
+            stream = settings['stream']
+            stream['chunk_size'], sweeps['stream.chunk_size'] = self._sweep(
+                'stream.chunk_size', CHUNK_CANDIDATES, stream['chunk_size'], self.stream, 'mb_per_s',
+                latency_key=None)
+        return settings, sweeps
+
+    def measure(self, settings: Settings, areas: Sequence[str] = AREAS) -> Dict[str, Metric]:
+        """Suite-style metrics ({name: {'value', 'unit', 'better'}}) for one set of settings."""
+        results = {}
+        if 'serve' in areas:
+            serve = self.serve(settings['serve']['workers'], settings['serve']['cache_mb'])
+            results['serve.req_per_s'] = _metric(serve['req_per_s'], 'req/s', 'higher')
+            results['serve.p99_ms'] = _metric(serve['p99_ms'], 'ms', 'lower')
+        if 'process' in areas:
+            process = self.process(settings['process']['batch_size'])
+            results['process.records_per_s'] = _metric(process['records_per_s'], 'records/s', 'higher')
+        if 'stream' in areas:
+            stream = self.stream(settings['stream']['chunk_size'])
+            results['stream.mb_per_s'] = _metric(stream['mb_per_s'], 'MB/s', 'higher')
+        return results
+
+
+def _keep_best(best: Dict[str, Metric], results: Dict[str, Metric]):
+    for name, metric in results.items():
+        kept = best.get(name)
+        better = max if metric['better'] == 'higher' else min
+        if kept is None or better(kept['value'], metric['value']) == metric['value']:
+            best[name] = metric
+
+
+def _merge(base: Settings, update: Settings) -> Settings:
+    merged = {area: dict(values) for area, values in base.items()}
+    for area, values in update.items():
+        merged.setdefault(area, {}).update(values)
+    return merged
+
+
+def optimize(records: Optional[Sequence[Record]] = None, path: Optional[str] = None,
+             areas: Optional[Sequence[str]] = None, latency_ms: float = DEFAULT_LATENCY_MS,
+             threshold_pct: float = DEFAULT_THRESHOLD_PCT, processes: int = 2, force: bool = False,
+             quick: bool = False, source: str = 'sample', quiet: bool = False) -> int:
+    """
+    Tune settings on a workload and write them to path.
+
+    Args:
+        records: Workload (default: a generated request log)
+        path: Settings file to compare against and write (default: default_tuning_path())
+        areas: Subset of AREAS to tune; the others keep their current settings
+        latency_ms: Target for serve p99 latency and the longest wait between process results
+        threshold_pct: A metric on which the tuned settings measure worse than
+            the current settings, in the same run, by more than this percentage
+            blocks the write
+        processes: Worker processes for the batch-size sweep
+        force: Write even when a metric measured worse than with the current settings
+        quick: Shorter measurements, for smoke runs
+        source: Workload description stored in the file
+        quiet: No progress lines on stderr
+
+    Returns:
+        Process exit code: 1 if the tuned settings measured worse than the
+        current ones (and were not written), 2 for an unusable settings file,
+        workload or area, else 0
+    """
+    from .perf_report import compare, environment, format_report
+    unknown = [a for a in areas or () if a not in AREAS]
+    if unknown:
+        print(f'Error: unknown optimize area(s): {", ".join(unknown)} (choose from {", ".join(AREAS)})',
+              file=sys.stderr)
+        return 2
+    areas = [a for a in AREAS if a in (areas or AREAS)]
+    path = path or default_tuning_path()
+    if not path:
+        print(f'Error: no settings file (caching is off); pass --config PATH or set {TUNING_ENV}', file=sys.stderr)
+        return 2
+    try:
+        saved = load(path)
+    except (OSError, ValueError) as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 2
+    current = _merge(default_settings(), saved['settings'] if saved else {})
+    records = list(records) if records is not None else sample_workload()
+    if not records:
+        print('Error: the workload has no records', file=sys.stderr)
+        return 2
+
+    def log(message):
+        if not quiet:
+            print(f'[Seraphina AGI] {message}', file=sys.stderr, flush=True)
+
+    started = time.perf_counter()
+    with Tuner(records, latency_ms, processes, quick=quick, log=log) as tuner:
+        tuned, sweeps = tuner.sweep(areas, current)
+        log('measuring current settings against tuned settings')
+        baseline, results = {}, {}
+        # Alternate, best of two each, so drift in machine load hits both alike.
+        for _ in range(2):
+            _keep_best(baseline, tuner.measure(current, areas))
+            _keep_best(results, tuner.measure(tuned, areas))
+
+    # Side by side with the current settings, not against results saved by an
+    # earlier run: those were measured under another machine load.
+    report = {'results': results, 'comparison': compare({'results': results}, {'results': baseline}, threshold_pct)}
+    comparison = report['comparison']
+    # An area whose settings did not change can only be worse by noise; a
+    # p99 that meets the target does not count, and neither does throughput
+    # given up to bring a p99 that missed the target within it.
+    unchanged = {a for a in areas if tuned[a] == current[a]}
+    met_target = 'serve.p99_ms' in results and results['serve.p99_ms']['value'] <= latency_ms
+    fixed_latency = met_target and baseline['serve.p99_ms']['value'] > latency_ms
+    comparison['regressions'] = [
+        name for name in comparison['regressions']
+        if name.split('.', 1)[0] not in unchanged
+        and not (name == 'serve.p99_ms' and met_target)
+        and not (name == 'serve.req_per_s' and fixed_latency)
+    ]
+    for area in areas:
+        changes = ', '.join(f'{k} {current[area].get(k)} -> {v}' for k, v in tuned[area].items()
+                            if current[area].get(k) != v)
+        print(f"{area:<8} {changes or 'unchanged'}")
+    print(format_report(report, 'WORSE', 'metric(s) worse than the current settings'))
+
+    if comparison['regressions'] and not force:
+        print(f'Error: tuned settings measured worse than the current settings on '
+              f'{", ".join(comparison["regressions"])}; {path} not written (--force writes anyway)', file=sys.stderr)
+        return 1
+    document = {
+        'format': FORMAT_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'environment': environment(),
+        'workload': {'source': source, 'records': len(records)},
+        'latency_target_ms': latency_ms,
+        'tuning_seconds': round(time.perf_counter() - started, 1),
+        'settings': tuned,
+        'results': results,
+        'baseline': {'settings': current, 'results': baseline},
+        'vs_current': comparison,
+        'sweeps': sweeps
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp = f'{path}.tmp{os.getpid()}'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2)
+        f.write('\n')
+    os.replace(tmp, path)
+    print(f'[Seraphina AGI] wrote tuned settings to {path}')
+    return 0
@@ -0,0 +1,5 @@
+"""
+Benchmarks for Seraphina AGI Companion.
+Each module exposes run(...) returning a JSON-serialisable dict and a main()
+so it can be invoked as `python -m seraphina_agi.benchmarks.<name>`.
+"""
@@ -0,0 +1,121 @@
+"""
+Octabit archive vs a JSON file of encrypted tokens.
+Writes the same N encrypted records both ways: a JSON array of
+{"language", "encrypted_input"} objects (base64 tokens, the current
+practice) and an octabit archive of raw XORed bytes. Reports file sizes,
+write time, the cold cost of fetching one record (open + parse / open + map,
+then decrypt), warm per-lookup latency for random ids, and full-scan
+decrypt throughput.
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from typing import Any, Dict
+
+from ..advanced_language_engine import AdvancedLanguageEngine
+from ..octabit_archive import ArchiveReader, ArchiveWriter
+from ..octabit_cipher import decrypt_bytes
+
+LANGUAGES = ['en-US', 'es-ES', 'fr-FR', 'de-DE', 'it-IT', 'pt-BR']
+
+
+def _us(seconds: float, count: int = 1) -> float:
+    return round(seconds / count * 1e6, 2)
+
+
+def run(records: int = 200_000, lookups: int = 10_000, text_bytes: int = 120) -> Dict[str, Any]:
+    engine = AdvancedLanguageEngine()
+    ciphers = engine.octabit_encryption['frequency_cipher']
+    rng = random.Random(42)
+    base = 'The quick brown fox jumps over the lazy dog. ' * (text_bytes // 45 + 1)
+    texts = [f'{i}: {base[:text_bytes]}' for i in range(records)]
+    langs = [LANGUAGES[i % len(LANGUAGES)] for i in range(records)]
+    ids = [rng.randrange(records) for _ in range(lookups)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, 'records.json')
+        archive_path = os.path.join(tmp, 'records.soa')
+
+        start = time.perf_counter()
+        rows = [{'language': lang, 'encrypted_input': engine.encrypt_with_octabit(text, lang)}
+                for text, lang in zip(texts, langs)]
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(rows, f)
+        json_write_s = time.perf_counter() - start
+        del rows
+
+        start = time.perf_counter()
+        with ArchiveWriter(archive_path, engine, append=False) as writer:
+            for text, lang in zip(texts, langs):
+                writer.append(text, lang)
+        archive_write_s = time.perf_counter() - start
+
+        target = ids[0]
+        start = time.perf_counter()
+        with open(json_path, encoding='utf-8') as f:
+            rows = json.load(f)
+        row = rows[target]
+        json_value = decrypt_bytes(row['encrypted_input'], ciphers[row['language']]['encryption_key'])
+        json_cold_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ArchiveReader(archive_path, engine) as archive:
+            archive_value = archive.get(target)
+        archive_cold_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in ids:
+            row = rows[i]
+            decrypt_bytes(row['encrypted_input'], ciphers[row['language']]['encryption_key'])
+        json_warm_s = time.perf_counter() - start
+
+        with ArchiveReader(archive_path, engine) as archive:
+            start = time.perf_counter()
+            for i in ids:
+                archive.get(i)
+            archive_warm_s = time.perf_counter() - start
+            identical = all(archive.get(i) == texts[i].encode('utf-8') for i in ids[:1000])
+
+            start = time.perf_counter()
+            for _ in archive.records():
+                pass
+            archive_scan_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for row in rows:
+            decrypt_bytes(row['encrypted_input'], ciphers[row['language']]['encryption_key'])
+        json_scan_s = time.perf_counter() - start
+
+        json_size = os.path.getsize(json_path)
+        archive_size = os.path.getsize(archive_path)
+
+    return {
+        'benchmark': 'archive',
+        'records': records,
+        'plaintext_bytes': sum(len(t.encode('utf-8')) for t in texts),
+        'identical_output': identical and json_value == archive_value,
+        'json': {'bytes': json_size, 'write_s': round(json_write_s, 3), 'cold_lookup_ms': round(json_cold_s * 1000, 2),
+                 'warm_lookup_us': _us(json_warm_s, lookups), 'scan_records_per_s': round(records / json_scan_s)},
+        'archive': {'bytes': archive_size, 'write_s': round(archive_write_s, 3),
+                    'cold_lookup_ms': round(archive_cold_s * 1000, 2), 'warm_lookup_us': _us(archive_warm_s, lookups),
+                    'scan_records_per_s': round(records / archive_scan_s)},
+        'size_ratio': round(json_size / archive_size, 2),
+        'cold_lookup_speedup': round(json_cold_s / archive_cold_s)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Octabit archive vs JSON tokens: size and lookup latency')
+    parser.add_argument('--records', type=int, default=200_000)
+    parser.add_argument('--lookups', type=int, default=10_000)
+    parser.add_argument('--text-bytes', type=int, default=120, help='Approximate plaintext size per record')
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.records, args.lookups, args.text_bytes), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+"""
+Many simultaneous keep-alive clients: threaded server vs asyncio server.
+An asyncio client opens N connections at once and sends one small
+POST /process on each, keeps every connection open and idle for a moment,
+then sends a second request on all of them together. Reports per round the
+responses that succeeded, were refused with 503 or failed, latency
+percentiles and requests/s, plus the server's threads while clients sit
+idle. The threaded server runs with its defaults (8 workers, backlog 64);
+the asyncio server with its executor defaults.
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..asgi import AsyncHTTPServer, make_app
+from ..server import QuietRequestHandler, make_server
+
+REQUEST_TIMEOUT = 15.0
+
+
+def _request_bytes(port: int, text: str) -> bytes:
+    body = json.dumps({'input': text, 'options': {'source_language': 'en-US'}}).encode('utf-8')
+    return (f'POST /process HTTP/1.1\r\nHost: localhost:{port}\r\nContent-Type: application/json\r\n'
+            f'Content-Length: {len(body)}\r\n\r\n').encode('ascii') + body
+
+
+async def _exchange(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, request: bytes) -> int:
+    writer.write(request)
+    await writer.drain()
+    head = await reader.readuntil(b'\r\n\r\n')
+    status = int(head.split(b' ', 2)[1])
+    length = 0
+    for line in head.split(b'\r\n')[1:]:
+        name, _, value = line.partition(b':')
+        if name.strip().lower() == b'content-length':
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+class _Client:
+    def __init__(self, port: int):
+        self.port = port
+        self.request = _request_bytes(port, 'Hello world, how are you today?')
+        self.streams: Optional[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = None
+
+    async def call(self) -> Tuple[str, float]:
+        start = time.perf_counter()
+        try:
+            if self.streams is None:
+                self.streams = await asyncio.open_connection('localhost', self.port)
+            status = await asyncio.wait_for(_exchange(*self.streams, self.request), REQUEST_TIMEOUT)
+        except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError, ValueError):
+            self.close()
+            return 'error', time.perf_counter() - start
+        if status != 200:
+            # The threaded server closes after a 503.
+            self.close()
+        return ('ok' if status == 200 else 'busy' if status == 503 else 'error'), time.perf_counter() - start
+
+    def close(self):
+        if self.streams is not None:
+            self.streams[1].close()
+            self.streams = None
+
+
+def _summary(results: List[Tuple[str, float]], seconds: float) -> Dict[str, Any]:
+    latencies = sorted(elapsed for outcome, elapsed in results if outcome == 'ok')
+
+    def pct(p: float) -> Optional[float]:
+        return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000, 2) if latencies else None
+
+    ok = len(latencies)
+    return {'ok': ok, 'busy_503': sum(1 for o, _ in results if o == 'busy'),
+            'errors': sum(1 for o, _ in results if o == 'error'), 'p50_ms': pct(0.5), 'p99_ms': pct(0.99),
+            'ok_per_s': round(ok / seconds) if seconds else None}
+
+
+async def _rounds(port: int, connections: int, idle: float) -> Dict[str, Any]:
+    clients = [_Client(port) for _ in range(connections)]
+    report = {}
+    for name in ('connect', 'keepalive'):
+        start = time.perf_counter()
+        results = await asyncio.gather(*(c.call() for c in clients))
+        report[name] = _summary(results, time.perf_counter() - start)
+        if name == 'connect':
+            report['server_threads_while_idle'] = sum(t.name.startswith('seraphina') for t in threading.enumerate())
+            await asyncio.sleep(idle)
+    report['open_connections_after'] = sum(1 for c in clients if c.streams is not None)
+    for c in clients:
+        c.close()
+    return report
+
+
+def _raise_fd_limit(needed: int):
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != resource.RLIM_INFINITY and soft < needed:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (needed if hard == resource.RLIM_INFINITY else min(needed, hard),
+                                                    hard))
+
+
+def _threaded(connections: int, idle: float) -> Dict[str, Any]:
+    server = make_server(port=0, handler_class=QuietRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        report = asyncio.run(_rounds(server.server_address[1], connections, idle))
+        report['server'] = server.stats()
+        return report
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _asyncio_server(connections: int, idle: float) -> Dict[str, Any]:
+    loop = asyncio.new_event_loop()
+    app = make_app()
+    server = AsyncHTTPServer(app, 'localhost', 0)
+    loop.run_until_complete(server.start())
+    thread = threading.Thread(target=loop.run_forever, name='seraphina-asyncio', daemon=True)
+    thread.start()
+    try:
+        report = asyncio.run(_rounds(server.port, connections, idle))
+        report['server'] = {**server.stats(), **app.engine.stats()}
+        return report
+    finally:
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def run(connections: int = 1000, idle: float = 1.0) -> Dict[str, Any]:
+    _raise_fd_limit(connections * 2 + 256)
+    return {
+        'benchmark': 'asgi_concurrency',
+        'connections': connections,
+        'idle_seconds': idle,
+        'threaded': _threaded(connections, idle),
+        'asyncio': _asyncio_server(connections, idle)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Simultaneous keep-alive clients: threaded vs asyncio server')
+    parser.add_argument('--connections', type=int, default=1000)
+    parser.add_argument('--idle', type=float, default=1.0, help='Seconds connections sit idle between rounds')
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.connections, args.idle), indent=2))
+
+
+if __name__ == '__main__':
+    main()
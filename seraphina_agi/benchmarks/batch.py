@@ -0,0 +1,92 @@
+"""
+Bulk versus one-at-a-time throughput.
+Compares items/s for process_language in a loop against process_many, and for
+one POST /process per item against a single POST /process/batch.
+"""
+
+import argparse
+import http.client
+import json
+import threading
+import time
+from typing import Any, Dict, List
+
+from ..advanced_language_engine import AdvancedLanguageEngine
+from ..server import QuietRequestHandler, make_server
+
+SAMPLE_TEXTS = [
+    'Hello world, how are you today?',
+    '¿Dónde está la biblioteca?',
+    'The quick brown fox jumps over the lazy dog',
+    'hello World and hello again'
+]
+
+
+def _items(count: int) -> List[str]:
+    return [SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)] for i in range(count)]
+
+
+def _rate(count: int, elapsed: float) -> float:
+    return round(count / elapsed, 1) if elapsed else 0.0
+
+
+def run(items: int = 5000, options: Dict[str, Any] = None) -> Dict[str, Any]:
+    options = options or {'target_language': 'es-ES'}
+    texts = _items(items)
+    engine = AdvancedLanguageEngine()
+
+    start = time.perf_counter()
+    for text in texts:
+        engine.process_language(text, options)
+    single_engine = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in engine.process_many(texts, options):
+        pass
+    bulk_engine = time.perf_counter() - start
+
+    server = make_server('127.0.0.1', 0, workers=2, handler_class=QuietRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    headers = {'Content-Type': 'application/json'}
+    try:
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+        start = time.perf_counter()
+        for text in texts:
+            conn.request('POST', '/process', body=json.dumps({'input': text, 'options': options}), headers=headers)
+            conn.getresponse().read()
+        single_http = time.perf_counter() - start
+
+        start = time.perf_counter()
+        conn.request('POST', '/process/batch', body=json.dumps({'inputs': texts, 'options': options}), headers=headers)
+        results = json.loads(conn.getresponse().read())
+        bulk_http = time.perf_counter() - start
+        conn.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    return {
+        'benchmark': 'batch',
+        'items': items,
+        'engine': {
+            'process_language_items_per_s': _rate(items, single_engine),
+            'process_many_items_per_s': _rate(items, bulk_engine)
+        },
+        'http': {
+            'single_items_per_s': _rate(items, single_http),
+            'batch_items_per_s': _rate(len(results), bulk_http),
+            'speedup': round(single_http / bulk_http, 2) if bulk_http else None
+        }
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Batch vs single-item throughput')
+    parser.add_argument('--items', type=int, default=5000)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.items), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Memory traffic and throughput of the bytes-in/bytes-out engine API.
+For each payload size, measures the peak memory tracemalloc sees during one
+request (reported in multiples of the payload size, i.e. roughly how many
+payload-sized buffers were alive at once) and MB/s for: process_language on
+a str, process_bytes returning the base64 token, process_bytes with
+encoding=raw, and encoding=raw encrypting in place into the caller's buffer.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from ..advanced_language_engine import AdvancedLanguageEngine
+from .. import octabit_cipher
+
+DEFAULT_SIZES = [1024, 64 * 1024, 1024 * 1024]
+OPTIONS = {'source_language': 'en-US'}
+
+
+def _peak_bytes(fn: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def _mb_per_s(fn: Callable[[], Any], size: int, min_time: float = 0.2) -> float:
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        fn()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return round(size * runs / elapsed / (1024 * 1024), 2)
+
+
+def run(sizes: List[int] = None) -> Dict[str, Any]:
+    engine = AdvancedLanguageEngine()
+    results = []
+    for size in sizes or DEFAULT_SIZES:
+        text = ('Hello world, how are you today? ' * (size // 32 + 1))[:size]
+        data = text.encode('utf-8')
+        buf = bytearray(data)
+        variants = {
+            'str_api': lambda: engine.process_language(text, OPTIONS),
+            'bytes_base64': lambda: engine.process_bytes(data, OPTIONS),
+            'bytes_raw': lambda: engine.process_bytes(data, {**OPTIONS, 'encoding': 'raw'}),
+            'bytes_raw_in_place': lambda: engine.process_bytes(buf, {**OPTIONS, 'encoding': 'raw'}, out=buf)
+        }
+        row = {'bytes': size}
+        for name, fn in variants.items():
+            fn()
+            peak = _peak_bytes(fn)
+            row[name] = {
+                'peak_kib': round(peak / 1024, 1),
+                'payload_copies': round(peak / size, 2),
+                'mb_s': _mb_per_s(fn, size)
+            }
+        results.append(row)
+    return {
+        'benchmark': 'binary_api',
+        'backend': 'numpy' if octabit_cipher._np is not None else 'int',
+        'results': results
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Peak memory and MB/s: str API vs bytes API')
+    parser.add_argument('--sizes', type=int, nargs='+', help='Payload sizes in bytes')
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.sizes), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Octabit cipher throughput in MB/s across payload sizes.
+Compares the original byte-at-a-time XOR loop with chained str.replace
+against the bulk xor_bytes/urlsafe_b64encode path.
+"""
+
+import argparse
+import base64
+import json
+import time
+from typing import Any, Callable, Dict, List, Sequence
+
+from ..advanced_language_engine import AdvancedLanguageEngine
+from .. import octabit_cipher
+
+DEFAULT_SIZES = [1024, 64 * 1024, 1024 * 1024, 4 * 1024 * 1024]
+
+
+def legacy_encrypt(data: bytes, key: Sequence[int]) -> str:
+    out = bytearray(len(data))
+    for i, b in enumerate(data):
+        out[i] = b ^ key[i % len(key)]
+    return base64.b64encode(out).decode('ascii').rstrip('=').replace('+', '-').replace('/', '_')
+
+
+def _mb_per_s(fn: Callable[[], Any], size: int, min_time: float = 0.2) -> float:
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        fn()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return round(size * runs / elapsed / (1024 * 1024), 2)
+
+
+def run(sizes: List[int] = None, language: str = 'en-US') -> Dict[str, Any]:
+    key = AdvancedLanguageEngine().octabit_encryption['frequency_cipher'][language]['encryption_key']
+    results = []
+    for size in sizes or DEFAULT_SIZES:
+        payload = bytes(range(256)) * (size // 256) + bytes(size % 256)
+        if legacy_encrypt(payload, key) != octabit_cipher.encrypt_bytes(payload, key):
+            raise AssertionError(f'bulk cipher output differs from legacy at {size} bytes')
+        legacy = _mb_per_s(lambda: legacy_encrypt(payload, key), size)
+        bulk = _mb_per_s(lambda: octabit_cipher.encrypt_bytes(payload, key), size)
+        results.append({
+            'bytes': size,
+            'legacy_mb_s': legacy,
+            'bulk_mb_s': bulk,
+            'speedup': round(bulk / legacy, 1) if legacy else None
+        })
+    return {
+        'benchmark': 'cipher',
+        'backend': 'numpy' if octabit_cipher._np is not None else 'int',
+        'results': results
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Octabit cipher MB/s, legacy vs bulk')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='Payload sizes in bytes')
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.sizes), indent=2))
+
+
+if __name__ == '__main__':
+    main()
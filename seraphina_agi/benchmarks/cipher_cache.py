@@ -0,0 +1,72 @@
+"""
+Engine cold-start with and without the persistent cipher table cache.
+Measures in-process construction time and end-to-end `seraphina-agi process`
+launches with SERAPHINA_CIPHER_CACHE on and off, using a temporary cache
+directory.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from ..advanced_language_engine import AdvancedLanguageEngine
+from ..cipher_cache import CACHE_DIR_ENV, CACHE_DISABLE_ENV
+
+
+def _ms(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {'mean_ms': round(statistics.mean(ordered) * 1000, 3), 'p50_ms': round(ordered[len(ordered) // 2] * 1000, 3)}
+
+
+def _construct(repeat: int, cache_dir=None) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        AdvancedLanguageEngine(cache_dir=cache_dir)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _launch(repeat: int, env: Dict[str, str]) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-m', 'seraphina_agi.run_agi', 'process', '--input', 'Hello world'],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env, check=True)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def run(repeat: int = 200, launches: int = 10) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        AdvancedLanguageEngine(cache_dir=cache_dir)  # populate
+        uncached = _construct(repeat)
+        cached = _construct(repeat, cache_dir)
+        env_off = {**os.environ, CACHE_DISABLE_ENV: 'off'}
+        env_on = {**os.environ, CACHE_DIR_ENV: cache_dir}
+        env_on.pop(CACHE_DISABLE_ENV, None)
+        cli_off = _launch(launches, env_off)
+        cli_on = _launch(launches, env_on)
+    return {
+        'benchmark': 'cipher_cache',
+        'construct': {'uncached': _ms(uncached), 'cached': _ms(cached)},
+        'cli_process': {'uncached': _ms(cli_off), 'cached': _ms(cli_on)}
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Cold start with and without the cipher cache')
+    parser.add_argument('--repeat', type=int, default=200, help='In-process constructions per mode')
+    parser.add_argument('--launches', type=int, default=10, help='CLI launches per mode')
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.repeat, args.launches), indent=2))
+
+
+if __name__ == '__main__':
+    main()
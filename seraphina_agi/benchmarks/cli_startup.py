@@ -0,0 +1,77 @@
+"""
+CLI startup: wall-clock time from launching `seraphina-agi <command>` to its
+first byte of output, plus the slowest imports reported by -X importtime.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+COMMANDS = {
+    'process': ['process', '--input', 'Hello world'],
+    'quantum': ['quantum', '--quiet']
+}
+
+
+def _time_to_first_output(argv: List[str]) -> float:
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, '-m', 'seraphina_agi.run_agi'] + argv,
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    proc.stdout.read(1)
+    elapsed = time.perf_counter() - start
+    proc.stdout.read()
+    proc.wait()
+    return elapsed
+
+
+def _time_to_first_output_python() -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', 'print(1)'], stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+
+def slowest_imports(limit: int = 10) -> List[Dict[str, Any]]:
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import seraphina_agi.run_agi'],
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, self_us, cumulative_us, name = [part.strip() for part in line.replace('import time:', '|').split('|')]
+        rows.append({'module': name, 'self_us': int(self_us), 'cumulative_us': int(cumulative_us)})
+    rows.sort(key=lambda r: r['cumulative_us'], reverse=True)
+    return rows[:limit]
+
+
+def run(repeat: int = 10) -> Dict[str, Any]:
+    commands = {}
+    for name, argv in COMMANDS.items():
+        samples = sorted(_time_to_first_output(argv) for _ in range(repeat))
+        commands[name] = {
+            'mean_ms': round(statistics.mean(samples) * 1000, 2),
+            'min_ms': round(samples[0] * 1000, 2),
+            'p50_ms': round(samples[len(samples) // 2] * 1000, 2)
+        }
+    baseline = sorted(_time_to_first_output_python() for _ in range(repeat))
+    return {
+        'benchmark': 'cli_startup',
+        'repeat': repeat,
+        'python_startup_ms': round(baseline[len(baseline) // 2] * 1000, 2),
+        'commands': commands,
+        'slowest_imports': slowest_imports()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='CLI launch-to-first-output time')
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.repeat), indent=2))
+
+
+if __name__ == '__main__':
+    main()
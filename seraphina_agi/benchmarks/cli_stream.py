@@ -0,0 +1,81 @@
+"""
+`process --stdin` against one `process --input` launch per record.
+Times a few single-record launches (records/s if every record forks the
+interpreter), then pipes N and 4N generated lines through `process --stdin`
+in one process and with --processes workers. Peak RSS of each streaming run
+shows whether memory grows with the input.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+# Runs the CLI and reports its own peak RSS in KiB on the last stderr line.
+# VmHWM resets on exec; ru_maxrss would carry over the benchmark's own peak.
+_CHILD = ('import atexit, resource, sys\n'
+          'def peak():\n'
+          '    try:\n'
+          '        with open("/proc/self/status") as f:\n'
+          '            return int(next(l for l in f if l.startswith("VmHWM:")).split()[1])\n'
+          '    except (OSError, StopIteration):\n'
+          '        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n'
+          'atexit.register(lambda: sys.stderr.write("maxrss=%d\\n" % peak()))\n'
+          'sys.argv = ["seraphina-agi"] + sys.argv[1:]\n'
+          'from seraphina_agi.run_agi import main\n'
+          'main()\n')
+
+
+def _lines(count: int) -> bytes:
+    return ''.join(f'Hello world number {i}, how are you today?\n' for i in range(count)).encode('utf-8')
+
+
+def _per_launch(launches: int) -> float:
+    start = time.perf_counter()
+    for i in range(launches):
+        subprocess.run([sys.executable, '-m', 'seraphina_agi.run_agi', 'process', '--input', f'Hello world {i}'],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    return launches / (time.perf_counter() - start)
+
+
+def _stream(count: int, extra: List[str]) -> Dict[str, Any]:
+    data = _lines(count)
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, '-c', _CHILD, 'process', '--stdin', '--quiet'] + extra, input=data,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+    elapsed = time.perf_counter() - start
+    output_lines = proc.stdout.count(b'\n')
+    maxrss = int(proc.stderr.decode().strip().rsplit('maxrss=', 1)[1])
+    return {'records': count, 'output_lines': output_lines, 'seconds': round(elapsed, 2),
+            'records_per_s': round(count / elapsed), 'peak_rss_mib': round(maxrss / 1024, 1)}
+
+
+def run(records: int = 20_000, launches: int = 10, processes: int = 2) -> Dict[str, Any]:
+    per_launch = _per_launch(launches)
+    streams = {
+        'one_process': [_stream(records, []), _stream(records * 4, [])],
+        f'processes_{processes}': [_stream(records, ['--processes', str(processes)]),
+                                   _stream(records * 4, ['--processes', str(processes)])]
+    }
+    best = max(run['records_per_s'] for runs in streams.values() for run in runs)
+    return {
+        'benchmark': 'cli_stream',
+        'per_launch_records_per_s': round(per_launch, 1),
+        'stdin': streams,
+        'speedup_vs_per_launch': round(best / per_launch)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='process --stdin vs one process launch per record')
+    parser.add_argument('--records', type=int, default=20_000, help='Lines in the smaller streaming run')
+    parser.add_argument('--launches', type=int, default=10, help='Single-record launches to time')
+    parser.add_argument('--processes', type=int, default=2)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.records, args.launches, args.processes), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Inbot code generation for many seeds.
+The per-seed path builds a quiet LinuxOctaBitQuantumCore and calls
+generate_quantum_inbot_code() n times (timed on a sample of the seeds and
+reported as codes/s); the bulk path is generate_inbot_codes() over all seeds
+in columns, and write_inbot_codes() streaming NDJSON to a null sink. The
+sample is checked to match the per-call sequence exactly.
+"""
+
+import argparse
+import io
+import json
+import time
+from typing import Any, Dict
+
+from .. import linux_octabit_quantum_core as core_module
+from ..linux_octabit_quantum_core import LinuxOctaBitQuantumCore, generate_inbot_codes, write_inbot_codes
+
+
+class _NullWriter(io.TextIOBase):
+    def write(self, s: str) -> int:
+        return len(s)
+
+
+def run(seeds: int = 1_000_000, n: int = 4, sample: int = 20_000) -> Dict[str, Any]:
+    seed_list = [f'seed-{i}' for i in range(seeds)]
+    sample = min(sample, seeds)
+
+    start = time.perf_counter()
+    legacy = []
+    for seed in seed_list[:sample]:
+        core = LinuxOctaBitQuantumCore(seed, quiet=True)
+        legacy.append([core.generate_quantum_inbot_code() for _ in range(n)])
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    columns = generate_inbot_codes(seed_list, n)
+    columnar_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    written = write_inbot_codes(seed_list, _NullWriter(), n)
+    ndjson_s = time.perf_counter() - start
+
+    timestamps, signatures = columns['timestamp'], columns['random_signature']
+    identical = all(
+        int(timestamps[i]) == codes[0]['timestamp']
+        and [float(v) for v in signatures[i]] == [code['random_signature'] for code in codes]
+        for i, codes in enumerate(legacy)
+    )
+    codes = seeds * n
+    return {
+        'benchmark': 'inbot_codes',
+        'numpy': core_module._np is not None,
+        'seeds': seeds,
+        'codes_per_seed': n,
+        'identical_output': identical,
+        'per_seed_core': {'sample_seeds': sample, 'codes_per_s': round(sample * n / legacy_s),
+                          'projected_s': round(legacy_s * seeds / sample, 2)},
+        'columnar': {'seconds': round(columnar_s, 3), 'codes_per_s': round(codes / columnar_s)},
+        'ndjson': {'seconds': round(ndjson_s, 3), 'codes_per_s': round(written / ndjson_s)},
+        'speedup_columnar': round(legacy_s * seeds / sample / columnar_s, 1)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Bulk inbot code generation vs one core per seed')
+    parser.add_argument('--seeds', type=int, default=1_000_000)
+    parser.add_argument('-n', type=int, default=4, help='Codes per seed')
+    parser.add_argument('--sample', type=int, default=20_000, help='Seeds timed on the per-seed path')
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.seeds, args.n, args.sample), indent=2))
+
+
+if __name__ == '__main__':
+    main()
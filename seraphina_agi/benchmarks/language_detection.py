@@ -0,0 +1,104 @@
+"""
+Language detection accuracy and throughput.
+Scores the n-gram/script detector against the original diacritic heuristic on
+the bundled multilingual test corpus (data/langdetect/test_corpus.tsv), and
+measures detections/s on the corpus sentences (memoized, as repeated
+requests see them, and uncached) and on long documents, where the detector
+stops early once it is confident.
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Tuple
+
+from ..language_detection import PROFILE_DIR, LanguageDetector
+
+CORPUS_PATH = os.path.join(PROFILE_DIR, 'test_corpus.tsv')
+
+
+def legacy_detect(text: str) -> str:
+    if any(c in text for c in '¿¡ñáéíóú'):
+        return 'es-ES'
+    return 'en-US'
+
+
+def load_corpus(path: str = CORPUS_PATH) -> List[Tuple[str, str]]:
+    corpus = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\r\n')
+            if not line or line.startswith('#'):
+                continue
+            code, _, text = line.partition('\t')
+            corpus.append((code, text))
+    return corpus
+
+
+def _accuracy(detect: Callable[[str], str], corpus: List[Tuple[str, str]]) -> Dict[str, Any]:
+    correct: Counter = Counter()
+    total: Counter = Counter()
+    for code, text in corpus:
+        total[code] += 1
+        correct[code] += detect(text) == code
+    return {
+        'accuracy': round(sum(correct.values()) / len(corpus), 4),
+        'per_language': {code: round(correct[code] / total[code], 2) for code in sorted(total)}
+    }
+
+
+def _per_s(detect: Callable[[str], Any], texts: List[str], min_time: float = 0.5) -> float:
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        for text in texts:
+            detect(text)
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return round(len(texts) * runs / elapsed)
+
+
+def run(long_chars: int = 100_000) -> Dict[str, Any]:
+    start = time.perf_counter()
+    detector = LanguageDetector()
+    build_ms = (time.perf_counter() - start) * 1000
+    corpus = load_corpus()
+    texts = [text for _, text in corpus]
+    detect = lambda text: detector.detect(text)[0]  # noqa: E731
+
+    long_docs = []
+    for code in ('fr-FR', 'ru-RU', 'ja-JP'):
+        sample = ' '.join(text for c, text in corpus if c == code)
+        long_docs.append(sample * (long_chars // len(sample) + 1))
+
+    return {
+        'benchmark': 'language_detection',
+        'corpus_sentences': len(corpus),
+        'languages': len({code for code, _ in corpus}),
+        'profile_build_ms': round(build_ms, 1),
+        'detector': {
+            **_accuracy(detect, corpus),
+            'detections_per_s': _per_s(detect, texts),
+            'uncached_detections_per_s': _per_s(detector._detect, texts),
+            f'long_{long_chars // 1000}k_detections_per_s': _per_s(detect, long_docs)
+        },
+        'legacy': {
+            **_accuracy(legacy_detect, corpus),
+            'detections_per_s': _per_s(legacy_detect, texts),
+            f'long_{long_chars // 1000}k_detections_per_s': _per_s(legacy_detect, long_docs)
+        }
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Language detection accuracy and throughput')
+    parser.add_argument('--long-chars', type=int, default=100_000)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.long_chars), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Lattice construction cost by recursion depth (1 to 8).
+Compares the original eagerly materialised dict tree with RecursiveLattice,
+both fully walked to the innermost level, reporting wall time and peak
+traced memory.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from ..linux_octabit_quantum_core import LinuxOctaBitQuantumCore, LATTICE_EDGE
+
+
+def legacy_lattice(depth: int, density: int = 8) -> Dict[str, Any]:
+    sphere_topology = [
+        [
+            [
+                {
+                    'compressed': True,
+                    'density': density,
+                    'neural_connections': 64,
+                    'quantum_state': 'entangled'
+                } for _ in range(LATTICE_EDGE)
+            ] for _ in range(LATTICE_EDGE)
+        ] for _ in range(LATTICE_EDGE)
+    ]
+    lattice = {'sphere_topology': sphere_topology, 'recursion_level': depth, 'neural_multiplexing': True}
+    if depth > 0:
+        lattice['inner_lattice'] = legacy_lattice(depth - 1, density)
+    return lattice
+
+
+def _walk(lattice) -> int:
+    levels = 1
+    while 'inner_lattice' in lattice:
+        lattice = lattice['inner_lattice']
+        levels += 1
+    return levels
+
+
+def _measure(build: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        _walk(build())
+    elapsed = (time.perf_counter() - start) / repeat
+    tracemalloc.start()
+    lattice = build()
+    _walk(lattice)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'ms': round(elapsed * 1000, 4), 'peak_kib': round(peak / 1024, 1)}
+
+
+def run(max_depth: int = 8, repeat: int = 20) -> Dict[str, Any]:
+    with contextlib.redirect_stdout(io.StringIO()):
+        core = LinuxOctaBitQuantumCore()
+    results: List[Dict[str, Any]] = []
+    for depth in range(1, max_depth + 1):
+        results.append({
+            'depth': depth,
+            'legacy': _measure(lambda: legacy_lattice(depth), repeat),
+            'lazy': _measure(lambda: core.generate_recursive_lattice(depth), repeat)
+        })
+    return {'benchmark': 'lattice', 'repeat': repeat, 'results': results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Lattice construction time/memory by depth')
+    parser.add_argument('--max-depth', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.max_depth, args.repeat), indent=2))
+
+
+if __name__ == '__main__':
+    main()
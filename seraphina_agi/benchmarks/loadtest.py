@@ -0,0 +1,27 @@
+"""
+Load test for the HTTP API.
+Drives POST /process from concurrent keep-alive clients (see
+seraphina_agi.load_generator) and reports p50/p99 latency, requests per
+second and 503 rejections. Targets --url when given, otherwise starts an
+in-process server on an ephemeral port.
+"""
+
+import argparse
+import json
+
+from ..load_generator import run
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Load test POST /process')
+    parser.add_argument('--url', help='Target URL (default: start an in-process server)')
+    parser.add_argument('--clients', type=int, default=16, help='Concurrent keep-alive clients')
+    parser.add_argument('--requests', type=int, default=200, help='Requests per client')
+    parser.add_argument('--workers', type=int, default=8, help='Worker threads for the in-process server')
+    parser.add_argument('--backlog', type=int, default=64, help='Queue bound for the in-process server')
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.url, args.clients, args.requests, workers=args.workers, backlog=args.backlog), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Instrumentation overhead on process_language.
+Times the same calls (best of several rounds) in three fresh interpreters:
+hooks removed (SERAPHINA_METRICS=off), hooks installed but switched off with
+set_enabled(False), and recording enabled, so the cost of the stage timers
+can be read off directly.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Dict
+
+MODES = ('uninstrumented', 'disabled', 'enabled')
+ROUNDS = 5  # best of, to damp scheduler noise
+
+
+def _child(mode: str, calls: int) -> Dict[str, Any]:
+    from .. import metrics
+    from ..advanced_language_engine import AdvancedLanguageEngine
+    metrics.set_enabled(mode == 'enabled')
+    engine = AdvancedLanguageEngine()
+    texts = ['Hello world', '¿Qué tal? niño', 'Guten Morgen, wie geht es dir?', 'Привет, мир']
+    for text in texts:
+        engine.process_language(text)
+    best = float('inf')
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for i in range(calls):
+            engine.process_language(texts[i % len(texts)])
+        best = min(best, time.perf_counter() - start)
+    return {'instrumented': metrics.INSTRUMENTED, 'recording': metrics.enabled(),
+            'us_per_call': round(best / calls * 1e6, 2)}
+
+
+def run(calls: int = 20_000) -> Dict[str, Any]:
+    results = {}
+    for mode in MODES:
+        env = dict(os.environ)
+        env['SERAPHINA_METRICS'] = 'off' if mode == 'uninstrumented' else 'on'
+        command = [sys.executable, '-m', 'seraphina_agi.benchmarks.metrics', '--child', mode, '--calls', str(calls)]
+        out = subprocess.run(command, env=env, check=True, capture_output=True, text=True).stdout
+        results[mode] = json.loads(out)
+    base = results['uninstrumented']['us_per_call']
+    for mode in MODES[1:]:
+        results[mode]['overhead_pct'] = round((results[mode]['us_per_call'] / base - 1) * 100, 1)
+    return {'benchmark': 'metrics', 'calls': calls, **results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Cost of metrics instrumentation on process_language')
+    parser.add_argument('--calls', type=int, default=20_000)
+    parser.add_argument('--child', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.child:
+        print(json.dumps(_child(args.child, args.calls)))
+        return
+    print(json.dumps(run(args.calls), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Worker-process scaling: items/s through ProcessEnginePool at 1, 2, 4 and 8
+processes versus a single in-process engine, for small and shared-memory
+sized payloads.
+"""
+
+import argparse
+import json
+import os
+import time
+from typing import Any, Dict, List
+
+from ..advanced_language_engine import AdvancedLanguageEngine
+from ..worker_pool import SHM_THRESHOLD, ProcessEnginePool
+
+DEFAULT_PROCESSES = [1, 2, 4, 8]
+
+
+def _rate(count: int, elapsed: float) -> float:
+    return round(count / elapsed, 1) if elapsed else 0.0
+
+
+def run(processes: List[int] = None, items: int = 2000, text_bytes: int = 4096,
+        large_items: int = 40) -> Dict[str, Any]:
+    texts = [('Hello world %d ' % i * (text_bytes // 14 + 1))[:text_bytes] for i in range(items)]
+    large = [('¿Dónde está? %d ' % i * (SHM_THRESHOLD // 14 + 1))[:SHM_THRESHOLD * 2] for i in range(large_items)]
+
+    engine = AdvancedLanguageEngine()
+    start = time.perf_counter()
+    for _ in engine.process_many(texts):
+        pass
+    baseline = _rate(items, time.perf_counter() - start)
+
+    results = []
+    for count in processes or DEFAULT_PROCESSES:
+        with ProcessEnginePool(count) as pool:
+            start = time.perf_counter()
+            for _ in pool.map(texts):
+                pass
+            small = _rate(items, time.perf_counter() - start)
+            start = time.perf_counter()
+            for _ in pool.map(large):
+                pass
+            shm = _rate(large_items, time.perf_counter() - start)
+        results.append({'processes': count, 'items_per_s': small, 'shm_items_per_s': shm,
+                        'speedup_vs_inprocess': round(small / baseline, 2) if baseline else None})
+    return {
+        'benchmark': 'process_pool',
+        'cpu_count': os.cpu_count(),
+        'items': items,
+        'text_bytes': text_bytes,
+        'inprocess_items_per_s': baseline,
+        'results': results
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='ProcessEnginePool scaling')
+    parser.add_argument('--processes', type=int, nargs='+', default=DEFAULT_PROCESSES)
+    parser.add_argument('--items', type=int, default=2000)
+    parser.add_argument('--text-bytes', type=int, default=4096)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.processes, args.items, args.text_bytes), indent=2))
+
+
+if __name__ == '__main__':
+    main()
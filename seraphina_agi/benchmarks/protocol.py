@@ -0,0 +1,91 @@
+"""
+Protocol message throughput in messages/s.
+Feeds a newline-delimited stream of Stratum/JSON-RPC style messages per
+protocol code through: the text-only XOR the engine used to apply, the
+kind-aware ProtocolLineDecoder (parse, validate, pack, XOR the packed form)
+and process_language one message at a time. Also reports the average text
+and packed message sizes.
+"""
+
+import argparse
+import io
+import json
+import time
+from typing import Any, Dict, List
+
+from ..advanced_language_engine import AdvancedLanguageEngine
+from ..octabit_cipher import xor_bytes
+
+
+def sample_messages(code: str, count: int) -> List[str]:
+    def hex32(i: int, n: int = 32) -> str:
+        return ((i * 2654435761) & 0xFFFFFFFF).to_bytes(4, 'big').hex() * (n // 4)
+
+    messages = []
+    for i in range(count):
+        if code == 'proto:stratum.notify':
+            messages.append(json.dumps({'id': None, 'method': 'mining.notify', 'params': [
+                f'{i:x}', hex32(i), '01000000' + hex32(i + 1, 56), hex32(i + 2, 48),
+                [hex32(i + 3), hex32(i + 4)], '20000000', '1d00ffff', f'{1700000000 + i:08x}', i % 2 == 0]}))
+        elif code == 'proto:stratum.submit':
+            messages.append(json.dumps({'id': i, 'method': 'mining.submit', 'params': [
+                'worker.1', f'{i:x}', hex32(i, 8), f'{1700000000 + i:08x}', hex32(i + 7, 4)]}))
+        elif code == 'proto:blockheader.hex':
+            messages.append(hex32(i, 80))
+        elif code == 'proto:nonce':
+            messages.append(f'{(i * 2654435761) & 0xFFFFFFFF:08x}')
+        else:
+            raise ValueError(f'no sample messages for {code}')
+    return messages
+
+
+def _per_s(count: int, fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return round(count / (time.perf_counter() - start))
+
+
+def run(messages: int = 20_000, codes: List[str] = None) -> Dict[str, Any]:
+    engine = AdvancedLanguageEngine()
+    results = []
+    for code in codes or ['proto:stratum.notify', 'proto:stratum.submit', 'proto:blockheader.hex', 'proto:nonce']:
+        lines = sample_messages(code, messages)
+        stream = ('\n'.join(lines) + '\n').encode('ascii')
+        key = engine.octabit_encryption['frequency_cipher'][code]['encryption_key']
+        decoder = engine.protocol_decoder(code)
+        packed: List[bytes] = []
+
+        def text_xor():
+            for line in io.BytesIO(stream):
+                xor_bytes(line.rstrip(b'\n'), key)
+
+        def codec_stream():
+            packed.extend(decoder.iter_stream(io.BytesIO(stream)))
+
+        options = {'source_language': code}
+        per_message = lines[:max(1, messages // 10)]
+        text_rate = _per_s(messages, text_xor)
+        decoder_rate = _per_s(messages, codec_stream)
+        process_rate = _per_s(len(per_message), lambda: [engine.process_language(m, options) for m in per_message])
+        results.append({
+            'code': code,
+            'text_bytes_per_msg': round((len(stream) - messages) / messages, 1),
+            'packed_bytes_per_msg': round(sum(map(len, packed)) / messages, 1),
+            'text_xor_msgs_per_s': text_rate,
+            'line_decoder_msgs_per_s': decoder_rate,
+            'process_language_msgs_per_s': process_rate,
+            'errors': decoder.errors
+        })
+    return {'benchmark': 'protocol', 'messages': messages, 'results': results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Protocol codec messages/s')
+    parser.add_argument('--messages', type=int, default=20_000)
+    parser.add_argument('--codes', nargs='+', help='Protocol codes to run')
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.messages, args.codes), indent=2))
+
+
+if __name__ == '__main__':
+    main()
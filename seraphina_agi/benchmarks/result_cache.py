@@ -0,0 +1,81 @@
+"""
+Result cache replay benchmark.
+Generates a /process-like request log (seraphina_agi.workload), where a few
+greetings and templated messages dominate and a share of requests is unique,
+then replays it against one engine with and without a ResultCache, from several
+threads. Reports hit rate, per-request latency and requests per second.
+"""
+
+import argparse
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..advanced_language_engine import AdvancedLanguageEngine
+from ..result_cache import DEFAULT_MAX_ENTRIES, ResultCache
+from ..workload import request_log
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))] if ordered else 0.0
+
+
+def replay(engine: AdvancedLanguageEngine, log: List[Tuple[str, Optional[Dict[str, Any]]]],
+           threads: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    def client(part):
+        local = []
+        for text, options in part:
+            start = time.perf_counter()
+            engine.process_language(text, options)
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    workers = [threading.Thread(target=client, args=(log[i::threads],)) for i in range(threads)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'requests_per_s': round(len(log) / elapsed),
+        'mean_us': round(sum(latencies) / len(latencies) * 1e6, 1),
+        'p50_us': round(_percentile(latencies, 0.50) * 1e6, 1),
+        'p99_us': round(_percentile(latencies, 0.99) * 1e6, 1)
+    }
+
+
+def run(requests: int = 20_000, unique_share: float = 0.2, threads: int = 4,
+        cache_mb: float = 16, ttl: Optional[float] = None) -> Dict[str, Any]:
+    log = request_log(requests, unique_share)
+    cache = ResultCache(DEFAULT_MAX_ENTRIES, int(cache_mb * 1024 * 1024), ttl)
+    return {
+        'benchmark': 'result_cache',
+        'requests': requests,
+        'distinct_requests': len({(text, json.dumps(options, sort_keys=True)) for text, options in log}),
+        'threads': threads,
+        'uncached': replay(AdvancedLanguageEngine(), log, threads),
+        'cached': replay(AdvancedLanguageEngine(result_cache=cache), log, threads),
+        'cache': cache.stats()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Result cache hit rate and latency on a replayed request log')
+    parser.add_argument('--requests', type=int, default=20_000)
+    parser.add_argument('--unique-share', type=float, default=0.2, help='Fraction of one-off requests')
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--cache-mb', type=float, default=16)
+    parser.add_argument('--ttl', type=float)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.requests, args.unique_share, args.threads, args.cache_mb, args.ttl), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+Roman wheel decoding and octonion arithmetic throughput.
+Compares the original per-character decode_data loop with the bulk
+implementation on long hex inputs (checking the outputs match), and
+SimpleOcto.multiply / norm in a Python loop with the batched array versions.
+Results depend on whether NumPy is installed; 'numpy' in the output says
+which path ran.
+"""
+
+import argparse
+import json
+import math
+import os
+import time
+from typing import Any, Callable, Dict, List
+
+from .. import roman_wheel
+from ..roman_wheel import RomanDecoderWheel, SimpleOcto, octo_multiply_batch, octo_norm_batch
+
+DEFAULT_HEX_BYTES = [1024, 64 * 1024, 1024 * 1024]
+
+
+def legacy_decode(wheel: RomanDecoderWheel, hex_str: str) -> str:
+    wheel.theta += 2 * math.pi * (wheel.freq / 432.0) / 8
+    spiral_r = wheel.r * (math.cos(8 * wheel.theta) + 1.5) / 2.5
+    decoded = []
+    for i in range(0, len(hex_str), 8):
+        chunk = hex_str[i:i+8]
+        oct_coeffs = [0] * 8
+        for j, c in enumerate(chunk):
+            try:
+                oct_coeffs[j % 8] += int(c, 16)
+            except ValueError:
+                pass
+        n = SimpleOcto(oct_coeffs).norm() * spiral_r
+        if n <= 2:
+            decoded.append(chunk)
+    return ''.join(decoded)
+
+
+def _timed(fn: Callable[[], Any], min_time: float = 0.3) -> float:
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        fn()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / runs
+
+
+def _wheels() -> List[RomanDecoderWheel]:
+    # Same configuration as the engine's modulation wheels.
+    return [RomanDecoderWheel('xy', 432 + i * 3, 580 + i * 10) for i in range(4)]
+
+
+def run(hex_bytes: List[int] = None, octonions: int = 100_000) -> Dict[str, Any]:
+    decode = []
+    for size in hex_bytes or DEFAULT_HEX_BYTES:
+        # Low nibbles keep roughly half the chunks, so the filter does real work.
+        hex_str = bytes(b & 0x11 for b in os.urandom(size)).hex()
+        legacy_wheels, bulk_wheels = _wheels(), _wheels()
+        matches = all(legacy_decode(lw, hex_str) == bw.decode_data(hex_str)
+                      for lw, bw in zip(legacy_wheels, bulk_wheels))
+        legacy_s = _timed(lambda: legacy_decode(legacy_wheels[0], hex_str))
+        bulk_s = _timed(lambda: bulk_wheels[0].decode_data(hex_str))
+        decode.append({
+            'hex_chars': len(hex_str),
+            'identical_output': matches,
+            'legacy_mb_per_s': round(len(hex_str) / legacy_s / 1e6, 2),
+            'bulk_mb_per_s': round(len(hex_str) / bulk_s / 1e6, 2),
+            'speedup': round(legacy_s / bulk_s, 1)
+        })
+
+    rows = [[((i * 8 + j) % 17 - 8) / 4.0 for j in range(8)] for i in range(octonions)]
+    other = rows[::-1]
+    if roman_wheel._np is not None:
+        rows_in, other_in = roman_wheel._np.array(rows), roman_wheel._np.array(other)
+    else:
+        rows_in, other_in = rows, other
+    loop_mul = _timed(lambda: [SimpleOcto(a).multiply(SimpleOcto(b)) for a, b in zip(rows, other)])
+    batch_mul = _timed(lambda: octo_multiply_batch(rows_in, other_in))
+    loop_norm = _timed(lambda: [SimpleOcto(a).norm() for a in rows])
+    batch_norm = _timed(lambda: octo_norm_batch(rows_in))
+
+    return {
+        'benchmark': 'roman_wheel',
+        'numpy': roman_wheel._np is not None,
+        'decode': decode,
+        'octonions': {
+            'count': octonions,
+            'loop_multiply_per_s': round(octonions / loop_mul),
+            'batch_multiply_per_s': round(octonions / batch_mul),
+            'loop_norm_per_s': round(octonions / loop_norm),
+            'batch_norm_per_s': round(octonions / batch_norm)
+        }
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Roman wheel decode and octonion batch throughput')
+    parser.add_argument('--hex-bytes', type=int, nargs='+', default=DEFAULT_HEX_BYTES,
+                        help='Input sizes in bytes before hex encoding')
+    parser.add_argument('--octonions', type=int, default=100_000)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.hex_bytes, args.octonions), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+Latency share_data adds to the processing path.
+Starts a local stand-in collector that answers POSTs after a configurable
+delay (and can fail a share of them), then times process_language followed
+by the original blocking requests.post against the same loop using the
+BackgroundUploader. Also reports how many payloads and POSTs reached the
+collector, and how long the exit flush took.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+from ..advanced_language_engine import AdvancedLanguageEngine
+from ..share_uploader import BackgroundUploader
+
+
+class Collector(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, delay: float, fail_every: int = 0):
+        super().__init__(('127.0.0.1', 0), _CollectorHandler)
+        self.delay = delay
+        self.fail_every = fail_every
+        self.posts = 0
+        self.items = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server_address[1]}/collect'
+
+
+class _CollectorHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        time.sleep(self.server.delay)
+        with self.server.lock:
+            self.server.posts += 1
+            failed = self.server.fail_every and self.server.posts % self.server.fail_every == 0
+            if not failed:
+                self.server.items += len(body.get('items', [body]))
+        status = 503 if failed else 200
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def legacy_share(data: Any, url: str):
+    import requests
+    hashed = hashlib.sha256(json.dumps(data).encode()).hexdigest()
+    requests.post(url, json={'hash': hashed, 'type': 'agi_processing'})
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))] if ordered else 0.0
+
+
+def _summary(latencies: List[float]) -> Dict[str, float]:
+    latencies = sorted(latencies)
+    return {
+        'mean_ms': round(sum(latencies) / len(latencies) * 1000, 3),
+        'p50_ms': round(_percentile(latencies, 0.50) * 1000, 3),
+        'p99_ms': round(_percentile(latencies, 0.99) * 1000, 3)
+    }
+
+
+def run(requests: int = 200, delay: float = 0.02, fail_every: int = 0) -> Dict[str, Any]:
+    engine = AdvancedLanguageEngine()
+    texts = [f'Hello world number {i}' for i in range(requests)]
+
+    def timed(share) -> List[float]:
+        latencies = []
+        for text in texts:
+            start = time.perf_counter()
+            result = engine.process_language(text)
+            share(result)
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    collector = Collector(delay, fail_every)
+    threading.Thread(target=collector.serve_forever, daemon=True).start()
+    try:
+        baseline = timed(lambda result: None)
+        legacy = timed(lambda result: legacy_share(result, collector.url))
+        legacy_posts = collector.posts
+        with tempfile.TemporaryDirectory() as tmp:
+            uploader = BackgroundUploader(collector.url, journal_path=os.path.join(tmp, 'journal.ndjson'))
+            background = timed(uploader.submit)
+            start = time.perf_counter()
+            uploader.close(timeout=30)
+            flush_s = time.perf_counter() - start
+            stats = uploader.stats()
+    finally:
+        collector.shutdown()
+        collector.server_close()
+
+    return {
+        'benchmark': 'share_uploader',
+        'requests': requests,
+        'collector_delay_ms': delay * 1000,
+        'process_only': _summary(baseline),
+        'blocking_share': {**_summary(legacy), 'posts': legacy_posts},
+        'background_share': {
+            **_summary(background),
+            'posts': collector.posts - legacy_posts,
+            'exit_flush_ms': round(flush_s * 1000, 1),
+            **stats
+        }
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Processing-path latency added by share_data')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--delay', type=float, default=0.02, help='Collector response delay in seconds')
+    parser.add_argument('--fail-every', type=int, default=0, help='Answer every Nth POST with 503')
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.requests, args.delay, args.fail_every), indent=2))
+
+
+if __name__ == '__main__':
+    main()
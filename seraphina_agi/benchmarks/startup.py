@@ -0,0 +1,62 @@
+"""
+Cold-start versus warm per-request latency for the language engine.
+Cold: build a fresh AdvancedLanguageEngine and process one request (the old
+per-request server behaviour). Warm: process the same request on a shared,
+pre-built engine.
+"""
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Dict, List
+
+from ..advanced_language_engine import AdvancedLanguageEngine
+from ..shared_engine import SharedEngine
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        'mean_ms': round(statistics.mean(ordered) * 1000, 4),
+        'p50_ms': round(ordered[len(ordered) // 2] * 1000, 4),
+        'p99_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000, 4)
+    }
+
+
+def run(iterations: int = 200, text: str = 'Hello world, how are you today?') -> Dict[str, Any]:
+    cold = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        AdvancedLanguageEngine().process_language(text)
+        cold.append(time.perf_counter() - start)
+
+    shared = SharedEngine()
+    info = shared.warm()
+    warm = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        shared.get().process_language(text)
+        warm.append(time.perf_counter() - start)
+
+    cold_stats = _summary(cold)
+    warm_stats = _summary(warm)
+    return {
+        'benchmark': 'startup',
+        'iterations': iterations,
+        'engine_build_ms': info['load_ms'],
+        'cold': cold_stats,
+        'warm': warm_stats,
+        'speedup': round(cold_stats['mean_ms'] / warm_stats['mean_ms'], 2) if warm_stats['mean_ms'] else None
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Cold-start vs warm engine latency')
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.iterations), indent=2))
+
+
+if __name__ == '__main__':
+    main()
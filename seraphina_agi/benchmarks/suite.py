@@ -0,0 +1,226 @@
+"""
+Benchmark suite: one pass over every subsystem, for tracking regressions.
+Measures process_language, the octabit cipher, RomanDecoderWheel.decode_data
+and LinuxOctaBitQuantumCore construction across input sizes, the HTTP path
+through an in-process server, and CLI launch-to-first-output. Each result is
+a named metric with a unit and a direction (higher or lower is better), so a
+run can be saved as JSON and later compared against as a baseline:
+
+    seraphina-agi bench --out baseline.json
+    seraphina-agi bench --baseline baseline.json --threshold 10
+
+The comparison exits non-zero when any metric got worse by more than the
+threshold percentage.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from ..perf_report import DEFAULT_THRESHOLD_PCT, Metric, compare, environment, format_report, metric, parse_names
+
+ROUNDS = 3  # best of, to damp scheduler noise
+
+
+def _seconds_per_call(fn: Callable[[], Any], min_time: float) -> float:
+    # Calls fn in batches of at least min_time and keeps the fastest batch.
+    fn()
+    best = float('inf')
+    for _ in range(ROUNDS):
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            fn()
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = min(best, elapsed / calls)
+    return best
+
+
+def _size_label(size: int) -> str:
+    if size >= 1024 * 1024 and size % (1024 * 1024) == 0:
+        return f'{size // (1024 * 1024)}MiB'
+    if size >= 1024 and size % 1024 == 0:
+        return f'{size // 1024}KiB'
+    return f'{size}B'
+
+
+def bench_process_language(quick: bool) -> Dict[str, Metric]:
+    from ..advanced_language_engine import AdvancedLanguageEngine
+    engine = AdvancedLanguageEngine()
+    sentence = 'Hello world, how are you today? '
+    results = {}
+    for size in ([32, 4096] if quick else [32, 1024, 16 * 1024]):
+        text = (sentence * (size // len(sentence) + 1))[:size]
+        seconds = _seconds_per_call(lambda: engine.process_language(text), 0.05 if quick else 0.2)
+        results[f'process_language.{_size_label(size)}.us_per_call'] = metric(round(seconds * 1e6, 2), 'us', 'lower')
+    return results
+
+
+def bench_cipher(quick: bool) -> Dict[str, Metric]:
+    from ..advanced_language_engine import AdvancedLanguageEngine
+    from .. import octabit_cipher
+    key = AdvancedLanguageEngine().octabit_encryption['frequency_cipher']['en-US']['encryption_key']
+    results = {}
+    for size in ([1024, 256 * 1024] if quick else [1024, 64 * 1024, 1024 * 1024]):
+        payload = bytes(range(256)) * (size // 256) + bytes(size % 256)
+        token = octabit_cipher.encrypt_bytes(payload, key)
+        min_time = 0.05 if quick else 0.2
+        for op, fn in (('encrypt', lambda: octabit_cipher.encrypt_bytes(payload, key)),
+                       ('decrypt', lambda: octabit_cipher.decrypt_bytes(token, key))):
+            seconds = _seconds_per_call(fn, min_time)
+            results[f'cipher.{op}.{_size_label(size)}.mb_per_s'] = metric(
+                round(size / seconds / (1024 * 1024), 2), 'MiB/s', 'higher')
+    return results
+
+
+def bench_roman_wheel(quick: bool) -> Dict[str, Metric]:
+    from ..roman_wheel import RomanDecoderWheel
+    wheel = RomanDecoderWheel()
+    results = {}
+    for size in ([1024, 256 * 1024] if quick else [1024, 64 * 1024, 1024 * 1024]):
+        # Low nibbles keep roughly half the chunks, as in the roman_wheel benchmark.
+        hex_str = bytes(b & 0x11 for b in os.urandom(size // 2)).hex()
+        seconds = _seconds_per_call(lambda: wheel.decode_data(hex_str), 0.05 if quick else 0.2)
+        results[f'roman_wheel.decode.{_size_label(size)}.mb_per_s'] = metric(
+            round(size / seconds / 1e6, 2), 'MB/s', 'higher')
+    return results
+
+
+def bench_quantum_core(quick: bool) -> Dict[str, Metric]:
+    from ..linux_octabit_quantum_core import LinuxOctaBitQuantumCore
+    min_time = 0.05 if quick else 0.2
+    with contextlib.redirect_stdout(io.StringIO()):
+        construct = _seconds_per_call(lambda: LinuxOctaBitQuantumCore(quiet=True), min_time)
+        core = LinuxOctaBitQuantumCore(quiet=True)
+        run_s = _seconds_per_call(core.run, min_time)
+    results = {
+        'quantum_core.construct.us': metric(round(construct * 1e6, 3), 'us', 'lower'),
+        'quantum_core.run.us': metric(round(run_s * 1e6, 3), 'us', 'lower')
+    }
+    for depth in ([1, 8] if quick else [1, 4, 8]):
+        seconds = _seconds_per_call(lambda: core.generate_recursive_lattice(depth), min_time)
+        results[f'quantum_core.lattice.depth{depth}.us'] = metric(round(seconds * 1e6, 3), 'us', 'lower')
+    return results
+
+
+def bench_http(quick: bool) -> Dict[str, Metric]:
+    from .. import load_generator
+    results = {}
+    for name, text in (('short', 'Hello world, how are you today?'), ('4KiB', 'Hello world. ' * 315)):
+        report = load_generator.run(clients=4, requests=50 if quick else 250, text=text, workers=4)
+        results[f'http.process.{name}.p50_ms'] = metric(report['p50_ms'], 'ms', 'lower')
+        results[f'http.process.{name}.p99_ms'] = metric(report['p99_ms'], 'ms', 'lower')
+        results[f'http.process.{name}.req_per_s'] = metric(report['req_per_s'], 'req/s', 'higher')
+    return results
+
+
+def bench_cli(quick: bool) -> Dict[str, Metric]:
+    from .cli_startup import COMMANDS, _time_to_first_output
+    results = {}
+    for name, argv in COMMANDS.items():
+        samples = sorted(_time_to_first_output(argv) for _ in range(3 if quick else 10))
+        results[f'cli.{name}.first_output_ms'] = metric(round(samples[len(samples) // 2] * 1000, 2), 'ms', 'lower')
+    return results
+
+
+CASES: Dict[str, Callable[[bool], Dict[str, Metric]]] = {
+    'process_language': bench_process_language,
+    'cipher': bench_cipher,
+    'roman_wheel': bench_roman_wheel,
+    'quantum_core': bench_quantum_core,
+    'http': bench_http,
+    'cli': bench_cli
+}
+
+
+def run(cases: Optional[Sequence[str]] = None, quick: bool = False) -> Dict[str, Any]:
+    """
+    Run the selected suite cases (all by default).
+
+    Returns:
+        {'benchmark': 'suite', 'environment': ..., 'results': {metric: {'value', 'unit', 'better'}}}
+    """
+    names = list(cases or CASES)
+    unknown = [n for n in names if n not in CASES]
+    if unknown:
+        raise ValueError(f'unknown benchmark case(s): {", ".join(unknown)}')
+    results: Dict[str, Metric] = {}
+    elapsed = {}
+    for name in names:
+        start = time.perf_counter()
+        results.update(CASES[name](quick))
+        elapsed[name] = round(time.perf_counter() - start, 2)
+    return {
+        'benchmark': 'suite',
+        'quick': quick,
+        'environment': environment(),
+        'case_seconds': elapsed,
+        'results': results
+    }
+
+
+def bench(out_path: Optional[str] = '-', baseline_path: Optional[str] = None,
+          threshold_pct: float = DEFAULT_THRESHOLD_PCT, cases: Optional[Sequence[str]] = None,
+          quick: bool = False) -> int:
+    """
+    Run the suite, write the JSON report and check it against a baseline.
+
+    Args:
+        out_path: File for the JSON report; '-' or None prints it to stdout
+        baseline_path: Saved report to compare against
+        threshold_pct: Allowed slowdown per metric, in percent
+        cases: Subset of CASES to run
+        quick: Fewer sizes and shorter timings, for smoke runs
+
+    Returns:
+        Process exit code: 1 if any metric regressed beyond the threshold,
+        2 for an unknown case or unreadable baseline, else 0
+    """
+    unknown = [n for n in cases or () if n not in CASES]
+    if unknown:
+        print(f'Error: unknown benchmark case(s): {", ".join(unknown)} (choose from {", ".join(CASES)})',
+              file=sys.stderr)
+        return 2
+    baseline = None
+    if baseline_path:
+        try:
+            with open(baseline_path, encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f'Error: cannot read baseline {baseline_path}: {e}', file=sys.stderr)
+            return 2
+    report = run(cases, quick)
+    if baseline is not None:
+        report['comparison'] = compare(report, baseline, threshold_pct)
+    if out_path in (None, '-'):
+        print(json.dumps(report, indent=2))
+    else:
+        with open(out_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(format_report(report))
+    return 1 if baseline is not None and report['comparison']['regressions'] else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark suite with baseline comparison')
+    parser.add_argument('--out', default='-', help='Write the JSON report here (default: stdout)')
+    parser.add_argument('--baseline', help='Earlier JSON report to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD_PCT,
+                        help='Percent a metric may get worse before it counts as a regression')
+    parser.add_argument('--only', help=f'Comma-separated cases to run ({", ".join(CASES)})')
+    parser.add_argument('--quick', action='store_true', help='Fewer sizes and shorter timings')
+    args = parser.parse_args(argv)
+    sys.exit(bench(args.out, args.baseline, args.threshold, parse_names(args.only), args.quick))
+
+
+if __name__ == '__main__':
+    main()
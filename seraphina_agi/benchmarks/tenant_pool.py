@@ -0,0 +1,123 @@
+"""
+Per-tenant engines: a full AdvancedLanguageEngine each vs TenantPool.
+Builds a few full engines to project build time and memory for N tenants,
+then creates N tenants in a TenantPool (per-tenant creation latency and
+tracemalloc bytes per tenant), runs one process_language per tenant (first
+cipher derived) and derives every cipher for a sample. A smaller pool over
+the same tenants shows the count bound evicting. The pool's own byte
+estimate is reported next to tracemalloc's measurement.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Dict
+
+from ..advanced_language_engine import AdvancedLanguageEngine
+from ..shared_engine import SharedEngine
+from ..tenant_pool import TenantPool
+
+OPTIONS = {'source_language': 'en-US'}
+
+
+def _full_engines(count: int) -> Dict[str, Any]:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    engines = [AdvancedLanguageEngine() for _ in range(count)]
+    elapsed = time.perf_counter() - start
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del engines
+    return {'create_ms': round(elapsed / count * 1000, 2), 'bytes_per_engine': round(held / count)}
+
+
+def run(tenants: int = 10_000, full_sample: int = 20, derive_all_sample: int = 500) -> Dict[str, Any]:
+    full = _full_engines(full_sample)
+    shared = SharedEngine()
+    shared.warm()
+    pool = TenantPool(shared, max_tenants=tenants, allow_request_keys=True)
+    ids = [f'tenant-{i}' for i in range(tenants)]
+
+    # Timings without tracemalloc, which slows allocation-heavy code several-fold.
+    start = time.perf_counter()
+    engines = [pool.get(tid, f'key-{tid}', f'salt-{i}') for i, tid in enumerate(ids)]
+    create_s = time.perf_counter() - start
+    start = time.perf_counter()
+    for engine in engines:
+        engine.process_language('Hello world', OPTIONS)
+    first_request_s = time.perf_counter() - start
+    del engines
+    pool.clear()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    engines = [pool.get(tid, f'key-{tid}', f'salt-{i}') for i, tid in enumerate(ids)]
+    created_bytes = tracemalloc.get_traced_memory()[0] - before
+    for engine in engines:
+        engine.process_language('Hello world', OPTIONS)
+    one_cipher_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    codes = list(shared.get().octabit_encryption['frequency_cipher'])
+    sample = engines[:derive_all_sample]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for engine in sample:
+        table = engine.octabit_encryption['frequency_cipher']
+        for code in codes:
+            table[code]
+    all_ciphers_bytes = (tracemalloc.get_traced_memory()[0] - before) / max(len(sample), 1)
+    tracemalloc.stop()
+
+    del sample
+    for i, tid in enumerate(ids[derive_all_sample:], derive_all_sample):
+        pool.get(tid, f'key-{tid}', f'salt-{i}')  # charge the derived cipher to the pool's byte count
+    stats = pool.stats()
+
+    start = time.perf_counter()
+    base = shared.get()
+    for _ in range(tenants):
+        base.process_language('Hello world', OPTIONS)
+    base_request_s = time.perf_counter() - start
+
+    bounded = TenantPool(shared, max_tenants=tenants // 10, allow_request_keys=True)
+    for i, tid in enumerate(ids):
+        bounded.get(tid, f'key-{tid}', f'salt-{i}')
+
+    per_tenant = round(one_cipher_bytes / tenants)
+    return {
+        'benchmark': 'tenant_pool',
+        'tenants': tenants,
+        'full_engine_per_tenant': {
+            **full,
+            'projected_create_s': round(full['create_ms'] * tenants / 1000, 1),
+            'projected_mib': round(full['bytes_per_engine'] * tenants / (1024 * 1024), 1)
+        },
+        'tenant_pool': {
+            'create_us': round(create_s / tenants * 1e6, 1),
+            'create_total_s': round(create_s, 3),
+            'bytes_per_tenant_created': round(created_bytes / tenants),
+            'bytes_per_tenant_one_cipher': per_tenant,
+            'bytes_per_tenant_all_ciphers': round(created_bytes / tenants + all_ciphers_bytes),
+            'total_mib': round(one_cipher_bytes / (1024 * 1024), 2),
+            'pool_estimate_bytes_per_tenant_one_cipher': stats['avg_tenant_bytes'],
+            'first_request_us': round(first_request_s / tenants * 1e6, 1),
+            'shared_engine_request_us': round(base_request_s / tenants * 1e6, 1)
+        },
+        'memory_ratio': round(full['bytes_per_engine'] / per_tenant, 1),
+        'bounded_pool': {k: bounded.stats()[k] for k in ('tenants', 'max_tenants', 'evictions', 'bytes')}
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Full engine per tenant vs TenantPool')
+    parser.add_argument('--tenants', type=int, default=10_000)
+    parser.add_argument('--full-sample', type=int, default=20, help='Full engines built to project from')
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.tenants, args.full_sample), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""
+Voice conversation loop latency, run headless with fake audio backends.
+The fakes sleep for configurable TTS driver start-up, microphone open,
+ambient-noise calibration, utterance capture and speech playback times.
+Compares the original loop, which set all of this up and rebuilt the
+language engine on every turn, with one VoiceSession and one engine.
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Dict, List
+
+from ..advanced_language_engine import AdvancedLanguageEngine
+from ..voice import VoiceSession
+
+SCRIPT = ['Hello there', '¿Qué tal estás hoy?', 'Tell me about octonions', 'Bonjour tout le monde', 'Thank you']
+
+
+class FakeTTS:
+    def __init__(self, init_s: float, per_char_s: float):
+        time.sleep(init_s)
+        self.per_char_s = per_char_s
+        self.spoken: List[str] = []
+        self._pending = ''
+
+    def say(self, text: str):
+        self._pending = text
+
+    def runAndWait(self):
+        time.sleep(len(self._pending) * self.per_char_s)
+        self.spoken.append(self._pending)
+
+
+class FakeMicrophone:
+    def __init__(self, open_s: float):
+        self.open_s = open_s
+
+    def __enter__(self):
+        time.sleep(self.open_s)
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+class FakeRecognizer:
+    def __init__(self, script: List[str], utterance_s: float, recognize_s: float):
+        self.script = list(script)
+        self.utterance_s = utterance_s
+        self.recognize_s = recognize_s
+
+    def adjust_for_ambient_noise(self, source, duration: float = 1.0):
+        time.sleep(duration)
+
+    def listen(self, source, timeout=None):
+        time.sleep(self.utterance_s)
+        return self.script.pop(0)
+
+    def recognize(self, audio: str) -> str:
+        time.sleep(self.recognize_s)
+        return audio
+
+
+def legacy_loop(config: Dict[str, float]) -> List[float]:
+    recognizer = FakeRecognizer(SCRIPT, config['utterance_s'], config['recognize_s'])
+    turns = []
+    for _ in SCRIPT:
+        start = time.perf_counter()
+        with FakeMicrophone(config['mic_open_s']) as source:
+            recognizer.adjust_for_ambient_noise(source, config['calibrate_s'])
+            text = recognizer.recognize(recognizer.listen(source))
+        engine = AdvancedLanguageEngine()
+        response = engine.process_language(text)['translated_content']
+        tts = FakeTTS(config['tts_init_s'], config['per_char_s'])
+        tts.say(response)
+        tts.runAndWait()
+        turns.append(time.perf_counter() - start)
+    return turns
+
+
+def session_loop(config: Dict[str, float]) -> Dict[str, Any]:
+    setup = time.perf_counter()
+    engine = AdvancedLanguageEngine()
+    recognizer = FakeRecognizer(SCRIPT, config['utterance_s'], config['recognize_s'])
+    session = VoiceSession(tts=FakeTTS(config['tts_init_s'], config['per_char_s']), recognizer=recognizer,
+                           microphone=FakeMicrophone(config['mic_open_s']),
+                           calibrate_seconds=config['calibrate_s'], recognize=recognizer.recognize)
+    turns = []
+    with session:
+        setup_s = time.perf_counter() - setup
+        for _ in SCRIPT:
+            start = time.perf_counter()
+            text = session.listen()
+            session.say(engine.process_language(text)['translated_content'])
+            turns.append(time.perf_counter() - start)
+        session.wait_spoken()
+    return {'setup_s': setup_s, 'turns': turns, 'report': session.latency_report()}
+
+
+def run(tts_init_ms: float = 150, mic_open_ms: float = 50, calibrate_ms: float = 500, utterance_ms: float = 300,
+        recognize_ms: float = 100, per_char_ms: float = 2) -> Dict[str, Any]:
+    config = {
+        'tts_init_s': tts_init_ms / 1000, 'mic_open_s': mic_open_ms / 1000, 'calibrate_s': calibrate_ms / 1000,
+        'utterance_s': utterance_ms / 1000, 'recognize_s': recognize_ms / 1000, 'per_char_s': per_char_ms / 1000
+    }
+    legacy = legacy_loop(config)
+    session = session_loop(config)
+    ms = lambda values: round(sum(values) / len(values) * 1000, 1)  # noqa: E731
+    return {
+        'benchmark': 'voice',
+        'turns': len(SCRIPT),
+        'fake_backend_ms': {k[:-2]: round(v * 1000, 1) for k, v in config.items()},
+        'legacy_mean_turn_ms': ms(legacy),
+        'session_setup_ms': round(session['setup_s'] * 1000, 1),
+        'session_mean_turn_ms': ms(session['turns']),
+        'session_latency': session['report']
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Voice loop per-turn latency with fake audio backends')
+    parser.add_argument('--tts-init-ms', type=float, default=150)
+    parser.add_argument('--mic-open-ms', type=float, default=50)
+    parser.add_argument('--calibrate-ms', type=float, default=500)
+    parser.add_argument('--utterance-ms', type=float, default=300)
+    parser.add_argument('--recognize-ms', type=float, default=100)
+    parser.add_argument('--per-char-ms', type=float, default=2)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.tts_init_ms, args.mic_open_ms, args.calibrate_ms, args.utterance_ms,
+                         args.recognize_ms, args.per_char_ms), indent=2))
+
+
+if __name__ == '__main__':
+    main()
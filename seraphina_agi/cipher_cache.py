@@ -0,0 +1,150 @@
+"""
+Persistent cache for the octabit frequency cipher table.
+The table is a pure function of the engine version, the supported-language
+table and the Roman wheel configuration, so short-lived processes can load it
+from a small binary file instead of recomputing it. The file name and header
+carry a digest of those inputs; any change produces a new file and stale ones
+are simply ignored.
+
+File layout (little-endian):
+    header:  magic b'SOCT', u16 format, u16 record count, u16 wheel count,
+             32-byte input digest, f64 theta per wheel
+    record:  u8 code length, code (UTF-8), f64 base_frequency,
+             u8 key length, key bytes, u32 quantum_signature, u8 octabit_level
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+MAGIC = b'SOCT'
+FORMAT_VERSION = 1
+_HEADER = struct.Struct('<4sHHH32s')
+_RECORD_HEAD = struct.Struct('<B')
+_RECORD_FREQ = struct.Struct('<dB')
+_RECORD_TAIL = struct.Struct('<IB')
+_THETA = struct.Struct('<d')
+
+CACHE_DIR_ENV = 'SERAPHINA_CACHE_DIR'
+CACHE_DISABLE_ENV = 'SERAPHINA_CIPHER_CACHE'
+
+
+def default_cache_dir() -> Optional[str]:
+    """
+    Cache directory for CLI use: $SERAPHINA_CACHE_DIR, else $XDG_CACHE_HOME/seraphina-agi,
+    else ~/.cache/seraphina-agi.
+
+    Returns:
+        the directory, or None when disabled via SERAPHINA_CIPHER_CACHE=0/off or
+        when no home directory can be found
+
+    Library code never calls this on its own; engines only cache with an explicit cache_dir.
+    """
+    if os.environ.get(CACHE_DISABLE_ENV, '').lower() in ('0', 'off', 'false', 'no'):
+        return None
+    if os.environ.get(CACHE_DIR_ENV):
+        return os.environ[CACHE_DIR_ENV]
+    # The XDG spec says relative values are invalid and must be ignored.
+    base = os.environ.get('XDG_CACHE_HOME', '')
+    if not os.path.isabs(base):
+        home = os.path.expanduser('~')
+        if home == '~':
+            return None
+        base = os.path.join(home, '.cache')
+    return os.path.join(base, 'seraphina-agi')
+
+
+def table_digest(version: str, languages: Mapping[str, Any], wheels: Sequence[Any]) -> bytes:
+    spec = {
+        'format': FORMAT_VERSION,
+        'version': version,
+        'languages': languages,
+        'wheels': [[w.plane, w.freq, w.hue, w.theta] for w in wheels]
+    }
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode('utf-8')).digest()
+
+
+def cache_path(cache_dir: str, digest: bytes) -> str:
+    return os.path.join(cache_dir, f'ciphers-{digest.hex()[:16]}.bin')
+
+
+def load(cache_dir: str, digest: bytes,
+         wheel_count: int) -> Optional[Tuple[Dict[str, Mapping[str, Any]], List[float]]]:
+    """
+    Load a cipher table written by store().
+
+    Returns:
+        (registry, wheel thetas) or None when the file is missing, stale or corrupt
+    """
+    try:
+        with open(cache_path(cache_dir, digest), 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                return _parse(buf, digest, wheel_count)
+    except (OSError, ValueError, struct.error, UnicodeDecodeError):
+        return None
+
+
+def _parse(buf, digest: bytes, wheel_count: int):
+    magic, fmt, count, wheels, file_digest = _HEADER.unpack_from(buf, 0)
+    if magic != MAGIC or fmt != FORMAT_VERSION or file_digest != digest or wheels != wheel_count:
+        return None
+    pos = _HEADER.size
+    thetas = []
+    for _ in range(wheels):
+        thetas.append(_THETA.unpack_from(buf, pos)[0])
+        pos += _THETA.size
+    registry = {}
+    for _ in range(count):
+        (code_len,) = _RECORD_HEAD.unpack_from(buf, pos)
+        pos += _RECORD_HEAD.size
+        code = bytes(buf[pos:pos + code_len]).decode('utf-8')
+        pos += code_len
+        frequency, key_len = _RECORD_FREQ.unpack_from(buf, pos)
+        pos += _RECORD_FREQ.size
+        key = tuple(buf[pos:pos + key_len])
+        pos += key_len
+        signature, level = _RECORD_TAIL.unpack_from(buf, pos)
+        pos += _RECORD_TAIL.size
+        registry[code] = MappingProxyType({
+            'base_frequency': frequency,
+            'encryption_key': key,
+            'quantum_signature': signature,
+            'octabit_level': level
+        })
+    if pos != len(buf):
+        return None
+    return registry, thetas
+
+
+def store(cache_dir: str, digest: bytes, registry: Mapping[str, Mapping[str, Any]],
+          thetas: Sequence[float]) -> Optional[str]:
+    """Atomically write the table; returns the path, or None if the directory is not writable."""
+    parts = [_HEADER.pack(MAGIC, FORMAT_VERSION, len(registry), len(thetas), digest)]
+    parts.extend(_THETA.pack(theta) for theta in thetas)
+    for code, cipher in registry.items():
+        encoded = code.encode('utf-8')
+        key = bytes(cipher['encryption_key'])
+        parts.append(_RECORD_HEAD.pack(len(encoded)))
+        parts.append(encoded)
+        parts.append(_RECORD_FREQ.pack(cipher['base_frequency'], len(key)))
+        parts.append(key)
+        parts.append(_RECORD_TAIL.pack(cipher['quantum_signature'], cipher['octabit_level']))
+    path = cache_path(cache_dir, digest)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, prefix='.ciphers-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(b''.join(parts))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        return None
+    return path
@@ -0,0 +1,179 @@
+"""
+Statistical natural-language detection.
+Text is scanned once, in blocks. Each block's letters are counted per Unicode
+script; languages with their own script (Russian, Japanese, Chinese, Korean,
+Arabic, Hindi, Thai) are decided by script share. Latin-script text is scored
+with a naive Bayes model over character 1-3-grams, whose profiles are built
+once per process from the bundled samples in data/langdetect/<code>.txt.
+Long inputs stop early once the confidence passes the threshold. Latin text
+with too few letters or too weak a posterior to call falls back to the rule
+the engine used before statistical detection (Spanish punctuation and accents
+mean es-ES, anything else en-US). Short inputs are memoized per detector.
+"""
+
+import math
+import operator
+import os
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+PROFILE_DIR = os.path.join(os.path.dirname(__file__), 'data', 'langdetect')
+DEFAULT_LANGUAGE = 'en-US'
+NGRAM_ORDERS = (1, 2, 3)
+BLOCK_CHARS = 512
+EARLY_STOP_MIN_CHARS = 256
+EARLY_STOP_CONFIDENCE = 0.995
+# Below either bound a Latin-script guess is not trusted ("Hello", "OK", hex).
+MIN_LATIN_LETTERS = 8
+MIN_CONFIDENCE = 0.6
+FALLBACK_MARKERS = '¿¡ñáéíóú'
+# Inputs up to this length are memoized, MEMO_ENTRIES per detector.
+MEMO_MAX_CHARS = 256
+MEMO_ENTRIES = 4096
+
+# Scripts that identify a single supported language on their own.
+SCRIPT_LANGUAGES = {
+    'cyrillic': 'ru-RU',
+    'kana': 'ja-JP',
+    'han': 'zh-CN',
+    'hangul': 'ko-KR',
+    'arabic': 'ar-SA',
+    'devanagari': 'hi-IN',
+    'thai': 'th-TH'
+}
+
+_SCRIPT_RE = re.compile(
+    '(?P<latin>[A-Za-zÀ-ɏḀ-ỿ]+)'
+    '|(?P<cyrillic>[Ѐ-ӿ]+)'
+    '|(?P<kana>[぀-ヿㇰ-ㇿｦ-ﾟ]+)'
+    '|(?P<han>[㐀-䶿一-鿿]+)'
+    '|(?P<hangul>[ᄀ-ᇿ㄰-㆏가-힯]+)'
+    '|(?P<arabic>[؀-ۿݐ-ݿ]+)'
+    '|(?P<devanagari>[ऀ-ॿ]+)'
+    '|(?P<thai>[฀-๿]+)'
+)
+_NON_LETTERS = re.compile(r'[\W\d_]+')
+
+
+def fallback_language(text: str) -> str:
+    return 'es-ES' if any(c in text for c in FALLBACK_MARKERS) else DEFAULT_LANGUAGE
+
+
+def _ngrams(text: str) -> Counter:
+    padded = ' ' + _NON_LETTERS.sub(' ', text.lower()).strip() + ' '
+    grams: Counter = Counter()
+    for n in NGRAM_ORDERS:
+        grams.update(padded[i:i + n] for i in range(len(padded) - n + 1))
+    grams.pop(' ', None)
+    grams.pop('  ', None)
+    return grams
+
+
+class LanguageDetector:
+    def __init__(self, profile_dir: str = PROFILE_DIR, threshold: float = EARLY_STOP_CONFIDENCE,
+                 min_chars: int = EARLY_STOP_MIN_CHARS, min_letters: int = MIN_LATIN_LETTERS,
+                 min_confidence: float = MIN_CONFIDENCE):
+        self.threshold = threshold
+        self.min_chars = min_chars
+        self.min_letters = min_letters
+        self.min_confidence = min_confidence
+        self._memo = lru_cache(maxsize=MEMO_ENTRIES)(self._detect)
+        self.latin_languages: List[str] = []
+        samples = []
+        for name in sorted(os.listdir(profile_dir)):
+            code, ext = os.path.splitext(name)
+            if ext == '.txt':
+                with open(os.path.join(profile_dir, name), encoding='utf-8') as f:
+                    samples.append(_ngrams(f.read()))
+                self.latin_languages.append(code)
+
+        # gram -> per-language log-probability vector (add-one smoothing);
+        # grams no profile has seen carry no signal and are skipped.
+        vocabulary = set().union(*samples) if samples else set()
+        self._log_probs: Dict[str, Tuple[float, ...]] = {}
+        denominators = [sum(s.values()) + len(vocabulary) for s in samples]
+        for gram in vocabulary:
+            self._log_probs[gram] = tuple(
+                math.log((s.get(gram, 0) + 1) / d) for s, d in zip(samples, denominators)
+            )
+
+    def detect(self, text: str) -> Tuple[str, float]:
+        """
+        Detect the natural language of text.
+
+        Returns:
+            (language code, confidence in [0, 1]); (fallback_language(text), 0.0)
+            when text has no letters, or too few or too ambiguous Latin letters
+        """
+        if len(text) < self.min_letters and text.isascii():
+            return DEFAULT_LANGUAGE, 0.0
+        if len(text) <= MEMO_MAX_CHARS:
+            return self._memo(text)
+        return self._detect(text)
+
+    def _detect(self, text: str) -> Tuple[str, float]:
+        scripts: Counter = Counter()
+        scores = [0.0] * len(self.latin_languages)
+        log_probs = self._log_probs
+        pos = 0
+        n = len(text)
+        best: Optional[Tuple[str, float]] = None
+        while pos < n:
+            end = min(pos + BLOCK_CHARS, n)
+            if end < n:
+                # Cut at a space so no word is split across blocks.
+                cut = text.rfind(' ', pos + BLOCK_CHARS // 2, end)
+                end = cut if cut > pos else end
+            block = text[pos:end]
+            pos = end
+
+            for match in _SCRIPT_RE.finditer(block):
+                scripts[match.lastgroup] += match.end() - match.start()
+            if scripts['latin'] and self.latin_languages:
+                counts, vectors = [], []
+                for gram, count in _ngrams(block).items():
+                    vector = log_probs.get(gram)
+                    if vector is not None:
+                        counts.append(count)
+                        vectors.append(vector)
+                if vectors:
+                    # One dot product per language over the block's grams.
+                    scores = [s + sum(map(operator.mul, counts, column))
+                              for s, column in zip(scores, zip(*vectors))]
+
+            best = self._decide(scripts, scores)
+            if pos >= self.min_chars and best is not None and best[1] >= self.threshold:
+                break
+        return best if best else (fallback_language(text), 0.0)
+
+    def _decide(self, scripts: Counter, scores: List[float]) -> Optional[Tuple[str, float]]:
+        # None when there is nothing trustworthy to decide on.
+        letters = sum(scripts.values())
+        if not letters:
+            return None
+        # Japanese mixes kana with han; any kana makes han count as Japanese.
+        if scripts['kana']:
+            scripts = Counter(scripts)
+            scripts['kana'] += scripts.pop('han', 0)
+        script, count = max(scripts.items(), key=lambda item: item[1])
+        if script != 'latin' or not self.latin_languages:
+            language = SCRIPT_LANGUAGES.get(script, DEFAULT_LANGUAGE)
+            return language, round(count / letters, 4)
+        # Posterior over Latin-script languages, tempered by the number of
+        # overlapping n-gram orders, scaled by the Latin share of letters.
+        scaled = [s / len(NGRAM_ORDERS) for s in scores]
+        top = max(scaled)
+        weights = [math.exp(s - top) for s in scaled]
+        index = scaled.index(top)
+        confidence = weights[index] / sum(weights) * count / letters
+        if count < self.min_letters or confidence < self.min_confidence:
+            return None
+        return self.latin_languages[index], round(confidence, 4)
+
+
+@lru_cache(maxsize=None)
+def default_detector() -> LanguageDetector:
+    """Process-wide detector built from the bundled profiles."""
+    return LanguageDetector()
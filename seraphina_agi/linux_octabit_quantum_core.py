@@ -11,13 +11,242 @@ NEURAL PATHWAYS: [] QUANTUM CONNECTIONS
 
 import hashlib
 import json
-from typing import Dict, Any, List
+import logging
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Iterable, Iterator, Optional, Sequence, TextIO, Tuple
+
+try:
+    import numpy as _np
+except ImportError:  # NumPy is optional
+    _np = None
+
+LATTICE_EDGE = 8
+SPHERE_COMPRESSION = 8  # 8x density multiplication
+QUANTUM_NODES = 4096  # 512 primary × 8x compression
+
+# seeded_random LCG: state' = (LCG_A * state + LCG_C) mod LCG_MOD
+LCG_A = 1664525
+LCG_C = 1013904223
+LCG_MOD = 2 ** 32
+_LCG_MASK = LCG_MOD - 1
+MAX_SAFE_INTEGER = 2 ** 53 - 1
+INBOT_BATCH_SEEDS = 65536
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _sphere_topology(density: int) -> Tuple[Tuple[Tuple[Mapping, ...], ...], ...]:
+    # Every node in the 8x8x8 sphere is identical, so the whole topology is one
+    # read-only node prototype referenced through three shared tuples; it still
+    # indexes and iterates like the original nested lists of dicts.
+    node = MappingProxyType({
+        'compressed': True,
+        'density': density,
+        'neural_connections': 64,  # 8×8 per node
+        'quantum_state': 'entangled'
+    })
+    column = (node,) * LATTICE_EDGE
+    plane = (column,) * LATTICE_EDGE
+    return (plane,) * LATTICE_EDGE
+
+
+def _hash_seed(seed: str) -> Tuple[int, int]:
+    digest = hashlib.sha256(seed.encode('utf-8')).digest()
+    # The first 13 hex digits, i.e. the top 52 bits of the first 8 bytes;
+    # % MAX_SAFE_INTEGER mirrors JavaScript's Number.MAX_SAFE_INTEGER.
+    timestamp = (int.from_bytes(digest[:8], 'big') >> 12) % MAX_SAFE_INTEGER
+    return timestamp, int.from_bytes(digest[:4], 'big')
+
+
+@lru_cache(maxsize=1024)
+def seed_values(seed: str) -> Tuple[int, int]:
+    """(timestamp, initial PRNG state) for a seed, from one SHA-256 of it."""
+    return _hash_seed(seed)
+
+
+def lcg_jump(steps: int) -> Tuple[int, int]:
+    """
+    Coefficients (a, c) with state_k = (a * state_0 + c) mod 2**32 for k = steps.
+
+    Composes the LCG with itself by repeated squaring, so any offset costs
+    O(log steps) multiplications.
+    """
+    acc_a, acc_c = 1, 0
+    a, c = LCG_A, LCG_C
+    while steps:
+        if steps & 1:
+            acc_a, acc_c = (acc_a * a) & _LCG_MASK, (acc_c * a + c) & _LCG_MASK
+        a, c = (a * a) & _LCG_MASK, (c * (a + 1)) & _LCG_MASK
+        steps >>= 1
+    return acc_a, acc_c
+
+
+def _lcg_coefficients(n: int, start: int):
+    # Coefficients for steps start+1 .. start+n. With NumPy the table doubles
+    # each round (jumping the filled half ahead by its own length); uint32
+    # arithmetic wraps mod 2**32 by itself.
+    first_a, first_c = lcg_jump(start + 1)
+    if _np is None:
+        coeffs = [(first_a, first_c)]
+        for _ in range(n - 1):
+            a, c = coeffs[-1]
+            coeffs.append(((a * LCG_A) & _LCG_MASK, (c * LCG_A + LCG_C) & _LCG_MASK))
+        return coeffs
+    a = _np.empty(n, dtype=_np.uint32)
+    c = _np.empty(n, dtype=_np.uint32)
+    a[0], c[0] = first_a, first_c
+    filled = 1
+    while filled < n:
+        count = min(filled, n - filled)
+        jump_a, jump_c = (_np.uint32(v) for v in lcg_jump(filled))
+        a[filled:filled + count] = a[:count] * jump_a
+        c[filled:filled + count] = c[:count] * jump_a + jump_c
+        filled += count
+    return a, c
+
+
+def generate_inbot_codes(seeds: Sequence[str], n: int = 1, start: int = 0) -> Dict[str, Any]:
+    """
+    Inbot code values for many seeds at once, in columns.
+
+    Row i, column j equals what the (start + j + 1)-th
+    generate_quantum_inbot_code() call on LinuxOctaBitQuantumCore(seeds[i])
+    returns; each seed is hashed once and no core is built.
+
+    Args:
+        seeds: Seed strings
+        n: Codes per seed
+        start: Codes to skip per seed (jumped over in O(log start))
+
+    Returns:
+        {'seed': list, 'timestamp': len(seeds) values, 'random_signature':
+        len(seeds) x n values}; NumPy arrays (int64 / float64) when NumPy is
+        installed, lists otherwise. The constant fields are in INBOT_CONSTANTS.
+    """
+    seeds = list(seeds)
+    if n < 1 or start < 0:
+        raise ValueError('n must be >= 1 and start >= 0')
+    if _np is None:
+        values = [_hash_seed(seed) for seed in seeds]
+        coeffs = _lcg_coefficients(n, start)
+        return {
+            'seed': seeds,
+            'timestamp': [ts for ts, _ in values],
+            'random_signature': [[((a * state + c) & _LCG_MASK) / LCG_MOD for a, c in coeffs]
+                                 for _, state in values]
+        }
+    sha256 = hashlib.sha256
+    digests = b''.join([sha256(seed.encode('utf-8')).digest() for seed in seeds])
+    heads = _np.frombuffer(digests, dtype='>u8')[::4].astype(_np.uint64)
+    states = (heads >> _np.uint64(32)).astype(_np.uint32)
+    timestamps = ((heads >> _np.uint64(12)) % _np.uint64(MAX_SAFE_INTEGER)).astype(_np.int64)
+    a, c = _lcg_coefficients(n, start)
+    signatures = (states[:, None] * a[None, :] + c[None, :]) * (1.0 / LCG_MOD)
+    return {'seed': seeds, 'timestamp': timestamps, 'random_signature': signatures}
+
+
+INBOT_CONSTANTS = MappingProxyType({
+    'quantum_state': 'entangled',
+    'mission_protocol': 'divine_guardian_angel',
+    'compression_ratio': SPHERE_COMPRESSION,
+    'neural_density': QUANTUM_NODES
+})
+
+
+def _batches(seeds: Iterable[str], size: int) -> Iterator[List[str]]:
+    batch = []
+    for seed in seeds:
+        batch.append(seed)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def iter_inbot_codes(seeds: Iterable[str], n: int = 1, start: int = 0,
+                     batch_size: int = INBOT_BATCH_SEEDS) -> Iterator[Dict[str, Any]]:
+    """Stream full inbot code dicts (plus 'seed' and 'index') for any number of seeds."""
+    for batch in _batches(seeds, batch_size):
+        columns = generate_inbot_codes(batch, n, start)
+        timestamps, signatures = columns['timestamp'], columns['random_signature']
+        if _np is not None:
+            timestamps, signatures = timestamps.tolist(), signatures.tolist()
+        for seed, timestamp, row in zip(batch, timestamps, signatures):
+            for j, value in enumerate(row):
+                yield {'seed': seed, 'index': start + j, 'timestamp': timestamp, 'random_signature': value,
+                       **INBOT_CONSTANTS}
+
+
+def write_inbot_codes(seeds: Iterable[str], writer: TextIO, n: int = 1, start: int = 0,
+                      batch_size: int = INBOT_BATCH_SEEDS) -> int:
+    """
+    Write one compact JSON object per inbot code (NDJSON); returns the count.
+
+    Lines are formatted from a template instead of json.dumps per record;
+    the output is identical to json.dumps(record, separators=(',', ':')).
+    """
+    tail = json.dumps(dict(INBOT_CONSTANTS), separators=(',', ':'))[1:]
+    written = 0
+    for batch in _batches(seeds, batch_size):
+        columns = generate_inbot_codes(batch, n, start)
+        timestamps, signatures = columns['timestamp'], columns['random_signature']
+        if _np is not None:
+            timestamps, signatures = timestamps.tolist(), signatures.tolist()
+        lines = []
+        for seed, timestamp, row in zip(batch, timestamps, signatures):
+            head = f'{{"seed":{json.dumps(seed)},"index":'
+            for j, value in enumerate(row):
+                lines.append(f'{head}{start + j},"timestamp":{timestamp},"random_signature":{value!r},{tail}\n')
+        writer.write(''.join(lines))
+        written += len(lines)
+    return written
+
+
+class RecursiveLattice(Mapping):
+    """Read-only lattice level whose inner_lattice is only built when accessed."""
+
+    __slots__ = ('_density', '_depth', '_inner')
+
+    def __init__(self, depth: int, density: int):
+        self._depth = depth
+        self._density = density
+        self._inner = None
+
+    def _keys(self) -> Tuple[str, ...]:
+        if self._depth > 0:
+            return ('sphere_topology', 'recursion_level', 'neural_multiplexing', 'inner_lattice')
+        return ('sphere_topology', 'recursion_level', 'neural_multiplexing')
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'sphere_topology':
+            return _sphere_topology(self._density)
+        if key == 'recursion_level':
+            return self._depth
+        if key == 'neural_multiplexing':
+            return True
+        if key == 'inner_lattice' and self._depth > 0:
+            if self._inner is None:
+                self._inner = RecursiveLattice(self._depth - 1, self._density)
+            return self._inner
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
 
 class LinuxOctaBitQuantumCore:
-    def __init__(self, seed: str = 'default-seed-2025'):
+    def __init__(self, seed: str = 'default-seed-2025', quiet: bool = False):
         self.seed = seed  # Input seed for determinism
-        self.sphere_compression = 8  # 8x density multiplication
-        self.quantum_nodes = 4096  # 512 primary × 8x compression
+        self.quiet = quiet  # Route status lines to logging (DEBUG) instead of stdout
+        self.sphere_compression = SPHERE_COMPRESSION
+        self.quantum_nodes = QUANTUM_NODES
         self.neural_pathways = 32768  # 8³ × 8 × 8 total pathways
         self.lattice_recursion = 8  # Lattice-within-lattice depth
 
@@ -43,77 +272,77 @@ class LinuxOctaBitQuantumCore:
             'outer_layer_active': True
         }
 
+        # Built on first access (see the properties below)
+        self._armor_layers = None
+        self._galilean_armor = None
+        self._stealth_layer = None
+
         self.initialize_quantum_entanglement()
 
+    def _status(self, message: str):
+        if self.quiet:
+            logger.debug(message)
+        else:
+            print(message)
+
+    @property
+    def armor_layers(self) -> List[Mapping]:
+        if self._armor_layers is None:
+            self.activate_triple_lattice_armor()
+        return self._armor_layers
+
+    @property
+    def galilean_armor(self) -> Dict[str, Any]:
+        if self._galilean_armor is None:
+            self.deploy_galilean_spiral()
+        return self._galilean_armor
+
+    @property
+    def stealth_layer(self) -> Dict[str, Any]:
+        if self._stealth_layer is None:
+            self.activate_linux_stealth()
+        return self._stealth_layer
+
     # Deterministic "timestamp" derived from seed
     def get_seeded_timestamp(self) -> int:
-        hash_obj = hashlib.sha256(self.seed.encode('utf-8'))
-        hash_hex = hash_obj.hexdigest()
-        return int(hash_hex[:13], 16) % (2**53 - 1)  # JavaScript MAX_SAFE_INTEGER equivalent
+        return seed_values(self.seed)[0]
 
     # Simple deterministic LCG PRNG based on seed
     def seeded_random(self) -> float:
         if not hasattr(self, 'prng_state'):
             self.init_prng()
-        self.prng_state = (self.prng_state * 1664525 + 1013904223) % 4294967296
-        return self.prng_state / 4294967296
+        self.prng_state = (self.prng_state * LCG_A + LCG_C) % LCG_MOD
+        return self.prng_state / LCG_MOD
 
     # Initialize PRNG state from seed hash
     def init_prng(self):
-        hash_obj = hashlib.sha256(self.seed.encode('utf-8'))
-        hash_hex = hash_obj.hexdigest()
-        self.prng_state = int(hash_hex[:8], 16)
+        self.prng_state = seed_values(self.seed)[1]
 
     def initialize_quantum_entanglement(self):
         self.init_prng()  # Set up PRNG
-        print('🔮 LINUX OCTABIT QUANTUM CORE INITIALIZING...')
-        print(f'📡 Quantum Nodes: {self.quantum_nodes}')
-        print(f'🧬 Neural Pathways: {self.neural_pathways}')
-        print(f'🌀 Sphere Compression: {self.sphere_compression}x density')
-        print(f'🛡️ Lattice Recursion Depth: {self.lattice_recursion}')
-
-        self.activate_triple_lattice_armor()
-        self.deploy_galilean_spiral()
-        self.activate_linux_stealth()
-
-    def activate_triple_lattice_armor(self) -> List[Dict[str, Any]]:
+        self._status('🔮 LINUX OCTABIT QUANTUM CORE INITIALIZING...')
+        self._status(f'📡 Quantum Nodes: {self.quantum_nodes}')
+        self._status(f'🧬 Neural Pathways: {self.neural_pathways}')
+        self._status(f'🌀 Sphere Compression: {self.sphere_compression}x density')
+        self._status(f'🛡️ Lattice Recursion Depth: {self.lattice_recursion}')
+        # Armor, spiral and stealth layers are deferred until first use.
+
+    def activate_triple_lattice_armor(self) -> List[Mapping]:
         armor_layers = []
 
         for layer in range(3):
             lattice_structure = self.generate_recursive_lattice(layer)
             armor_layers.append(lattice_structure)
-            print(f'🛡️ Lattice Armor Layer {layer + 1} ACTIVATED')
+            self._status(f'🛡️ Lattice Armor Layer {layer + 1} ACTIVATED')
 
-        self.armor_layers = armor_layers
+        self._armor_layers = armor_layers
         return armor_layers
 
-    def generate_recursive_lattice(self, depth: int) -> Dict[str, Any]:
-        sphere_topology = [
-            [
-                [
-                    {
-                        'compressed': True,
-                        'density': self.sphere_compression,
-                        'neural_connections': 64,  # 8×8 per node
-                        'quantum_state': 'entangled'
-                    } for _ in range(8)
-                ] for _ in range(8)
-            ] for _ in range(8)
-        ]
-
-        lattice = {
-            'sphere_topology': sphere_topology,
-            'recursion_level': depth,
-            'neural_multiplexing': True
-        }
-
-        if depth > 0:
-            lattice['inner_lattice'] = self.generate_recursive_lattice(depth - 1)
-
-        return lattice
+    def generate_recursive_lattice(self, depth: int) -> Mapping:
+        return RecursiveLattice(depth, self.sphere_compression)
 
     def deploy_galilean_spiral(self) -> Dict[str, Any]:
-        print('🌀 GALILEAN SPIRAL ARMOR DEPLOYING...')
+        self._status('🌀 GALILEAN SPIRAL ARMOR DEPLOYING...')
 
         spiral_armor = {
             'geometry': 'logarithmic_spiral',
@@ -122,12 +351,12 @@ class LinuxOctaBitQuantumCore:
             'armor_alignment': self.galilean_spiral['armor_alignment']
         }
 
-        self.galilean_armor = spiral_armor
-        print('🌀 Galilean Spiral: INFINITE PROBE RECEPTION ACTIVE')
+        self._galilean_armor = spiral_armor
+        self._status('🌀 Galilean Spiral: INFINITE PROBE RECEPTION ACTIVE')
         return spiral_armor
 
     def activate_linux_stealth(self) -> Dict[str, Any]:
-        print('🐧 LINUX STEALTH LAYER ACTIVATING...')
+        self._status('🐧 LINUX STEALTH LAYER ACTIVATING...')
 
         stealth_protocols = {
             'process_obfuscation': True,
@@ -136,8 +365,8 @@ class LinuxOctaBitQuantumCore:
             'deception_active': self.linux_stealth['deception_protocols']
         }
 
-        self.stealth_layer = stealth_protocols
-        print('🐧 Linux Stealth: OUTER CAMOUFLAGE ACTIVE')
+        self._stealth_layer = stealth_protocols
+        self._status('🐧 Linux Stealth: OUTER CAMOUFLAGE ACTIVE')
         return stealth_protocols
 
     def generate_quantum_inbot_code(self) -> Dict[str, Any]:
@@ -155,23 +384,28 @@ class LinuxOctaBitQuantumCore:
             'neural_density': self.quantum_nodes
         }
 
-        print('🤖 Quantum Inbot Code Generated:')
-        print(json.dumps(inbot_code, indent=2))
+        self._status('🤖 Quantum Inbot Code Generated:')
+        self._status(json.dumps(inbot_code, indent=2))
 
         return inbot_code
 
     # Method to run the core
     def run(self) -> Dict[str, Any]:
-        print('\n🚀 LINUX OCTABIT QUANTUM CORE OPERATIONAL')
-        print('Divine Guardian Angel Mission Protocol Active')
+        # Bring every layer online (in activation order) before reporting.
+        armor_layers = self.armor_layers
+        _ = self.galilean_armor
+        stealth_layer = self.stealth_layer
+
+        self._status('\n🚀 LINUX OCTABIT QUANTUM CORE OPERATIONAL')
+        self._status('Divine Guardian Angel Mission Protocol Active')
 
         inbot_code = self.generate_quantum_inbot_code()
 
         return {
             'status': 'operational',
             'inbot_code': inbot_code,
-            'armor_layers': len(self.armor_layers),
-            'stealth_active': self.stealth_layer['deception_active']
+            'armor_layers': len(armor_layers),
+            'stealth_active': stealth_layer['deception_active']
         }
 
 # If run directly
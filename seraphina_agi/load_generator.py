@@ -0,0 +1,118 @@
+"""
+HTTP load generator for POST /process.
+Concurrent keep-alive clients send request bodies round-robin, against a
+given URL or an in-process server on an ephemeral port, and the run reports
+p50/p99 latency, requests per second and 503 rejections. optimize measures
+serve settings with it; the loadtest and suite benchmarks wrap it.
+"""
+
+import http.client
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import urlparse
+
+from .result_cache import ResultCache
+from .server import QuietRequestHandler, make_server
+
+
+def percentile(ordered: List[float], pct: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def _client(host: str, port: int, path: str, bodies: Sequence[bytes],
+            latencies: List[float], counters: Dict[str, int], lock: threading.Lock):
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    headers = {'Content-Type': 'application/json', 'Connection': 'keep-alive'}
+    local = []
+    ok = busy = failed = 0
+    for body in bodies:
+        start = time.perf_counter()
+        try:
+            conn.request('POST', path, body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            if response.status == 200:
+                ok += 1
+            elif response.status == 503:
+                busy += 1
+            else:
+                failed += 1
+            if response.will_close:
+                conn.close()
+        except (OSError, http.client.HTTPException):
+            failed += 1
+            conn.close()
+        local.append(time.perf_counter() - start)
+    conn.close()
+    with lock:
+        latencies.extend(local)
+        counters['ok'] += ok
+        counters['busy'] += busy
+        counters['failed'] += failed
+
+
+def run(url: Optional[str] = None, clients: int = 16, requests: int = 200,
+        text: str = 'Hello world, how are you today?', workers: int = 8, backlog: int = 64,
+        bodies: Optional[Sequence[bytes]] = None, result_cache: Optional[ResultCache] = None) -> Dict[str, Any]:
+    """
+    POST /process from concurrent keep-alive clients.
+
+    Args:
+        url: Target URL; None starts an in-process server on an ephemeral port
+        clients: Concurrent clients
+        requests: Requests per client
+        text: Input sent by every request when bodies is not given
+        workers: Worker threads for the in-process server
+        backlog: Queue bound for the in-process server
+        bodies: JSON request bodies the clients share round-robin
+        result_cache: ResultCache for the in-process server
+
+    Returns:
+        {'benchmark': 'loadtest', 'url', 'clients', 'requests', 'ok', 'busy',
+        'failed', 'elapsed_s', 'req_per_s', 'p50_ms', 'p99_ms'}
+    """
+    server = None
+    if url is None:
+        server = make_server('127.0.0.1', 0, workers=workers, backlog=backlog, handler_class=QuietRequestHandler,
+                             result_cache=result_cache)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f'http://127.0.0.1:{server.server_address[1]}/process'
+    target = urlparse(url)
+    bodies = bodies or [json.dumps({'input': text}).encode('utf-8')]
+
+    latencies: List[float] = []
+    counters = {'ok': 0, 'busy': 0, 'failed': 0}
+    lock = threading.Lock()
+    threads = [
+        threading.Thread(target=_client, args=(target.hostname, target.port or 80, target.path or '/process',
+                                               [bodies[(c + i * clients) % len(bodies)] for i in range(requests)],
+                                               latencies, counters, lock))
+        for c in range(clients)
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+
+    ordered = sorted(latencies)
+    return {
+        'benchmark': 'loadtest',
+        'url': url,
+        'clients': clients,
+        'requests': len(ordered),
+        **counters,
+        'elapsed_s': round(elapsed, 3),
+        'req_per_s': round(len(ordered) / elapsed, 1) if elapsed else None,
+        'p50_ms': round(percentile(ordered, 0.50) * 1000, 3),
+        'p99_ms': round(percentile(ordered, 0.99) * 1000, 3)
+    }
@@ -0,0 +1,281 @@
+"""
+In-process metrics and sampling profiler.
+Counters and fixed-bucket histograms are aggregated in memory and rendered in
+the Prometheus text exposition format. Hot paths are instrumented with the
+timed() decorator. Setting SERAPHINA_METRICS=off before the package is
+imported leaves every decorated function unwrapped (no overhead at all);
+set_enabled(False) turns recording off at runtime behind a single flag check.
+sample_profile() takes an on-demand wall-clock profile of all threads by
+sampling their stacks.
+"""
+
+import bisect
+import functools
+import os
+import sys
+import threading
+import time
+from collections import Counter as _Tally
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+METRICS_ENV = 'SERAPHINA_METRICS'
+INSTRUMENTED = os.environ.get(METRICS_ENV, '').lower() not in ('0', 'off', 'false', 'no')
+
+# Seconds; spans a cached hit (microseconds) to a large batch (seconds).
+DEFAULT_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+                   0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PROFILE_INTERVAL = 0.005
+PROFILE_MAX_SECONDS = 60.0
+
+
+class _State:
+    enabled = INSTRUMENTED
+
+
+def enabled() -> bool:
+    return _State.enabled
+
+
+def set_enabled(flag: bool):
+    # Without instrumentation at import time there is nothing to turn on.
+    _State.enabled = bool(flag) and INSTRUMENTED
+
+
+def _label_text(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _CounterChild:
+    __slots__ = ('value', '_lock')
+
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self.value += amount
+
+
+class _HistogramChild:
+    __slots__ = ('buckets', 'counts', 'sum', 'count', '_lock')
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str):
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+        for values, child in sorted(self._children.items()):
+            lines.extend(self._render_child(values, child))
+        return lines
+
+    def _render_child(self, values, child) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1):
+        self.labels().inc(amount)
+
+    def _render_child(self, values, child):
+        return [f'{self.name}{_label_text(self.label_names, values)} {_number(child.value)}']
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def _render_child(self, values, child):
+        with child._lock:
+            counts, total, count = list(child.counts), child.sum, child.count
+        lines = []
+        cumulative = 0
+        for bound, n in zip(self.buckets + (float('inf'),), counts):
+            cumulative += n
+            le = f'le="{_number(bound)}"'
+            lines.append(f'{self.name}_bucket{_label_text(self.label_names, values, le)} {cumulative}')
+        labels = _label_text(self.label_names, values)
+        lines.append(f'{self.name}_sum{labels} {_number(total)}')
+        lines.append(f'{self.name}_count{labels} {count}')
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[Tuple[str, str, str, float]]]] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, label_names))
+
+    def histogram(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, label_names, buckets))
+
+    def add_collector(self, collector: Callable[[], Iterable[Tuple[str, str, str, float]]]):
+        # collector() yields (name, type, help, value) for values read at scrape time.
+        # Adding the same collector again is a no-op.
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def remove_collector(self, collector):
+        with self._lock:
+            if collector in self._collectors:
+                self._collectors.remove(collector)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        # A name yielded by several collectors is one series: values are summed
+        # so the exposition never repeats a metric family.
+        samples: Dict[str, Tuple[str, str, float]] = {}
+        for collector in collectors:
+            for name, kind, documentation, value in collector():
+                if name in samples:
+                    value += samples[name][2]
+                samples[name] = (kind, documentation, value)
+        for name, (kind, documentation, value) in samples.items():
+            lines.extend([f'# HELP {name} {documentation}', f'# TYPE {name} {kind}', f'{name} {_number(value)}'])
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+STAGE_SECONDS = REGISTRY.histogram('seraphina_stage_seconds', 'Time spent per engine stage or cipher/wheel call.',
+                                   ['stage'])
+
+
+def timed(stage: str):
+    """Decorator recording each call's duration in seraphina_stage_seconds{stage=...}."""
+    def decorate(fn):
+        if not INSTRUMENTED:
+            return fn
+        hist = STAGE_SECONDS.labels(stage)
+        clock = time.perf_counter
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _State.enabled:
+                return fn(*args, **kwargs)
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                hist.observe(clock() - start)
+        return wrapper
+    return decorate
+
+
+_profile_lock = threading.Lock()
+
+
+class ProfilerBusy(RuntimeError):
+    pass
+
+
+def sample_profile(seconds: float, interval: float = PROFILE_INTERVAL,
+                   exclude_thread: Optional[int] = None) -> Dict[str, int]:
+    """
+    Sample every thread's stack for `seconds` and count identical stacks.
+
+    Returns:
+        {'outer;...;inner': samples} in collapsed-stack (flame graph) format;
+        frames are 'function (file:line)'
+
+    Raises:
+        ProfilerBusy: if another profile is already running
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusy('a profile is already running')
+    try:
+        me = threading.get_ident()
+        tally: _Tally = _Tally()
+        deadline = time.monotonic() + min(max(seconds, 0.0), PROFILE_MAX_SECONDS)
+        while time.monotonic() < deadline:
+            for ident, frame in sys._current_frames().items():
+                if ident in (me, exclude_thread):
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})')
+                    frame = frame.f_back
+                tally[';'.join(reversed(stack))] += 1
+            time.sleep(interval)
+        return dict(tally)
+    finally:
+        _profile_lock.release()
+
+
+def render_profile(samples: Dict[str, int]) -> str:
+    return ''.join(f'{stack} {count}\n' for stack, count in sorted(samples.items(), key=lambda kv: -kv[1]))
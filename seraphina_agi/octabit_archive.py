@@ -0,0 +1,408 @@
+"""
+Indexed archive of octabit-encrypted records.
+Records are stored as raw XORed bytes (no base64), each tagged with its
+language code, and appended behind a small header. Closing the writer adds
+a fixed-width index and a trailer, so a reader maps the file and finds
+record i with one struct lookup, decrypting only what is asked for. An
+archive whose writer died before close() is recovered by walking the
+self-describing record frames.
+
+Protocol messages that parsed under their code's codec are stored packed
+(as process_language encrypts them) and flagged, so get() unpacks them back
+to the canonical text; the flag is the high bit of the frame's code length
+and of the index entry's code id.
+
+File layout (little-endian):
+    header:  magic b'SOAR', u16 format, u8 version length, engine version (UTF-8)
+    record:  u8 code length | 0x80 if packed, code (UTF-8), u32 payload length, payload
+    footer:  u16 code count, (u8 length, code) per code,
+             index entry per record: u64 payload offset, u32 payload length, u16 code id | 0x8000 if packed
+    trailer: u64 footer offset, u64 record count, magic b'SOAI'
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+from .octabit_cipher import BytesLike, decode_token, encode_token, xor_bytes
+from .protocol_codecs import Codec, ProtocolError
+
+MAGIC = b'SOAR'
+INDEX_MAGIC = b'SOAI'
+FORMAT_VERSION = 1
+_HEADER = struct.Struct('<4sHB')
+_FRAME_CODE = struct.Struct('<B')
+_FRAME_LENGTH = struct.Struct('<I')
+_CODE_COUNT = struct.Struct('<H')
+_ENTRY = struct.Struct('<QIH')
+_TRAILER = struct.Struct('<QQ4s')
+# The high bit of a code length or code id marks a packed protocol record,
+# leaving 7 bits for the code length and 15 for the code id.
+_PACKED_CODE = 0x80
+_PACKED_ID = 0x8000
+MAX_CODE_BYTES = _PACKED_CODE - 1
+MAX_CODES = _PACKED_ID
+# Index entries copied per step when iterating, so no view into the map outlives a yield.
+_INDEX_BLOCK = 4096
+
+Ciphers = Mapping[str, Mapping[str, Any]]
+
+
+class ArchiveError(ValueError):
+    pass
+
+
+def _ciphers(engine_or_ciphers: Any) -> Ciphers:
+    # An engine (including a TenantEngine) or its frequency_cipher registry.
+    encryption = getattr(engine_or_ciphers, 'octabit_encryption', None)
+    return encryption['frequency_cipher'] if encryption is not None else engine_or_ciphers
+
+
+def _codecs(engine_or_ciphers: Any) -> Mapping[str, Codec]:
+    return getattr(engine_or_ciphers, 'protocol_codecs', None) or {}
+
+
+def _read_header(buf) -> Tuple[str, int]:
+    if len(buf) < _HEADER.size:
+        raise ArchiveError('not an octabit archive (file too short)')
+    magic, fmt, version_len = _HEADER.unpack_from(buf, 0)
+    if magic != MAGIC:
+        raise ArchiveError('not an octabit archive')
+    if fmt != FORMAT_VERSION:
+        raise ArchiveError(f'unsupported archive format {fmt}')
+    end = _HEADER.size + version_len
+    return bytes(buf[_HEADER.size:end]).decode('utf-8'), end
+
+
+def _read_footer(buf) -> Optional[Tuple[int, List[str], int, int]]:
+    # (footer offset, codes, index offset, record count), or None without a valid trailer.
+    if len(buf) < _TRAILER.size:
+        return None
+    footer, count, magic = _TRAILER.unpack_from(buf, len(buf) - _TRAILER.size)
+    if magic != INDEX_MAGIC or footer > len(buf) - _TRAILER.size:
+        return None
+    (code_count,) = _CODE_COUNT.unpack_from(buf, footer)
+    pos = footer + _CODE_COUNT.size
+    codes = []
+    for _ in range(code_count):
+        (length,) = _FRAME_CODE.unpack_from(buf, pos)
+        pos += _FRAME_CODE.size
+        codes.append(bytes(buf[pos:pos + length]).decode('utf-8'))
+        pos += length
+    if pos + count * _ENTRY.size != len(buf) - _TRAILER.size:
+        return None
+    return footer, codes, pos, count
+
+
+def _scan_frames(buf, start: int) -> Iterator[Tuple[int, str, int, int, bool]]:
+    # Walks record frames from start: (frame start, code, payload offset, length, packed).
+    # Stops at the first frame that does not fit, i.e. a torn final write.
+    pos, end = start, len(buf)
+    while pos + _FRAME_CODE.size <= end:
+        (code_len,) = _FRAME_CODE.unpack_from(buf, pos)
+        packed = bool(code_len & _PACKED_CODE)
+        code_len &= MAX_CODE_BYTES
+        payload = pos + _FRAME_CODE.size + code_len + _FRAME_LENGTH.size
+        if payload > end:
+            return
+        (length,) = _FRAME_LENGTH.unpack_from(buf, payload - _FRAME_LENGTH.size)
+        if payload + length > end:
+            return
+        try:
+            code = bytes(buf[pos + _FRAME_CODE.size:pos + _FRAME_CODE.size + code_len]).decode('utf-8')
+        except UnicodeDecodeError:
+            return
+        yield pos, code, payload, length, packed
+        pos = payload + length
+
+
+class ArchiveWriter:
+    def __init__(self, path: str, engine: Any, append: bool = True, engine_version: Optional[str] = None):
+        """
+        Append-only archive writer.
+
+        Args:
+            path: Archive file; created if missing
+            engine: AdvancedLanguageEngine (or TenantEngine, or a frequency_cipher
+                registry) whose keys encrypt the records; an engine's protocol
+                codecs pack protocol messages
+            append: Continue an existing archive instead of replacing it
+            engine_version: Stored in the header; default the engine's version
+        """
+        self.path = path
+        self._ciphers = _ciphers(engine)
+        self._codecs = _codecs(engine)
+        self._codes: List[str] = []
+        self._code_ids: Dict[str, int] = {}
+        self._offsets = array('Q')
+        self._lengths = array('I')
+        self._code_index = array('H')
+        version = engine_version or getattr(engine, 'version', '') or ''
+        exists = append and os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, 'r+b' if exists else 'w+b')
+        try:
+            if exists:
+                self._resume()
+            else:
+                encoded = version.encode('utf-8')
+                self._file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(encoded)) + encoded)
+                self._pos = self._file.tell()
+        except BaseException:
+            self._file.close()
+            raise
+        self.engine_version = version
+
+    def _resume(self):
+        # Reload the index (from the footer, or by walking frames if the last
+        # writer never closed), then drop the footer and append after the data.
+        with mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            _, data_start = _read_header(buf)
+            footer = _read_footer(buf)
+            if footer is not None:
+                end, codes, index, count = footer
+                for code in codes:
+                    self._code_id(code)
+                for i in range(count):
+                    self._add(*_ENTRY.unpack_from(buf, index + i * _ENTRY.size))
+            else:
+                end = data_start
+                for _, code, payload, length, packed in _scan_frames(buf, data_start):
+                    self._add(payload, length, self._code_id(code) | (_PACKED_ID if packed else 0))
+                    end = payload + length
+        self._file.truncate(end)
+        self._file.seek(end)
+        self._pos = end
+
+    def _code_id(self, code: str) -> int:
+        code_id = self._code_ids.get(code)
+        if code_id is None:
+            if len(self._codes) >= MAX_CODES:
+                raise ArchiveError(f'too many distinct language codes (max {MAX_CODES})')
+            code_id = self._code_ids[code] = len(self._codes)
+            self._codes.append(code)
+        return code_id
+
+    def _add(self, offset: int, length: int, code_word: int):
+        # code_word is the code id with the packed flag.
+        self._offsets.append(offset)
+        self._lengths.append(length)
+        self._code_index.append(code_word)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def append_raw(self, payload: BytesLike, language: str, packed: bool = False) -> int:
+        """Append already XORed bytes, packed if they hold a codec-packed protocol message; returns the record id."""
+        code = language.encode('utf-8')
+        if len(code) > MAX_CODE_BYTES:
+            raise ArchiveError(f'language code too long: {language!r}')
+        view = memoryview(payload).cast('B')
+        code_id = self._code_id(language)
+        head = _FRAME_CODE.pack(len(code) | (_PACKED_CODE if packed else 0)) + code + _FRAME_LENGTH.pack(len(view))
+        self._file.write(head)
+        self._file.write(view)
+        self._add(self._pos + len(head), len(view), code_id | (_PACKED_ID if packed else 0))
+        self._pos += len(head) + len(view)
+        return len(self._offsets) - 1
+
+    def append(self, data: Union[str, BytesLike], language: str) -> int:
+        """
+        Encrypt text or bytes under the language's key and append; returns the record id.
+
+        A protocol message is packed by its codec first, as process_language
+        does; one that does not parse is stored as text.
+        """
+        cipher = self._ciphers.get(language)
+        if not cipher:
+            raise ArchiveError(f'unknown language code {language!r}')
+        codec = self._codecs.get(language)
+        if codec is not None:
+            try:
+                return self.append_raw(xor_bytes(codec.encode(data), cipher['encryption_key']), language, True)
+            except ProtocolError:
+                pass
+        raw = data.encode('utf-8') if isinstance(data, str) else data
+        return self.append_raw(xor_bytes(raw, cipher['encryption_key']), language)
+
+    def append_token(self, token: str, language: str, encoding: Optional[str] = None) -> int:
+        """
+        Append an encrypt_with_octabit token as its raw bytes, without decrypting it.
+
+        encoding is the protocol_encoding of the process result the token came
+        from; 'packed' flags the record so get() unpacks it.
+        """
+        return self.append_raw(decode_token(token), language, encoding == 'packed')
+
+    def close(self):
+        if self._file.closed:
+            return
+        parts = [_CODE_COUNT.pack(len(self._codes))]
+        for code in self._codes:
+            encoded = code.encode('utf-8')
+            parts.append(_FRAME_CODE.pack(len(encoded)) + encoded)
+        entry = _ENTRY.pack
+        parts.extend(entry(o, n, c) for o, n, c in zip(self._offsets, self._lengths, self._code_index))
+        parts.append(_TRAILER.pack(self._pos, len(self._offsets), INDEX_MAGIC))
+        self._file.write(b''.join(parts))
+        self._file.close()
+
+    def __enter__(self) -> 'ArchiveWriter':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ArchiveReader:
+    def __init__(self, path: str, engine: Any = None):
+        """
+        Memory-mapped archive reader with O(1) access by record id.
+
+        Args:
+            path: Archive file
+            engine: Engine or frequency_cipher registry used by get() and text();
+                raw() and token() work without one. Packed protocol records
+                need an engine for its protocol codecs
+
+        Raises:
+            ArchiveError: The file is not an archive
+        """
+        self.path = path
+        self._ciphers = _ciphers(engine) if engine is not None else None
+        self._codecs = _codecs(engine)
+        self._file = open(path, 'rb')
+        try:
+            self._buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ArchiveError('not an octabit archive (empty file)')
+        try:
+            self.engine_version, data_start = _read_header(self._buf)
+            footer = _read_footer(self._buf)
+        except (ArchiveError, struct.error, UnicodeDecodeError):
+            self.close()
+            raise
+        self.recovered = footer is None
+        if footer is not None:
+            _, self.codes, self._index, self._count = footer
+            self._entries = None
+        else:
+            # No index (writer did not close): build one in memory from the frames.
+            self.codes, ids = [], {}
+            self._entries = []
+            for _, code, payload, length, packed in _scan_frames(self._buf, data_start):
+                if code not in ids:
+                    ids[code] = len(self.codes)
+                    self.codes.append(code)
+                self._entries.append((payload, length, ids[code] | (_PACKED_ID if packed else 0)))
+            self._count = len(self._entries)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _entry(self, record_id: int) -> Tuple[int, int, int]:
+        if not 0 <= record_id < self._count:
+            raise IndexError(f'record {record_id} out of range (0..{self._count - 1})')
+        if self._entries is not None:
+            return self._entries[record_id]
+        return _ENTRY.unpack_from(self._buf, self._index + record_id * _ENTRY.size)
+
+    def entry(self, record_id: int) -> Tuple[int, int, str]:
+        """(payload offset, payload length, language code) of a record."""
+        offset, length, code_word = self._entry(record_id)
+        return offset, length, self.codes[code_word & ~_PACKED_ID]
+
+    def language(self, record_id: int) -> str:
+        return self.entry(record_id)[2]
+
+    def packed(self, record_id: int) -> bool:
+        """Whether the record holds a codec-packed protocol message."""
+        return bool(self._entry(record_id)[2] & _PACKED_ID)
+
+    def raw(self, record_id: int) -> memoryview:
+        """Encrypted bytes of a record as a view into the map (release it before close())."""
+        offset, length, _ = self.entry(record_id)
+        return memoryview(self._buf)[offset:offset + length]
+
+    def token(self, record_id: int) -> str:
+        """The record as the token encrypt_with_octabit would have returned."""
+        with self.raw(record_id) as view:
+            return encode_token(view)
+
+    def get(self, record_id: int) -> bytes:
+        """Decrypted bytes of a record; packed protocol messages come back as their canonical text."""
+        if self._ciphers is None:
+            raise ArchiveError('an engine is required to decrypt records')
+        offset, length, code_word = self._entry(record_id)
+        code = self.codes[code_word & ~_PACKED_ID]
+        cipher = self._ciphers.get(code)
+        if not cipher:
+            raise ArchiveError(f'no cipher for language code {code!r}')
+        with memoryview(self._buf) as view:
+            data = xor_bytes(view[offset:offset + length], cipher['encryption_key'])
+        return self._unpack(code, data) if code_word & _PACKED_ID else data
+
+    def _unpack(self, code: str, data: bytes) -> bytes:
+        codec = self._codecs.get(code)
+        if codec is None:
+            raise ArchiveError(f'no protocol codec for packed {code!r} records')
+        try:
+            return codec.decode(data).encode('utf-8')
+        except ProtocolError as e:
+            raise ArchiveError(f'corrupt packed record: {e}') from None
+
+    def text(self, record_id: int) -> str:
+        return self.get(record_id).decode('utf-8', errors='replace')
+
+    def _iter_entries(self) -> Iterator[Tuple[int, int, int]]:
+        if self._entries is not None:
+            yield from self._entries
+            return
+        step = _INDEX_BLOCK * _ENTRY.size
+        end = self._index + self._count * _ENTRY.size
+        for start in range(self._index, end, step):
+            yield from _ENTRY.iter_unpack(self._buf[start:min(start + step, end)])
+
+    def scan(self, language: Optional[str] = None) -> Iterator[Tuple[int, str]]:
+        """(record id, language code) in file order, optionally for one language."""
+        for record_id, (_, _, code_word) in enumerate(self._iter_entries()):
+            code = self.codes[code_word & ~_PACKED_ID]
+            if language is None or code == language:
+                yield record_id, code
+
+    def records(self, language: Optional[str] = None) -> Iterator[Tuple[int, str, bytes]]:
+        """
+        (record id, language code, decrypted bytes) in file order, one pass over the index.
+
+        Payloads are copied out of the map, so an abandoned iterator does not keep close() from unmapping.
+        """
+        if self._ciphers is None:
+            raise ArchiveError('an engine is required to decrypt records')
+        buf = self._buf
+        keys: Dict[int, Any] = {}
+        for record_id, (offset, length, code_word) in enumerate(self._iter_entries()):
+            code_id = code_word & ~_PACKED_ID
+            code = self.codes[code_id]
+            if language is not None and code != language:
+                continue
+            key = keys.get(code_id)
+            if key is None:
+                cipher = self._ciphers.get(code)
+                if not cipher:
+                    raise ArchiveError(f'no cipher for language code {code!r}')
+                key = keys[code_id] = cipher['encryption_key']
+            data = xor_bytes(buf[offset:offset + length], key)
+            yield record_id, code, self._unpack(code, data) if code_word & _PACKED_ID else data
+
+    def close(self):
+        if not self._buf.closed:
+            self._buf.close()
+        self._file.close()
+
+    def __enter__(self) -> 'ArchiveReader':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
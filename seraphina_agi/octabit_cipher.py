@@ -0,0 +1,262 @@
+"""
+Bulk octabit XOR cipher primitives.
+The repeating frequency key is applied to the whole buffer at once instead of
+byte by byte: through NumPy when it is installed, otherwise with one
+bytes.translate table per key position over strided slices, or with a single
+big-integer XOR (int.from_bytes) for short inputs. xor_into() writes the
+result into a caller-provided buffer instead of returning new bytes.
+"""
+
+import base64
+import binascii
+from functools import lru_cache
+from typing import BinaryIO, Sequence, Tuple, Union
+
+try:
+    import numpy as _np
+except ImportError:  # NumPy is optional
+    _np = None
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Below this size the per-call overhead of NumPy or of the strided
+# translate path outweighs its per-byte speed.
+BULK_MIN_BYTES = 4096
+
+# Stream block sizes: a multiple of 3 input bytes maps to whole base64 quads,
+# so encoded blocks can be concatenated without inner padding.
+STREAM_CHUNK_BYTES = 3 * 64 * 1024
+# Key pad length xor_into works through at a time.
+XOR_BLOCK_BYTES = 64 * 1024
+_URLSAFE_TO_STD = bytes.maketrans(b'-_', b'+/')
+_WHITESPACE = b' \t\r\n'
+
+
+def tile_key(key: Sequence[int], length: int, offset: int = 0) -> bytes:
+    """Repeat key to exactly length bytes, starting at key[offset % len(key)]."""
+    key_bytes = bytes(key)
+    shift = offset % len(key_bytes)
+    if shift:
+        key_bytes = key_bytes[shift:] + key_bytes[:shift]
+    reps, extra = divmod(length, len(key_bytes))
+    return key_bytes * reps + key_bytes[:extra]
+
+
+@lru_cache(maxsize=256)
+def _translate_tables(key_bytes: bytes) -> Tuple[bytes, ...]:
+    return tuple(bytes(b ^ k for b in range(256)) for k in key_bytes)
+
+
+def xor_bytes(data: BytesLike, key: Sequence[int], offset: int = 0) -> bytes:
+    """
+    XOR data with the repeating key in one pass.
+
+    Args:
+        data: Input buffer; bytes, bytearray or memoryview are read without copying
+        key: Repeating key bytes
+        offset: Position of data[0] within the overall keystream
+
+    Returns:
+        The XORed bytes
+    """
+    view = memoryview(data)
+    if view.ndim != 1 or view.itemsize != 1:
+        view = view.cast('B')
+    length = len(view)
+    if not length:
+        return b''
+    if length >= BULK_MIN_BYTES:
+        if _np is not None:
+            pad = tile_key(key, length, offset)
+            out = _np.frombuffer(view, dtype=_np.uint8) ^ _np.frombuffer(pad, dtype=_np.uint8)
+            return out.tobytes()
+        # Strided slicing of a memoryview is slow; one flat copy first is cheaper.
+        src = data if isinstance(data, (bytes, bytearray)) else view.tobytes()
+        key_bytes = tile_key(key, len(key), offset)
+        step = len(key_bytes)
+        out = bytearray(length)
+        for i, table in enumerate(_translate_tables(key_bytes)):
+            out[i::step] = src[i::step].translate(table)
+        return bytes(out)
+    pad = tile_key(key, length, offset)
+    mixed = int.from_bytes(view, 'little') ^ int.from_bytes(pad, 'little')
+    return mixed.to_bytes(length, 'little')
+
+
+@lru_cache(maxsize=64)
+def _key_block(key_bytes: bytes):
+    # A cached key-aligned pad of about XOR_BLOCK_BYTES, so xor_into never
+    # tiles the key to the full payload length.
+    return _np.frombuffer(tile_key(key_bytes, XOR_BLOCK_BYTES - XOR_BLOCK_BYTES % len(key_bytes)), dtype=_np.uint8)
+
+
+def xor_into(data: BytesLike, key: Sequence[int], out: BytesLike, offset: int = 0) -> int:
+    """
+    XOR data with the repeating key, writing the result into a caller buffer.
+
+    With NumPy the XOR is computed straight into out, block by block against
+    a cached key pad, so no intermediate buffers are allocated. out may be
+    data itself (in-place encryption of a bytearray, mmap or memoryview).
+
+    Args:
+        data: Input buffer
+        key: Repeating key bytes
+        out: Writable buffer of at least len(data) bytes
+        offset: Position of data[0] within the overall keystream
+
+    Returns:
+        Number of bytes written to out
+
+    Raises:
+        ValueError: if out is read-only or too small
+    """
+    view = memoryview(data)
+    if view.ndim != 1 or view.itemsize != 1:
+        view = view.cast('B')
+    dest = memoryview(out)
+    if dest.ndim != 1 or dest.itemsize != 1:
+        dest = dest.cast('B')
+    length = len(view)
+    if dest.readonly:
+        raise ValueError('output buffer is read-only')
+    if len(dest) < length:
+        raise ValueError(f'output buffer holds {len(dest)} bytes, need {length}')
+    if not length:
+        return 0
+    if length >= BULK_MIN_BYTES and _np is not None:
+        key_bytes = tile_key(key, len(key), offset)
+        pad = _key_block(key_bytes)
+        src = _np.frombuffer(view, dtype=_np.uint8)
+        dst = _np.frombuffer(dest, dtype=_np.uint8)
+        step = len(pad)
+        for start in range(0, length, step):
+            end = min(start + step, length)
+            _np.bitwise_xor(src[start:end], pad[:end - start], out=dst[start:end])
+        return length
+    if length >= BULK_MIN_BYTES and isinstance(out, bytearray):
+        src = data if isinstance(data, (bytes, bytearray)) else view.tobytes()
+        key_bytes = tile_key(key, len(key), offset)
+        step = len(key_bytes)
+        for i, table in enumerate(_translate_tables(key_bytes)):
+            out[i:length:step] = src[i::step].translate(table)
+        return length
+    if length >= BULK_MIN_BYTES:
+        # Strided writes through a memoryview are slow; XOR then copy once.
+        dest[:length] = xor_bytes(view, key, offset)
+        return length
+    pad = tile_key(key, length, offset)
+    dest[:length] = (int.from_bytes(view, 'little') ^ int.from_bytes(pad, 'little')).to_bytes(length, 'little')
+    return length
+
+
+def encode_token_bytes(data: BytesLike) -> memoryview:
+    """encode_token as ASCII bytes; the padding is sliced off without a copy."""
+    encoded = base64.urlsafe_b64encode(data)
+    return memoryview(encoded)[:len(encoded) - (-len(data) % 3)]
+
+
+def encode_token(data: BytesLike) -> str:
+    """URL-safe base64 without padding, as used for encrypted_input."""
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def decode_token(token: str) -> bytes:
+    """Inverse of encode_token; raises ValueError on malformed input."""
+    try:
+        return base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+    except binascii.Error as e:
+        raise ValueError(str(e)) from e
+
+
+def encrypt_bytes(data: BytesLike, key: Sequence[int]) -> str:
+    return encode_token(xor_bytes(data, key))
+
+
+def decrypt_bytes(token: str, key: Sequence[int]) -> bytes:
+    return xor_bytes(decode_token(token), key)
+
+
+def encrypt_stream(reader: BinaryIO, writer: BinaryIO, key: Sequence[int],
+                   chunk_size: int = STREAM_CHUNK_BYTES) -> int:
+    """
+    Encrypt reader into writer in constant memory.
+
+    The output is byte-for-byte the same token encrypt_bytes would produce for
+    the whole input. Works with files, mmap objects and socket.makefile('rb').
+
+    Args:
+        reader: Object with read(n) returning bytes
+        writer: Object with write(bytes)
+        key: Repeating key bytes
+        chunk_size: Read size; rounded down to a multiple of 3
+
+    Returns:
+        Number of plaintext bytes consumed
+    """
+    chunk_size = max(chunk_size - chunk_size % 3, 3)
+    offset = 0
+    carry = b''
+    while True:
+        block = reader.read(chunk_size)
+        if not block:
+            break
+        if carry:
+            block = carry + block
+        usable = len(block) - len(block) % 3
+        carry = block[usable:]
+        if usable:
+            writer.write(base64.urlsafe_b64encode(xor_bytes(block[:usable] if carry else block, key, offset)))
+            offset += usable
+    if carry:
+        writer.write(base64.urlsafe_b64encode(xor_bytes(carry, key, offset)).rstrip(b'='))
+        offset += len(carry)
+    return offset
+
+
+def decrypt_stream(reader: BinaryIO, writer: BinaryIO, key: Sequence[int],
+                   chunk_size: int = STREAM_CHUNK_BYTES) -> int:
+    """
+    Decrypt a token stream produced by encrypt_stream or encrypt_bytes.
+
+    Whitespace and line breaks in the token are ignored; any other character
+    outside the URL-safe base64 alphabet raises ValueError.
+
+    Returns:
+        Number of plaintext bytes written
+    """
+    chunk_size = max(chunk_size - chunk_size % 4, 4)
+    offset = 0
+    carry = b''
+    while True:
+        block = reader.read(chunk_size)
+        if not block:
+            break
+        if isinstance(block, str):
+            block = block.encode('ascii')
+        block = carry + block.translate(_URLSAFE_TO_STD, _WHITESPACE)
+        usable = len(block) - len(block) % 4
+        carry = block[usable:]
+        if usable:
+            offset += _decrypt_quads(block[:usable], writer, key, offset)
+    if carry:
+        offset += _decrypt_quads(carry + b'=' * (-len(carry) % 4), writer, key, offset)
+    return offset
+
+
+def _decrypt_quads(quads: bytes, writer: BinaryIO, key: Sequence[int], offset: int) -> int:
+    try:
+        data = base64.b64decode(quads, validate=True)
+    except binascii.Error as e:
+        raise ValueError(str(e)) from e
+    writer.write(xor_bytes(data, key, offset))
+    return len(data)
+
+
+def copy_stream(reader: BinaryIO, writer: BinaryIO, chunk_size: int = STREAM_CHUNK_BYTES) -> int:
+    total = 0
+    while True:
+        block = reader.read(chunk_size)
+        if not block:
+            return total
+        writer.write(block)
+        total += len(block)
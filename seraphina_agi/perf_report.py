@@ -0,0 +1,91 @@
+"""
+Named performance metrics and how two sets of them compare.
+A metric is {'value', 'unit', 'better'}, with better 'higher' or 'lower'. The
+benchmark suite and optimize both report results in this form, compare them
+metric by metric against a percentage threshold and print them as a table.
+"""
+
+import os
+import platform
+from typing import Any, Dict, List, Optional
+
+DEFAULT_THRESHOLD_PCT = 10.0
+
+Metric = Dict[str, Any]
+
+
+def metric(value: float, unit: str, better: str) -> Metric:
+    return {'value': value, 'unit': unit, 'better': better}
+
+
+def environment() -> Dict[str, Any]:
+    from . import octabit_cipher
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': octabit_cipher._np is not None
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any],
+            threshold_pct: float = DEFAULT_THRESHOLD_PCT) -> Dict[str, Any]:
+    """
+    Compare two suite reports metric by metric.
+
+    Args:
+        current: Report from run()
+        baseline: Earlier report from run(), e.g. loaded from a saved JSON file
+        threshold_pct: A metric regresses when it is worse by more than this percentage
+
+    Returns:
+        {'threshold_pct', 'regressions': [...], 'improvements': [...], 'metrics': {name: {...}}}
+    """
+    metrics = {}
+    regressions, improvements = [], []
+    base_results = baseline.get('results', {})
+    for name, metric in current['results'].items():
+        base = base_results.get(name)
+        if base is None or not base['value'] or metric['value'] is None:
+            continue
+        change_pct = (metric['value'] - base['value']) / base['value'] * 100
+        worse_pct = change_pct if metric['better'] == 'lower' else -change_pct
+        metrics[name] = {'baseline': base['value'], 'current': metric['value'], 'unit': metric['unit'],
+                         'change_pct': round(change_pct, 1)}
+        if worse_pct > threshold_pct:
+            regressions.append(name)
+        elif worse_pct < -threshold_pct:
+            improvements.append(name)
+    return {
+        'threshold_pct': threshold_pct,
+        'regressions': regressions,
+        'improvements': improvements,
+        'missing': sorted(set(base_results) - set(current['results'])),
+        'metrics': metrics
+    }
+
+
+def format_report(report: Dict[str, Any], worse_flag: str = 'REGRESSION',
+                  worse_summary: str = 'regression(s)') -> str:
+    # worse_flag marks a metric in comparison['regressions']; worse_summary names their count.
+    comparison = report.get('comparison')
+    lines = []
+    for name, metric in report['results'].items():
+        line = f"{name:<48} {metric['value']:>12} {metric['unit']}"
+        compared = comparison and comparison['metrics'].get(name)
+        if compared:
+            flag = ''
+            if name in comparison['regressions']:
+                flag = f'  {worse_flag}'
+            elif name in comparison['improvements']:
+                flag = '  improved'
+            line += f"  ({compared['change_pct']:+.1f}% vs {compared['baseline']}){flag}"
+        lines.append(line)
+    if comparison:
+        lines.append(f"{len(comparison['regressions'])} {worse_summary} beyond {comparison['threshold_pct']}%")
+    return '\n'.join(lines)
+
+
+def parse_names(value: Optional[str]) -> Optional[List[str]]:
+    return [name.strip() for name in value.split(',') if name.strip()] if value else None
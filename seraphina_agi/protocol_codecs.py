@@ -0,0 +1,393 @@
+"""
+Codecs for the protocol codes in supported_languages['protocol'].
+Each message is parsed and validated in one pass and packed into a compact
+binary form according to the code's kind: hex fields become raw bytes
+(bytes.fromhex), numeric fields 4-byte big-endian integers, base64 is decoded
+natively, and JSON/Stratum messages are packed value by value with lowercase
+hex strings stored as bytes. decode() turns the binary form back into the
+canonical text (lowercase hex, compact JSON).
+
+ProtocolLineDecoder applies a codec to a newline-delimited byte stream, as
+read from a socket or file, and can XOR each packed message with a cipher key.
+"""
+
+import base64
+import binascii
+import json
+import re
+import struct
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .octabit_cipher import xor_bytes
+
+Message = Union[str, bytes, bytearray, memoryview]
+
+# Per-code constraints on top of the kind: packed byte lengths for hex codes,
+# expected method and params count for Stratum codes.
+HEX_LENGTHS = {
+    'proto:blockheader.hex': (80, 80),
+    'proto:sha256-hash': (32, 32)
+}
+HEX_MULTIPLE = {'proto:merkle.hex': 32}
+STRATUM_METHODS = {
+    'proto:stratum.notify': ('mining.notify', 9, 9),
+    'proto:stratum.set_difficulty': ('mining.set_difficulty', 1, 1),
+    'proto:stratum.submit': ('mining.submit', 5, 6)
+}
+MAX_LINE_BYTES = 1024 * 1024
+
+_LOWER_HEX = re.compile(r'[0-9a-f]*').fullmatch
+_DOUBLE = struct.Struct('>d')
+_UINT32 = struct.Struct('>I')
+_fromhex = bytes.fromhex
+
+# Tags of the packed JSON value format.
+_NULL, _TRUE, _FALSE, _INT, _FLOAT, _HEX, _STR, _LIST, _OBJECT = b'ntfidhslo'
+
+
+class ProtocolError(ValueError):
+    pass
+
+
+def _text(message: Message) -> str:
+    if isinstance(message, str):
+        return message.strip()
+    try:
+        return str(message, 'ascii').strip()
+    except UnicodeDecodeError as e:
+        raise ProtocolError(f'non-ASCII byte at {e.start}') from None
+
+
+def _varint(n: int, out: bytearray):
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(data: memoryview, pos: int) -> Tuple[int, int]:
+    n = shift = 0
+    while True:
+        b = data[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, pos
+        shift += 7
+
+
+def _pack_value(value: Any, out: bytearray):
+    # Lengths and counts below 0x80 are the common case and skip _varint.
+    t = type(value)
+    if t is str:
+        if value and not len(value) & 1 and _LOWER_HEX(value):
+            data = _fromhex(value)
+            out.append(_HEX)
+        else:
+            data = value.encode('utf-8')
+            out.append(_STR)
+        n = len(data)
+        if n < 0x80:
+            out.append(n)
+        else:
+            _varint(n, out)
+        out += data
+    elif t is int:
+        out.append(_INT)
+        z = value << 1 if value >= 0 else (-value << 1) - 1
+        if z < 0x80:
+            out.append(z)
+        else:
+            _varint(z, out)
+    elif t is list:
+        out.append(_LIST)
+        _varint(len(value), out)
+        for item in value:
+            _pack_value(item, out)
+    elif t is dict:
+        out.append(_OBJECT)
+        _varint(len(value), out)
+        for key, item in value.items():
+            data = key.encode('utf-8')
+            _varint(len(data), out)
+            out += data
+            _pack_value(item, out)
+    elif value is None:
+        out.append(_NULL)
+    elif value is True:
+        out.append(_TRUE)
+    elif value is False:
+        out.append(_FALSE)
+    elif t is float:
+        out.append(_FLOAT)
+        out += _DOUBLE.pack(value)
+    else:
+        raise ProtocolError(f'cannot pack {t.__name__}')
+
+
+def _unpack_value(data: memoryview, pos: int) -> Tuple[Any, int]:
+    tag = data[pos]
+    pos += 1
+    if tag == _HEX or tag == _STR:
+        length, pos = _read_varint(data, pos)
+        chunk = data[pos:pos + length]
+        return (chunk.hex() if tag == _HEX else str(chunk, 'utf-8')), pos + length
+    if tag == _INT:
+        z, pos = _read_varint(data, pos)
+        return (z >> 1 if not z & 1 else -((z + 1) >> 1)), pos
+    if tag == _LIST:
+        count, pos = _read_varint(data, pos)
+        items = []
+        for _ in range(count):
+            item, pos = _unpack_value(data, pos)
+            items.append(item)
+        return items, pos
+    if tag == _OBJECT:
+        count, pos = _read_varint(data, pos)
+        obj = {}
+        for _ in range(count):
+            length, pos = _read_varint(data, pos)
+            key = str(data[pos:pos + length], 'utf-8')
+            obj[key], pos = _unpack_value(data, pos + length)
+        return obj, pos
+    if tag == _NULL:
+        return None, pos
+    if tag == _TRUE:
+        return True, pos
+    if tag == _FALSE:
+        return False, pos
+    if tag == _FLOAT:
+        return _DOUBLE.unpack_from(data, pos)[0], pos + 8
+    raise ProtocolError(f'unknown tag {tag!r} at byte {pos - 1}')
+
+
+def pack_json(value: Any) -> bytes:
+    out = bytearray()
+    _pack_value(value, out)
+    return bytes(out)
+
+
+def unpack_json(data: Union[bytes, bytearray, memoryview]) -> Any:
+    view = memoryview(data)
+    try:
+        value, pos = _unpack_value(view, 0)
+    except (IndexError, UnicodeDecodeError, struct.error) as e:
+        raise ProtocolError(f'truncated or corrupt packed message: {e}') from None
+    if pos != len(view):
+        raise ProtocolError(f'{len(view) - pos} trailing bytes after packed message')
+    return value
+
+
+class Codec:
+    """Packs one message of a protocol code into binary and back."""
+    kind = ''
+
+    def __init__(self, code: str):
+        self.code = code
+
+    def encode(self, message: Message) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, data: Union[bytes, bytearray, memoryview]) -> str:
+        # Raises ProtocolError when data is not a packed message of this kind.
+        raise NotImplementedError
+
+
+class HexCodec(Codec):
+    kind = 'hex'
+
+    def encode(self, message: Message) -> bytes:
+        text = _text(message)
+        try:
+            data = bytes.fromhex(text)
+        except ValueError as e:
+            raise ProtocolError(f'{self.code}: {e}') from None
+        if len(data) * 2 != len(text):
+            raise ProtocolError(f'{self.code}: whitespace inside hex field')
+        low, high = HEX_LENGTHS.get(self.code, (1, None))
+        if len(data) < low or (high is not None and len(data) > high):
+            raise ProtocolError(f'{self.code}: {len(data)} bytes, expected {low}' +
+                                (f'-{high}' if high != low else ''))
+        multiple = HEX_MULTIPLE.get(self.code)
+        if multiple and len(data) % multiple:
+            raise ProtocolError(f'{self.code}: {len(data)} bytes is not a multiple of {multiple}')
+        return data
+
+    def decode(self, data) -> str:
+        return bytes(data).hex()
+
+
+class NumericCodec(Codec):
+    # nbits / ntime / nonce: unsigned 32-bit. All-digit input is decimal;
+    # a 0x prefix or a hex letter (as in the Stratum wire form) makes it hex.
+    # decode() always returns eight hex digits.
+    kind = 'numeric'
+
+    def encode(self, message: Message) -> bytes:
+        text = _text(message)
+        try:
+            if text[:2] in ('0x', '0X'):
+                value = int(text[2:], 16)
+            elif text.isdigit():
+                value = int(text, 10)
+            else:
+                value = int(text, 16)
+        except ValueError:
+            raise ProtocolError(f'{self.code}: not a number: {text[:32]!r}') from None
+        if not 0 <= value <= 0xFFFFFFFF:
+            raise ProtocolError(f'{self.code}: {value} does not fit in 32 bits')
+        return _UINT32.pack(value)
+
+    def decode(self, data) -> str:
+        if len(data) != _UINT32.size:
+            raise ProtocolError(f'{self.code}: {len(data)} bytes, expected {_UINT32.size}')
+        return f'{_UINT32.unpack(bytes(data))[0]:08x}'
+
+
+class Base64Codec(Codec):
+    kind = 'base64'
+
+    def encode(self, message: Message) -> bytes:
+        try:
+            return base64.b64decode(_text(message), validate=True)
+        except binascii.Error as e:
+            raise ProtocolError(f'{self.code}: {e}') from None
+
+    def decode(self, data) -> str:
+        return base64.b64encode(data).decode('ascii')
+
+
+class AsciiCodec(Codec):
+    kind = 'ascii'
+
+    def encode(self, message: Message) -> bytes:
+        text = _text(message)
+        if not (text.isascii() and text.isprintable()):
+            raise ProtocolError(f'{self.code}: not printable ASCII: {text[:32]!r}')
+        return text.encode('ascii')
+
+    def decode(self, data) -> str:
+        try:
+            return bytes(data).decode('ascii')
+        except UnicodeDecodeError as e:
+            raise ProtocolError(f'{self.code}: non-ASCII byte at {e.start}') from None
+
+
+class AlphanumericCodec(AsciiCodec):
+    kind = 'alphanumeric'
+
+    def encode(self, message: Message) -> bytes:
+        text = _text(message)
+        if not (text.isascii() and text.isalnum()):
+            raise ProtocolError(f'{self.code}: not alphanumeric: {text[:32]!r}')
+        return text.encode('ascii')
+
+
+class JsonCodec(Codec):
+    kind = 'json'
+
+    def encode(self, message: Message) -> bytes:
+        try:
+            value = json.loads(bytes(message) if isinstance(message, memoryview) else message)
+        except ValueError as e:
+            raise ProtocolError(f'{self.code}: invalid JSON: {e}') from None
+        self.validate(value)
+        return pack_json(value)
+
+    def validate(self, value: Any):
+        if not isinstance(value, dict):
+            raise ProtocolError(f'{self.code}: message must be a JSON object')
+
+    def decode(self, data) -> str:
+        return json.dumps(unpack_json(data), separators=(',', ':'))
+
+
+class StratumCodec(JsonCodec):
+    kind = 'stratum'
+
+    def validate(self, value: Any):
+        super().validate(value)
+        rule = STRATUM_METHODS.get(self.code)
+        if rule is None:
+            return
+        method, low, high = rule
+        if value.get('method') != method:
+            raise ProtocolError(f'{self.code}: method must be {method!r}, got {value.get("method")!r}')
+        params = value.get('params')
+        if not isinstance(params, list) or not low <= len(params) <= high:
+            raise ProtocolError(f'{self.code}: {method} takes {low}' + (f'-{high}' if high != low else '') +
+                                ' params')
+
+
+CODECS = {cls.kind: cls for cls in (HexCodec, NumericCodec, Base64Codec, AsciiCodec, AlphanumericCodec,
+                                     JsonCodec, StratumCodec)}
+
+
+def codec_for(code: str, kind: str) -> Codec:
+    """Codec for a protocol code; raises KeyError for an unknown kind."""
+    return CODECS[kind](code)
+
+
+class ProtocolLineDecoder:
+    def __init__(self, codec: Codec, key: Optional[Sequence[int]] = None, skip_invalid: bool = False,
+                 max_line_bytes: int = MAX_LINE_BYTES):
+        """
+        Incremental newline-delimited message decoder.
+
+        Args:
+            codec: Codec applied to each non-blank line
+            key: Cipher key; when set each packed message is XORed with it
+            skip_invalid: Count and drop invalid lines instead of raising
+            max_line_bytes: Longest line accepted before ProtocolError
+        """
+        self.codec = codec
+        self.key = key
+        self.skip_invalid = skip_invalid
+        self.max_line_bytes = max_line_bytes
+        self.messages = 0
+        self.errors = 0
+        self.lines = 0
+        self._partial = b''
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Decode every complete line in chunk; the tail waits for the next call."""
+        data = self._partial + chunk if self._partial else chunk
+        lines = data.split(b'\n')
+        self._partial = lines.pop()
+        if len(self._partial) > self.max_line_bytes:
+            raise ProtocolError(f'line {self.lines + 1} exceeds {self.max_line_bytes} bytes')
+        return self._decode_lines(lines)
+
+    def close(self) -> List[bytes]:
+        """Decode a final line that had no trailing newline."""
+        tail, self._partial = self._partial, b''
+        return self._decode_lines([tail]) if tail.strip() else []
+
+    def _decode_lines(self, lines: List[bytes]) -> List[bytes]:
+        encode, key = self.codec.encode, self.key
+        out = []
+        for line in lines:
+            self.lines += 1
+            if not line.strip():
+                continue
+            try:
+                packed = encode(line)
+            except ProtocolError as e:
+                if not self.skip_invalid:
+                    raise ProtocolError(f'line {self.lines}: {e}') from None
+                self.errors += 1
+                continue
+            out.append(xor_bytes(packed, key) if key else packed)
+        self.messages += len(out)
+        return out
+
+    def iter_stream(self, reader: BinaryIO, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        while True:
+            chunk = reader.read(chunk_size)
+            if not chunk:
+                break
+            yield from self.feed(bytes(chunk))
+        yield from self.close()
+
+    def stats(self) -> Dict[str, int]:
+        return {'lines': self.lines, 'messages': self.messages, 'errors': self.errors}
@@ -0,0 +1,103 @@
+"""
+Memoization cache for process_language results.
+process_language is deterministic for a given input, resolved options and
+engine version, so repeated requests can be answered from memory. Entries are
+keyed by a SHA-256 digest of those values and evicted least-recently-used
+once the entry count or the approximate byte budget is exceeded; an optional
+TTL expires entries on lookup. All operations take one lock and are safe to
+share between server threads.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Rough per-entry cost of the key, dict and bookkeeping on top of the strings.
+ENTRY_OVERHEAD_BYTES = 400
+
+
+def result_size(result: Dict[str, Any]) -> int:
+    """Approximate memory held by a cached result (string lengths plus overhead)."""
+    return ENTRY_OVERHEAD_BYTES + sum(len(v) for v in result.values() if isinstance(v, str))
+
+
+class ResultCache:
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttl: Optional[float] = None):
+        # ttl: seconds an entry stays valid; None keeps entries until evicted.
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.bytes = 0
+        self._entries: 'OrderedDict[bytes, Tuple[Optional[float], int, Dict[str, Any]]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(input_text: str, source_lang: str, target_lang: str, encryption_enabled: bool,
+            version: str) -> bytes:
+        spec = json.dumps([input_text, source_lang, target_lang, bool(encryption_enabled), version])
+        return hashlib.sha256(spec.encode('utf-8', 'surrogatepass')).digest()
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        # Returns a copy so callers may modify the result freely.
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires, size, result = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._entries[key]
+                self.bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(result)
+
+    def put(self, key: bytes, result: Dict[str, Any]):
+        size = result_size(result)
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._entries[key] = (expires, size, dict(result))
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                _, (_, evicted, _) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
@@ -1,6 +1,32 @@
-import hashlib
+"""
+Roman spiral decoder wheels and the octonion arithmetic they use.
+decode_data works on the whole hex buffer at once: characters are mapped to
+squared nibble values with one bytes.translate, summed per 8-character chunk
+(through NumPy as an N x 8 matrix when it is installed) and the chunks are
+filtered with a mask against the largest sum of squares the wheel keeps.
+Output and the theta advance per call are bit-identical to the original
+per-character loop.
+"""
+
 import math
-from typing import List, Dict, Any, Optional
+from typing import List, Optional, Union
+
+from .metrics import timed
+
+try:
+    import numpy as _np
+except ImportError:  # NumPy is optional
+    _np = None
+
+CHUNK_CHARS = 8
+# Below this many hex characters the NumPy call overhead outweighs its speed.
+NUMPY_MIN_CHARS = 1024
+# Largest possible sum of squared nibbles in one chunk: 8 * 15 ** 2.
+_MAX_SQUARES = CHUNK_CHARS * 15 * 15
+_SQUARED_NIBBLE = bytes(
+    int(chr(b), 16) ** 2 if chr(b) in '0123456789abcdefABCDEF' else 0 for b in range(256)
+)
+
 
 class SimpleOcto:
     def __init__(self, coeffs: Optional[List[float]] = None):
@@ -22,6 +48,63 @@ class SimpleOcto:
             return self.multiply(self)
         return self
 
+
+def octo_multiply_batch(a, b):
+    """
+    Row-wise SimpleOcto.multiply over arrays of octonions.
+
+    Args:
+        a: N x 8 coefficients (NumPy array or sequence of 8-float rows)
+        b: N x 8 coefficients, or one row broadcast against every row of a
+
+    Returns:
+        N x 8 float64 array with NumPy, else a list of coefficient lists;
+        each row equals SimpleOcto(a[i]).multiply(SimpleOcto(b[i])).coeffs for float input
+    """
+    if _np is None:
+        rows_b = [b] * len(a) if len(b) == 8 and not isinstance(b[0], (list, tuple)) else b
+        return [SimpleOcto(list(x)).multiply(SimpleOcto(list(y))).coeffs for x, y in zip(a, rows_b)]
+    a = _np.asarray(a, dtype=_np.float64).reshape(-1, 8)
+    b = _np.broadcast_to(_np.asarray(b, dtype=_np.float64), a.shape)
+    out = _np.empty_like(a)
+    # Accumulate in the same order as the scalar sum() so results match bit for bit.
+    dot = 0.0 + a[:, 1] * b[:, 1]
+    for i in range(2, 8):
+        dot += a[:, i] * b[:, i]
+    out[:, 0] = a[:, 0] * b[:, 0] - dot
+    out[:, 1:] = a[:, :1] * b[:, 1:] + b[:, :1] * a[:, 1:]
+    return out
+
+
+def octo_norm_batch(a):
+    """Row-wise SimpleOcto.norm over an N x 8 array (list of floats without NumPy)."""
+    if _np is None:
+        return [SimpleOcto(list(x)).norm() for x in a]
+    a = _np.asarray(a, dtype=_np.float64).reshape(-1, 8)
+    total = 0.0 + a[:, 0] * a[:, 0]
+    for i in range(1, 8):
+        total += a[:, i] * a[:, i]
+    return _np.sqrt(total)
+
+
+def _kept_squares_limit(spiral_r: float) -> int:
+    # A chunk is kept when math.sqrt(sum of squares) * spiral_r <= 2. That is
+    # monotonic in the integer sum, so find the largest kept sum by bisection
+    # with the exact same float expression instead of evaluating every chunk.
+    if not math.sqrt(0) * spiral_r <= 2:
+        return -1
+    lo, hi = 0, _MAX_SQUARES
+    if math.sqrt(hi) * spiral_r <= 2:
+        return hi
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if math.sqrt(mid) * spiral_r <= 2:
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
 class RomanDecoderWheel:
     def __init__(self, plane: str = 'xy', freq: float = 432.0, hue: float = 600.0):
         self.plane = plane
@@ -30,9 +113,35 @@ class RomanDecoderWheel:
         self.theta = 0.0
         self.r = hue / 1000.0
 
-    def decode_data(self, hex_str: str) -> str:
+    @timed('wheel_decode')
+    def decode_data(self, hex_str: Union[str, bytes, bytearray, memoryview]) -> str:
         self.theta += 2 * math.pi * (self.freq / 432.0) / 8
         spiral_r = self.r * (math.cos(8 * self.theta) + 1.5) / 2.5
+        if isinstance(hex_str, str):
+            if not hex_str.isascii():
+                # int(c, 16) also accepts non-ASCII digits; keep its exact rules.
+                return self._decode_slow(hex_str, spiral_r)
+            data = hex_str.encode('ascii')
+        else:
+            data = bytes(hex_str)
+        if not data:
+            return ''
+        limit = _kept_squares_limit(spiral_r)
+        squares = data.translate(_SQUARED_NIBBLE)
+        full = len(data) - len(data) % CHUNK_CHARS
+        if _np is not None and full >= NUMPY_MIN_CHARS:
+            sums = _np.frombuffer(squares, dtype=_np.uint8, count=full).reshape(-1, CHUNK_CHARS).sum(axis=1)
+            chunks = _np.frombuffer(data, dtype=_np.uint8, count=full).reshape(-1, CHUNK_CHARS)
+            kept = chunks[sums <= limit].tobytes()
+        else:
+            kept = b''.join(data[i:i + CHUNK_CHARS] for i in range(0, full, CHUNK_CHARS)
+                            if sum(squares[i:i + CHUNK_CHARS]) <= limit)
+        if full < len(data) and sum(squares[full:]) <= limit:
+            kept += data[full:]
+        return kept.decode('latin-1')
+
+    @staticmethod
+    def _decode_slow(hex_str: str, spiral_r: float) -> str:
         decoded = []
         for i in range(0, len(hex_str), 8):
             chunk = hex_str[i:i+8]
@@ -45,4 +154,4 @@ class RomanDecoderWheel:
             n = SimpleOcto(oct_coeffs).norm() * spiral_r
             if n <= 2:
                 decoded.append(chunk)
-        return ''.join(decoded)
\ No newline at end of file
+        return ''.join(decoded)
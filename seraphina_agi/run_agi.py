@@ -1,126 +1,473 @@
 import argparse
+import itertools
 import json
-from http.server import BaseHTTPRequestHandler, HTTPServer
 import threading
-import pyttsx3
-import speech_recognition as sr
-import requests
-import hashlib
+import mmap
+import os
+import sys
+import time
+from contextlib import contextmanager
 from .advanced_language_engine import AdvancedLanguageEngine
+from .cipher_cache import default_cache_dir
 from .linux_octabit_quantum_core import LinuxOctaBitQuantumCore
+from .voice import NOT_UNDERSTOOD, VoiceSession, listen, speak
 
-def speak(text):
-    engine = pyttsx3.init()
-    engine.say(text)
-    engine.runAndWait()
+# Voice, network and HTTP-server dependencies are imported inside the
+# functions that use them so each command only loads what it needs.
 
-def listen():
-    recognizer = sr.Recognizer()
-    with sr.Microphone() as source:
-        print("Listening...")
-        audio = recognizer.listen(source)
-        try:
-            text = recognizer.recognize_google(audio)
-            return text
-        except sr.UnknownValueError:
-            return "Sorry, I didn't understand that."
-        except sr.RequestError:
-            return "Speech recognition service unavailable."
-
-def share_data(data, server_url="https://httpbin.org/post"):  # Placeholder server
-    # Anonymize data
-    hashed = hashlib.sha256(json.dumps(data).encode()).hexdigest()
-    payload = {"hash": hashed, "type": "agi_processing"}
+def __getattr__(name):
+    # RequestHandler and serve used to be defined here; keep the old import
+    # path working without loading http.server for every command.
+    if name in ('RequestHandler', 'serve'):
+        from . import server
+        return getattr(server, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+_share_uploaders = {}
+_share_lock = threading.Lock()
+
+def get_share_uploader(server_url=None):
+    # One background uploader per collector URL for the whole process; queued
+    # payloads are flushed at exit and spilled to a journal in the cache dir.
+    with _share_lock:
+        uploader = _share_uploaders.get(server_url)
+        if uploader is None:
+            from .share_uploader import BackgroundUploader
+            cache_dir = default_cache_dir()
+            journal = os.path.join(cache_dir, 'share-journal.ndjson') if cache_dir else None
+            uploader = _share_uploaders[server_url] = BackgroundUploader(server_url, journal_path=journal)
+        return uploader
+
+def share_data(data, server_url=None):
+    # Anonymize data (sha256 of the result) and queue it; the upload runs on
+    # a background thread so the caller never waits on the network.
+    return get_share_uploader(server_url).submit(data)
+
+@contextmanager
+def open_stream_input(path):
+    # Regular files are memory-mapped so large inputs are paged in on demand
+    # instead of copied through a read buffer.
+    if path in (None, '-'):
+        yield sys.stdin.buffer
+        return
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield f
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+@contextmanager
+def open_stream_output(path):
+    if path in (None, '-'):
+        yield sys.stdout.buffer
+        sys.stdout.buffer.flush()
+        return
+    with open(path, 'wb') as f:
+        yield f
+
+def run_stream_cipher(command, language, in_path, out_path, chunk_size=None):
+    engine = AdvancedLanguageEngine(cache_dir=default_cache_dir())
+    if language not in engine.octabit_encryption['frequency_cipher']:
+        print(f'Error: unknown language code {language!r}', file=sys.stderr)
+        return 1
+    method = engine.encrypt_stream if command == 'encrypt' else engine.decrypt_stream
+    kwargs = {'chunk_size': chunk_size} if chunk_size else {}
+    try:
+        with open_stream_input(in_path) as reader, open_stream_output(out_path) as writer:
+            method(reader, writer, language, **kwargs)
+    except (OSError, ValueError) as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 1
+    return 0
+
+# --stdin / --input-file output is written in blocks of STREAM_FLUSH_BYTES,
+# at least every STREAM_FLUSH_SECONDS; records/s go to stderr every
+# STREAM_STATS_SECONDS and at the end.
+STREAM_FLUSH_BYTES = 64 * 1024
+STREAM_FLUSH_SECONDS = 1.0
+STREAM_STATS_SECONDS = 10.0
+
+def _stream_records(reader, ndjson=False):
+    # One record per input line, read lazily: a text line as-is, or with
+    # ndjson a string / {"input": ..., "options": ...} record (blank lines skipped).
+    from .server import parse_batch_record
+    for line in iter(reader.readline, b''):
+        line = line.rstrip(b'\r\n')
+        if not ndjson:
+            yield line.decode('utf-8', 'replace')
+        elif line.strip():
+            yield parse_batch_record(line)
+
+def _ordered_results(records, process):
+    # Runs of good records go through process() lazily, in order; a bad
+    # NDJSON record becomes an in-place error line instead of ending the job.
+    from .server import BatchRecordError
+    for bad, group in itertools.groupby(records, key=lambda r: isinstance(r, BatchRecordError)):
+        if bad:
+            for record in group:
+                yield {'error': str(record)}
+        else:
+            yield from process(group)
+
+def _report_rate(count, elapsed, done=False):
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(f"[Seraphina AGI] {'processed ' if done else ''}{count} records in {elapsed:.1f}s ({rate:.0f} records/s)",
+          file=sys.stderr, flush=True)
+
+def write_ndjson(results, writer, quiet=False):
+    # Compact NDJSON, buffered: memory stays at one output block however
+    # long the stream is.
+    encode = json.JSONEncoder(separators=(',', ':')).encode
+    start = last_flush = last_stats = time.monotonic()
+    pending, pending_bytes, count = [], 0, 0
+    for result in results:
+        line = (encode(result) + '\n').encode('utf-8')
+        pending.append(line)
+        pending_bytes += len(line)
+        count += 1
+        now = time.monotonic()
+        if pending_bytes >= STREAM_FLUSH_BYTES or now - last_flush >= STREAM_FLUSH_SECONDS:
+            writer.write(b''.join(pending))
+            writer.flush()
+            pending, pending_bytes, last_flush = [], 0, now
+        if not quiet and now - last_stats >= STREAM_STATS_SECONDS:
+            _report_rate(count, now - start)
+            last_stats = now
+    writer.write(b''.join(pending))
+    writer.flush()
+    if not quiet:
+        _report_rate(count, time.monotonic() - start, done=True)
+    return count
+
+def run_bulk_process(in_path, processes=0, ndjson=False, out_path='-', quiet=False, batch_size=None):
+    # One record per input line, one compact JSON result per output line, in
+    # order; with processes > 0 the work fans out over a bounded window.
     try:
-        response = requests.post(server_url, json=payload)
-        print(f"Shared data: {response.status_code}")
-    except Exception as e:
-        print(f"Share failed: {e}")
-
-class RequestHandler(BaseHTTPRequestHandler):
-    def do_POST(self):
-        if self.path == '/process':
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            try:
-                body = json.loads(post_data.decode('utf-8'))
-                input_text = body.get('input', '')
-                opts = body.get('options', {})
-                engine = AdvancedLanguageEngine()
-                result = engine.process_language(input_text, opts)
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps(result).encode('utf-8'))
-            except Exception as e:
-                self.send_response(400)
-                self.end_headers()
-                self.wfile.write(json.dumps({'error': str(e)}).encode('utf-8'))
+        with open_stream_input(in_path) as reader, open_stream_output(out_path) as writer:
+            records = _stream_records(reader, ndjson)
+            if processes > 0:
+                from .worker_pool import ProcessEnginePool
+                with ProcessEnginePool(processes, cache_dir=default_cache_dir(),
+                                       **({'chunk_items': batch_size} if batch_size else {})) as pool:
+                    write_ndjson(_ordered_results(records, pool.map), writer, quiet)
+            else:
+                engine = AdvancedLanguageEngine(cache_dir=default_cache_dir())
+                write_ndjson(_ordered_results(records, engine.process_many), writer, quiet)
+    except BrokenPipeError:
+        # Downstream stopped reading (e.g. `| head`); exit without a traceback.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except OSError as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 1
+    return 0
+
+def _archive_records(reader, ndjson, language):
+    # (kind, value, language, protocol encoding) per input line: a process
+    # result's token, or text to encrypt.
+    for line in iter(reader.readline, b''):
+        line = line.rstrip(b'\r\n')
+        if not ndjson:
+            yield 'text', line, language, None
+            continue
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if isinstance(record, str):
+            yield 'text', record, language, None
+        elif isinstance(record, dict) and record.get('encrypted_input') and record.get('detected_language'):
+            yield 'token', record['encrypted_input'], record['detected_language'], record.get('protocol_encoding')
         else:
-            self.send_response(404)
-            self.end_headers()
+            raise ValueError('expected a string or a process result with encrypted_input and detected_language')
+
+def run_archive(action, in_path, out_path, language=None, record_id=None, ndjson=False):
+    # pack: text lines (under --language) or process results (--ndjson) into
+    # the archive at --out; get: one decrypted record; scan: NDJSON listing.
+    from .octabit_archive import ArchiveError, ArchiveReader, ArchiveWriter
+    engine = AdvancedLanguageEngine(cache_dir=default_cache_dir())
+    try:
+        if action == 'pack':
+            if out_path in (None, '-'):
+                print('Error: archive pack needs --out ARCHIVE', file=sys.stderr)
+                return 1
+            with open_stream_input(in_path) as reader, ArchiveWriter(out_path, engine) as writer:
+                first = len(writer)
+                for kind, value, code, encoding in _archive_records(reader, ndjson, language or 'en-US'):
+                    if kind == 'token':
+                        writer.append_token(value, code, encoding)
+                    else:
+                        writer.append(value, code)
+                print(f'[Seraphina AGI] packed {len(writer) - first} records into {out_path} '
+                      f'({len(writer)} total)', file=sys.stderr)
+        elif in_path in (None, '-'):
+            print(f'Error: archive {action} needs --in ARCHIVE', file=sys.stderr)
+            return 1
+        elif action == 'get':
+            if record_id is None:
+                print('Error: archive get needs --id N', file=sys.stderr)
+                return 1
+            with ArchiveReader(in_path, engine) as archive, open_stream_output(out_path) as writer:
+                writer.write(archive.get(record_id))
+        else:
+            encode = json.JSONEncoder(separators=(',', ':')).encode
+            with ArchiveReader(in_path, engine) as archive, open_stream_output(out_path) as writer:
+                for rid, code, data in archive.records(language):
+                    text = data.decode('utf-8', errors='replace')
+                    writer.write((encode({'id': rid, 'language': code, 'text': text}) + '\n').encode('utf-8'))
+    except (ArchiveError, IndexError, OSError, ValueError) as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 1
+    return 0
+
+def load_tuned_settings(path=None):
+    # Settings saved by `optimize` ({} without a file); flags given on the
+    # command line take precedence over them.
+    from .autotune import default_tuning_path, load_settings
+    if path and not os.path.exists(path):
+        print(f'Error: tuning file not found: {path}', file=sys.stderr)
+        sys.exit(2)
+    try:
+        return load_settings(path or default_tuning_path())
+    except (OSError, ValueError) as e:
+        print(f'Error: {e}', file=sys.stderr)
+        sys.exit(2)
 
-def serve(port: int = 8080):
-    server = HTTPServer(('localhost', port), RequestHandler)
-    print(f'[Seraphina AGI] HTTP API listening on {port} (POST /process)')
-    server.serve_forever()
+def run_optimize(args):
+    from .autotune import optimize
+    from .perf_report import parse_names
+    from .server import BatchRecordError
+    records, source = None, 'sample'
+    if args.stdin or args.input_file:
+        source = '-' if args.stdin else args.input_file
+        try:
+            with open_stream_input(source) as reader:
+                parsed = list(_stream_records(reader, args.ndjson))
+        except OSError as e:
+            print(f'Error: {e}', file=sys.stderr)
+            return 2
+        records = [r for r in parsed if not isinstance(r, BatchRecordError) and r != '']
+        if len(records) < len(parsed) and not args.quiet:
+            print(f'[Seraphina AGI] skipped {len(parsed) - len(records)} empty or invalid records', file=sys.stderr)
+    return optimize(records, args.config, parse_names(args.only), args.latency_ms, args.threshold,
+                    args.processes or 2, args.force, args.quick, source, args.quiet)
+
+def run_bulk_inbot_codes(in_path, count=1, out_path='-'):
+    # One seed per input line, one inbot code JSON object per output line,
+    # computed in bulk without building a quantum core per seed.
+    from .linux_octabit_quantum_core import write_inbot_codes
+    if count < 1:
+        print('Error: --count must be at least 1', file=sys.stderr)
+        return 1
+    source = sys.stdin if in_path in (None, '-') else open(in_path, encoding='utf-8')
+    try:
+        seeds = (line.rstrip('\r\n') for line in source)
+        if out_path in (None, '-'):
+            write_inbot_codes(seeds, sys.stdout, count)
+        else:
+            with open(out_path, 'w', encoding='utf-8') as out:
+                write_inbot_codes(seeds, out, count)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    sys.stdout.flush()
+    return 0
 
 def main():
     parser = argparse.ArgumentParser(description='Seraphina AGI Companion')
-    parser.add_argument('command', choices=['serve', 'process', 'voice', 'quantum', 'train', 'optimize'], help='Command to run')
+    parser.add_argument('command', choices=['serve', 'process', 'voice', 'quantum', 'train', 'optimize', 'encrypt', 'decrypt', 'bench', 'archive'], help='Command to run')
+    parser.add_argument('action', nargs='?', choices=['pack', 'get', 'scan'], help='archive: pack, get or scan')
     parser.add_argument('--port', type=int, default=8080, help='Port for serve')
+    parser.add_argument('--host', help='Bind address for serve (default localhost; 0.0.0.0 for all interfaces)')
+    parser.add_argument('--workers', type=int,
+                        help='Worker threads for serve (default 8; with --asyncio executor threads, default 4)')
+    parser.add_argument('--backlog', type=int,
+                        help='Queued requests before serve answers 503 (default 64; with --asyncio the listen '
+                             'backlog, default 2048)')
+    parser.add_argument('--asyncio', action='store_true',
+                        help='serve: asyncio HTTP server (idle keep-alive connections hold no thread)')
     parser.add_argument('--input', help='Input text for process')
+    parser.add_argument('--input-file',
+                        help="Bulk process / quantum: one text or seed per line ('-' for stdin), NDJSON results; "
+                             'optimize: recorded workload')
+    parser.add_argument('--stdin', action='store_true', help='process: stream records from stdin (--input-file -)')
+    parser.add_argument('--ndjson', action='store_true',
+                        help='Bulk process / archive pack input is NDJSON: a string, or {"input", "options"} '
+                             '(process) / a process result (archive pack) per line')
+    parser.add_argument('--count', type=int, default=1, help='Inbot codes per seed for quantum --input-file')
+    parser.add_argument('--processes', type=int, default=0,
+                        help='Engine worker processes for serve / bulk process (optimize: for the batch sweep, '
+                             'default 2)')
+    parser.add_argument('--no-metrics', action='store_true',
+                        help='Disable serve metrics and /metrics, /debug/profile (SERAPHINA_METRICS=off removes all hooks)')
+    parser.add_argument('--cache-mb', type=float, help='Result cache size in MiB for serve (default 0: off)')
+    parser.add_argument('--cache-entries', type=int,
+                        help='Result cache entry limit (default 10000); turns the cache on at 64 MiB if needed')
+    parser.add_argument('--cache-ttl', type=float,
+                        help='Seconds a cached result stays valid (default: no expiry); turns the cache on too')
+    parser.add_argument('--tenants', help='serve: JSON file of per-tenant secrets {tenant_id: {"key", "salt"}}')
+    parser.add_argument('--max-tenants', type=int, help='Tenant engines serve keeps (default 10000)')
+    parser.add_argument('--tenant-mb', type=float, help='Memory budget in MiB for tenant engines (default 64)')
+    parser.add_argument('--allow-tenant-keys', action='store_true',
+                        help='serve: accept X-Tenant-Key/X-Tenant-Salt for tenants missing from --tenants '
+                             '(default: they get 403)')
     parser.add_argument('--voice', action='store_true', help='Use voice for input/output')
     parser.add_argument('--share', action='store_true', help='Share anonymized data for collective learning')
+    parser.add_argument('--share-url', help='Collector URL for --share (default $SERAPHINA_SHARE_URL or the placeholder)')
+    parser.add_argument('--in', dest='in_path', default='-',
+                        help='Input file for encrypt/decrypt/archive pack, or the archive for get/scan (default: stdin)')
+    parser.add_argument('--out', dest='out_path', default='-',
+                        help='Output file for encrypt/decrypt, bulk process and archive get/scan, the archive for '
+                             'pack, or the bench JSON report (default: stdout)')
+    parser.add_argument('--language', help='Language code whose cipher encrypt/decrypt/archive pack use '
+                                           '(default en-US); archive scan: only this language')
+    parser.add_argument('--id', dest='record_id', type=int, help='archive get: record id')
+    parser.add_argument('--chunk-size', type=int, help='Stream block size in bytes for encrypt/decrypt')
+    parser.add_argument('--baseline', help='Saved bench JSON report to compare against')
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help='Percent a bench / optimize metric may get worse before the command exits non-zero '
+                             '(default 10)')
+    parser.add_argument('--only', help='Comma-separated bench cases (process_language, cipher, roman_wheel, '
+                                       'quantum_core, http, cli) or optimize areas (serve, process, stream)')
+    parser.add_argument('--quick', action='store_true', help='bench / optimize: shorter timings')
+    parser.add_argument('--config', help='Tuned settings file written by optimize and read by serve, process, '
+                                         'encrypt and decrypt (default: tuning.json in the cache dir)')
+    parser.add_argument('--latency-ms', type=float, default=50.0, help='optimize: p99 latency target (default 50)')
+    parser.add_argument('--force', action='store_true',
+                        help='optimize: write settings even if they measure worse than the current ones')
+    parser.add_argument('--quiet', action='store_true', help='Only print results; status lines go to logging')
 
     args = parser.parse_args()
 
     if args.command == 'serve':
-        serve(args.port)
+        if args.asyncio and (args.processes > 0 or args.tenants or args.allow_tenant_keys):
+            print('Error: --asyncio does not support --processes, --tenants or --allow-tenant-keys', file=sys.stderr)
+            sys.exit(2)
+        if args.asyncio:
+            from .asgi import serve
+        else:
+            from .server import serve
+        if args.no_metrics:
+            from . import metrics
+            metrics.set_enabled(False)
+        tuned = load_tuned_settings(args.config)
+        workers = args.workers
+        if workers is None and not args.asyncio:  # --asyncio workers are executor threads, tuned separately
+            workers = tuned.get('serve', {}).get('workers')
+        cache_mb = args.cache_mb if args.cache_mb is not None else tuned.get('serve', {}).get('cache_mb', 0)
+        cache_limits = args.cache_entries is not None or args.cache_ttl is not None
+        if cache_limits and args.cache_mb is not None and args.cache_mb <= 0:
+            print('Error: --cache-entries and --cache-ttl need a result cache; drop --cache-mb 0', file=sys.stderr)
+            sys.exit(2)
+        if (args.cache_entries is not None and args.cache_entries <= 0) or \
+                (args.cache_ttl is not None and args.cache_ttl <= 0):
+            print('Error: --cache-entries and --cache-ttl must be positive', file=sys.stderr)
+            sys.exit(2)
+        overrides = {k: v for k, v in (('host', args.host), ('workers', workers), ('backlog', args.backlog))
+                     if v is not None}
+        if cache_mb > 0 or cache_limits:
+            # --cache-entries / --cache-ttl on their own turn the cache on at the default size.
+            from .result_cache import DEFAULT_MAX_BYTES, DEFAULT_MAX_ENTRIES, ResultCache
+            max_bytes = int(cache_mb * 1024 * 1024) if cache_mb > 0 else DEFAULT_MAX_BYTES
+            overrides['result_cache'] = ResultCache(args.cache_entries or DEFAULT_MAX_ENTRIES, max_bytes,
+                                                    args.cache_ttl)
+        if tuned:
+            print(f"[Seraphina AGI] Tuned settings: {json.dumps(tuned, separators=(',', ':'))}")
+        if not args.asyncio:
+            overrides['processes'] = args.processes
+            if tuned.get('process', {}).get('batch_size'):
+                overrides['batch_size'] = tuned['process']['batch_size']
+            if args.tenants:
+                from .tenant_pool import load_tenants
+                try:
+                    overrides['tenants'] = load_tenants(args.tenants)
+                except (OSError, ValueError) as e:
+                    print(f'Error: {e}', file=sys.stderr)
+                    sys.exit(2)
+            if args.max_tenants is not None:
+                overrides['max_tenants'] = args.max_tenants
+            if args.tenant_mb is not None:
+                overrides['tenant_bytes'] = int(args.tenant_mb * 1024 * 1024)
+            overrides['allow_tenant_keys'] = args.allow_tenant_keys
+        sys.exit(serve(args.port, **overrides))
     elif args.command == 'process':
+        if args.stdin or args.input_file:
+            tuned = load_tuned_settings(args.config)
+            sys.exit(run_bulk_process('-' if args.stdin else args.input_file, args.processes, args.ndjson,
+                                      args.out_path, args.quiet, tuned.get('process', {}).get('batch_size')))
         if args.voice:
             input_text = listen()
             print(f"You said: {input_text}")
+            if not input_text:
+                print(NOT_UNDERSTOOD)
+                speak(NOT_UNDERSTOOD)
+                return
         elif not args.input:
-            print('Error: --input required for process (or use --voice)')
+            print('Error: --input required for process (or use --voice, --stdin or --input-file)')
             return
         else:
             input_text = args.input
         
-        engine = AdvancedLanguageEngine()
+        engine = AdvancedLanguageEngine(cache_dir=default_cache_dir())
         result = engine.process_language(input_text)
         output_text = json.dumps(result, indent=2)
         print(output_text)
         if args.voice:
             speak(f"Processed: {result.get('translated_content', 'Done')}")
         if args.share:
-            share_data(result)
+            share_data(result, args.share_url)
     elif args.command == 'voice':
         print("Voice chat mode. Say 'exit' to quit.")
-        while True:
-            input_text = listen()
-            print(f"You: {input_text}")
-            if 'exit' in input_text.lower():
-                speak("Goodbye!")
-                break
-            engine = AdvancedLanguageEngine()
-            result = engine.process_language(input_text)
-            response = result.get('translated_content', 'Processed')
-            print(f"AGI: {response}")
-            speak(response)
-            if args.share:
-                share_data(result)
+        engine = AdvancedLanguageEngine(cache_dir=default_cache_dir())
+        with VoiceSession() as session:
+            while True:
+                print("Listening...")
+                input_text = session.listen()
+                print(f"You: {input_text}")
+                if 'exit' in input_text.lower():
+                    session.say("Goodbye!")
+                    break
+                if not input_text:
+                    print(f"AGI: {NOT_UNDERSTOOD}")
+                    session.say(NOT_UNDERSTOOD)
+                    continue
+                result = engine.process_language(input_text)
+                response = result.get('translated_content', 'Processed')
+                print(f"AGI: {response}")
+                # Speaks in the background while the loop shares and prepares the next turn.
+                session.say(response)
+                turn = session.turns[-1]
+                if not args.quiet:
+                    print(f"[latency] listen {turn['listen_ms']} ms, recognize {turn['recognize_ms']} ms, "
+                          f"respond {turn['respond_ms']} ms")
+                if args.share:
+                    share_data(result, args.share_url)
+        if not args.quiet:
+            print(f"[Seraphina AGI] Voice session: {json.dumps(session.latency_report())}")
     elif args.command == 'quantum':
-        core = LinuxOctaBitQuantumCore()
+        if args.input_file:
+            sys.exit(run_bulk_inbot_codes(args.input_file, args.count, args.out_path))
+        core = LinuxOctaBitQuantumCore(quiet=args.quiet)
         result = core.run()
-        print('[Seraphina AGI] Quantum Core operational result:')
+        if not args.quiet:
+            print('[Seraphina AGI] Quantum Core operational result:')
         print(json.dumps(result, indent=2))
+    elif args.command in ('encrypt', 'decrypt'):
+        chunk_size = args.chunk_size or load_tuned_settings(args.config).get('stream', {}).get('chunk_size')
+        sys.exit(run_stream_cipher(args.command, args.language or 'en-US', args.in_path, args.out_path, chunk_size))
+    elif args.command == 'bench':
+        from .benchmarks import suite
+        sys.exit(suite.bench(args.out_path, args.baseline, args.threshold, suite.parse_names(args.only), args.quick))
+    elif args.command == 'archive':
+        if args.action is None:
+            print('Error: archive needs an action: pack, get or scan', file=sys.stderr)
+            sys.exit(2)
+        sys.exit(run_archive(args.action, args.in_path, args.out_path, args.language, args.record_id, args.ndjson))
     elif args.command == 'train':
         print('AI learning orchestrator not yet implemented in Python version')
         # TODO: Implement when ai-learning-orchestrator.js is converted
     elif args.command == 'optimize':
-        print('AGI self-optimizer not yet implemented in Python version')
-        # TODO: Implement when agi-self-optimizer.js is converted
+        sys.exit(run_optimize(args))
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
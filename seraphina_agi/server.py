@@ -0,0 +1,782 @@
+"""
+HTTP API server for Seraphina AGI Companion.
+A fixed pool of worker threads serves HTTP/1.1 requests taken from a bounded
+queue; when the queue is full new requests get a 503 so a burst degrades into
+fast rejections instead of unbounded latency. Idle keep-alive connections wait
+in a selector, not in a worker thread, and are handed to a worker only once a
+request has arrived on them.
+"""
+
+import hmac
+import io
+import ipaddress
+import json
+import os
+import queue
+import selectors
+import signal
+import socket
+import sys
+import threading
+import time
+import weakref
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import parse_qs
+
+from . import metrics
+from .advanced_language_engine import AdvancedLanguageEngine
+from .result_cache import ResultCache
+from .shared_engine import SharedEngine
+from .tenant_pool import DEFAULT_MAX_TENANT_BYTES, DEFAULT_MAX_TENANTS, TenantEngine, TenantPool, UnknownTenant
+from .worker_pool import MAP_CHUNK_ITEMS, PoolBusy, ProcessEnginePool, WorkerLost
+
+DEFAULT_HOST = 'localhost'
+DEFAULT_WORKERS = 8
+DEFAULT_BACKLOG = 64
+# Seconds an idle keep-alive connection stays open, and the limit on each
+# socket read while a request is handled.
+KEEPALIVE_TIMEOUT = 5.0
+# Seconds a client gets to send a request line and headers in full, so one
+# trickling bytes cannot hold a worker thread.
+REQUEST_HEADER_TIMEOUT = 5.0
+POOL_RESULT_TIMEOUT = 30.0
+BATCH_FLUSH_ITEMS = 64
+NDJSON_TYPES = ('application/x-ndjson', 'application/ndjson', 'application/jsonl')
+OCTET_STREAM = 'application/octet-stream'
+
+# Routes get their own metric labels; anything else is counted as 'other'.
+ROUTES = frozenset({'/process', '/process/batch', '/reload', '/health', '/cache', '/cache/clear', '/metrics',
+                    '/debug/profile', '/tenants'})
+# A profile holds one HTTP worker thread while it samples; keep it short.
+DEFAULT_PROFILE_SECONDS = 1.0
+MAX_PROFILE_SECONDS = 2.0
+# Routes that change server state or expose internals (per-tenant details,
+# thread stacks). They need the admin token when one is configured, and are
+# loopback-only otherwise.
+ADMIN_ROUTES = frozenset({'/reload', '/cache/clear', '/tenants', '/debug/profile'})
+ADMIN_TOKEN_ENV = 'SERAPHINA_ADMIN_TOKEN'
+
+HTTP_REQUESTS = metrics.REGISTRY.counter('seraphina_http_requests_total', 'HTTP requests by method, route and status.',
+                                         ['method', 'route', 'status'])
+HTTP_SECONDS = metrics.REGISTRY.histogram('seraphina_http_request_seconds', 'HTTP request latency by route.',
+                                          ['route'])
+# Open servers, read by the one scrape-time collector below.
+_SERVERS: 'weakref.WeakSet[EngineHTTPServer]' = weakref.WeakSet()
+
+
+def _unique(objects: Iterable[Any]) -> List[Any]:
+    # Servers may share an engine, result cache or tenant pool; count each once.
+    return list({id(o): o for o in objects if o is not None}.values())
+
+
+def _collect_server_metrics():
+    servers = list(_SERVERS)
+    if not servers:
+        return
+    yield 'seraphina_http_queue_depth', 'gauge', 'Connections waiting for a worker thread.', \
+        sum(server._queue.qsize() for server in servers)
+    yield 'seraphina_http_rejected_total', 'counter', 'Connections answered 503 because the queue was full.', \
+        sum(server.rejected for server in servers)
+    yield 'seraphina_engine_generation', 'gauge', 'Engine builds since start (1 + reloads).', \
+        sum(engine.generation for engine in _unique(server.shared_engine for server in servers))
+    caches = [cache.stats() for cache in _unique(server.result_cache for server in servers)]
+    if caches:
+        yield 'seraphina_result_cache_hits_total', 'counter', 'Result cache hits.', sum(s['hits'] for s in caches)
+        yield 'seraphina_result_cache_misses_total', 'counter', 'Result cache misses.', \
+            sum(s['misses'] for s in caches)
+        yield 'seraphina_result_cache_entries', 'gauge', 'Cached results.', sum(s['entries'] for s in caches)
+        yield 'seraphina_result_cache_bytes', 'gauge', 'Approximate bytes held by cached results.', \
+            sum(s['bytes'] for s in caches)
+    pools = [pool.stats() for pool in _unique(server.tenant_pool for server in servers)]
+    yield 'seraphina_tenant_engines', 'gauge', 'Tenant engines held by the pool.', sum(s['tenants'] for s in pools)
+    yield 'seraphina_tenant_bytes', 'gauge', 'Approximate bytes held by tenant engines.', sum(s['bytes'] for s in pools)
+    yield 'seraphina_tenant_evictions_total', 'counter', 'Tenant engines evicted from the pool.', \
+        sum(s['evictions'] for s in pools)
+
+
+metrics.REGISTRY.add_collector(_collect_server_metrics)
+
+_REJECT_BODY = json.dumps({'error': 'server busy'}).encode('utf-8')
+_REJECT_RESPONSE = (
+    b'HTTP/1.1 503 Service Unavailable\r\n'
+    b'Content-Type: application/json\r\n'
+    b'Retry-After: 1\r\n'
+    b'Connection: close\r\n'
+    b'Content-Length: ' + str(len(_REJECT_BODY)).encode('ascii') + b'\r\n\r\n' + _REJECT_BODY
+)
+
+
+class BatchRecordError(ValueError):
+    pass
+
+
+def query_options(query: str) -> Dict[str, Any]:
+    # Engine options from a query string; encryption_enabled is a boolean.
+    options = {}
+    for key, values in parse_qs(query).items():
+        value = values[-1]
+        options[key] = value.lower() not in ('0', 'false', 'no') if key == 'encryption_enabled' else value
+    return options
+
+
+def resolve_admin_token(token: Optional[str] = None) -> Optional[str]:
+    # The configured admin token: the argument, else $SERAPHINA_ADMIN_TOKEN.
+    return token or os.environ.get(ADMIN_TOKEN_ENV) or None
+
+
+def admin_allowed(token: Optional[str], authorization: Optional[str], client_host: Optional[str]) -> bool:
+    """
+    Whether a request may use an admin route.
+
+    Args:
+        token: Configured admin token, or None
+        authorization: The request's Authorization header
+        client_host: The client's IP address
+
+    Returns:
+        With a token, whether the request sent it as "Bearer <token>";
+        without one, whether the client is on a loopback address
+    """
+    if token:
+        scheme, _, value = (authorization or '').partition(' ')
+        return scheme.lower() == 'bearer' and hmac.compare_digest(value.strip().encode(), token.encode())
+    try:
+        address = ipaddress.ip_address(client_host or '')
+    except ValueError:
+        return False
+    mapped = getattr(address, 'ipv4_mapped', None)
+    return (mapped or address).is_loopback
+
+
+def parse_batch_record(line: bytes) -> Any:
+    # One /process/batch record: a string or an object, else an in-place error.
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        return BatchRecordError(f'invalid JSON record: {e}')
+    if not isinstance(record, (str, dict)):
+        return BatchRecordError('record must be a string or an object')
+    return record
+
+
+class EngineHTTPServer(HTTPServer):
+    def __init__(self, server_address, handler_class, shared_engine: SharedEngine = None,
+                 workers: int = DEFAULT_WORKERS, backlog: int = DEFAULT_BACKLOG,
+                 process_pool: Optional[ProcessEnginePool] = None,
+                 result_cache: Optional[ResultCache] = None, tenant_pool: Optional[TenantPool] = None,
+                 admin_token: Optional[str] = None):
+        # Listen backlog follows the queue bound so the kernel does not hide
+        # an unbounded second queue in front of ours.
+        self.request_queue_size = max(backlog, 1)
+        super().__init__(server_address, handler_class)
+        self.shared_engine = shared_engine or SharedEngine()
+        # When set, /process and /process/batch run in worker processes.
+        self.process_pool = process_pool
+        self.result_cache = result_cache
+        # Guards ADMIN_ROUTES; None leaves them to loopback clients.
+        self.admin_token = resolve_admin_token(admin_token)
+        # Requests with an X-Tenant-Id header get that tenant's engine.
+        self.tenant_pool = tenant_pool or TenantPool(self.shared_engine)
+        self.workers = max(workers, 1)
+        self.backlog = max(backlog, 1)
+        self.rejected = 0
+        self._queue: 'queue.Queue' = queue.Queue(maxsize=self.backlog)
+        # Connections waiting for their next request, oldest first. Workers
+        # hand them over through _parked; only the idle thread touches _idle.
+        self._selector = selectors.DefaultSelector()
+        self._idle: 'OrderedDict[socket.socket, _Connection]' = OrderedDict()
+        self._parked: 'queue.SimpleQueue' = queue.SimpleQueue()
+        self._wake_reader, self._wake_writer = socket.socketpair()
+        self._wake_reader.setblocking(False)
+        self._selector.register(self._wake_reader, selectors.EVENT_READ)
+        self._closing = False
+        _SERVERS.add(self)
+        self._idle_thread = threading.Thread(target=self._watch_idle, name='seraphina-http-idle', daemon=True)
+        self._idle_thread.start()
+        self._threads = []
+        for i in range(self.workers):
+            t = threading.Thread(target=self._worker, name=f'seraphina-http-{i}', daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def process_request(self, request, client_address):
+        # New connections wait for their first request like idle ones.
+        self._park(_Connection(request, client_address))
+
+    def _park(self, conn: '_Connection'):
+        self._parked.put(conn)
+        try:
+            self._wake_writer.send(b'\0')
+        except OSError:  # closed by server_close; the connection is dropped there
+            pass
+
+    def _watch_idle(self):
+        while not self._closing:
+            timeout = None
+            if self._idle:
+                timeout = max(next(iter(self._idle.values())).idle_since + KEEPALIVE_TIMEOUT - time.monotonic(), 0)
+            for key, _ in self._selector.select(timeout):
+                if key.fileobj is self._wake_reader:
+                    try:
+                        while self._wake_reader.recv(4096):
+                            pass
+                    except OSError:
+                        pass
+                    continue
+                self._selector.unregister(key.fileobj)
+                self._dispatch(self._idle.pop(key.fileobj))
+            while True:
+                try:
+                    conn = self._parked.get_nowait()
+                except queue.Empty:
+                    break
+                conn.idle_since = time.monotonic()
+                try:
+                    self._selector.register(conn.request, selectors.EVENT_READ)
+                except (ValueError, OSError):  # closed while parked
+                    self._close(conn)
+                    continue
+                self._idle[conn.request] = conn
+            expired = time.monotonic() - KEEPALIVE_TIMEOUT
+            while self._idle and next(iter(self._idle.values())).idle_since <= expired:
+                request, conn = self._idle.popitem(last=False)
+                self._selector.unregister(request)
+                self._close(conn)
+        for conn in self._idle.values():
+            self._close(conn)
+        self._idle.clear()
+        self._selector.close()
+
+    def _dispatch(self, conn: '_Connection'):
+        try:
+            self._queue.put_nowait(conn)
+        except queue.Full:
+            self.rejected += 1
+            try:
+                conn.request.sendall(_REJECT_RESPONSE)
+            except OSError:
+                pass
+            self._close(conn)
+
+    def _worker(self):
+        while True:
+            conn = self._queue.get()
+            if conn is None:
+                return
+            if self._serve(conn):
+                self._park(conn)
+            else:
+                self._close(conn)
+
+    def _serve(self, conn: '_Connection') -> bool:
+        # Handles the ready request and any the client pipelined behind it.
+        # Returns True to keep the connection open for another one.
+        try:
+            if conn.handler is None:
+                conn.handler = _open_handler(self.RequestHandlerClass, conn.request, conn.client_address, self)
+            handler = conn.handler
+            while True:
+                handler.close_connection = True
+                handler.handle_one_request()
+                if handler.close_connection:
+                    return False
+                if not _has_buffered_input(handler):
+                    return True
+        except Exception:
+            self.handle_error(conn.request, conn.client_address)
+            return False
+
+    def _close(self, conn: '_Connection'):
+        if conn.handler is not None:
+            try:
+                conn.handler.finish()
+            except OSError:
+                pass
+        self.shutdown_request(conn.request)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'workers': self.workers,
+            'backlog': self.backlog,
+            'queued': self._queue.qsize(),
+            'idle': len(self._idle),
+            'rejected': self.rejected,
+            'processes': self.process_pool.processes if self.process_pool else 0,
+            'result_cache': self.result_cache.stats() if self.result_cache else None,
+            'tenants': self.tenant_pool.stats()['tenants']
+        }
+
+    def server_close(self):
+        _SERVERS.discard(self)
+        super().server_close()
+        self._closing = True
+        try:
+            self._wake_writer.send(b'\0')
+        except OSError:
+            pass
+        self._idle_thread.join(timeout=5)
+        self._wake_writer.close()
+        self._wake_reader.close()
+        for _ in self._threads:
+            try:
+                self._queue.put_nowait(None)
+            except queue.Full:
+                break
+
+
+class _Connection:
+    # A client socket and the handler that keeps its buffered reader between requests.
+    __slots__ = ('request', 'client_address', 'handler', 'idle_since')
+
+    def __init__(self, request, client_address):
+        self.request = request
+        self.client_address = client_address
+        self.handler = None
+        self.idle_since = 0.0
+
+
+def _open_handler(handler_class, request, client_address, server):
+    # BaseRequestHandler.__init__ would serve the whole connection in one go;
+    # the server instead runs setup() once, handle_one_request() per ready
+    # request and finish() when the connection closes.
+    handler = handler_class.__new__(handler_class)
+    handler.request, handler.client_address, handler.server = request, client_address, server
+    handler.setup()
+    return handler
+
+
+def _has_buffered_input(handler) -> bool:
+    # A pipelined request may already sit in the reader's buffer, where the
+    # selector cannot see it. peek() on a non-blocking socket never waits.
+    sock = handler.connection
+    try:
+        sock.setblocking(False)
+        return bool(handler.rfile.peek(1))
+    except OSError:
+        return False
+    finally:
+        try:
+            sock.settimeout(handler.timeout)
+        except OSError:
+            pass
+
+
+class _DeadlineReader(io.RawIOBase):
+    # Raw socket reader under RequestHandler.rfile. While the handler has a
+    # read deadline, each recv gets only the time left before it.
+    def __init__(self, sock, handler):
+        self._sock = sock
+        self._handler = handler
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> Optional[int]:
+        deadline = self._handler._read_deadline
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError('request headers took too long')
+            self._sock.settimeout(min(remaining, self._handler.timeout))
+        try:
+            return self._sock.recv_into(buffer)
+        except BlockingIOError:
+            return None
+        finally:
+            if deadline is not None:
+                self._sock.settimeout(self._handler.timeout)
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    timeout = KEEPALIVE_TIMEOUT
+    # Headers and body go out in separate writes; without TCP_NODELAY every
+    # keep-alive response stalls on the peer's delayed ACK.
+    disable_nagle_algorithm = True
+    _read_deadline: Optional[float] = None
+
+    def setup(self):
+        super().setup()
+        self.rfile.close()
+        self.rfile = io.BufferedReader(_DeadlineReader(self.connection, self))
+
+    def parse_request(self) -> bool:
+        self._started = time.perf_counter()
+        self._status = None
+        try:
+            return super().parse_request()
+        finally:
+            self._read_deadline = None  # headers are in; the body has only the per-read timeout
+
+    def send_response(self, code, message=None):
+        self._status = code
+        super().send_response(code, message)
+
+    def handle_one_request(self):
+        self._status = None
+        self._tenant = None
+        self._read_deadline = time.monotonic() + REQUEST_HEADER_TIMEOUT
+        try:
+            super().handle_one_request()
+        finally:
+            self._read_deadline = None
+        if self._status is not None and metrics.enabled():
+            path = (getattr(self, 'path', None) or '').partition('?')[0]
+            route = path if path in ROUTES else 'other'
+            HTTP_REQUESTS.labels(self.command or 'INVALID', route, self._status).inc()
+            HTTP_SECONDS.labels(route).observe(time.perf_counter() - self._started)
+
+    def _engine(self) -> AdvancedLanguageEngine:
+        if self._tenant is not None:
+            return self._tenant
+        shared = getattr(self.server, 'shared_engine', None)
+        return shared.get() if shared else AdvancedLanguageEngine()
+
+    def _resolve_tenant(self) -> bool:
+        # X-Tenant-Id selects a tenant; X-Tenant-Key / X-Tenant-Salt carry
+        # secrets for tenants not in the server config when the pool allows it.
+        tenant_id = self.headers.get('X-Tenant-Id')
+        pool = getattr(self.server, 'tenant_pool', None)
+        if not tenant_id or pool is None:
+            return True
+        try:
+            self._tenant = pool.get(tenant_id, self.headers.get('X-Tenant-Key'), self.headers.get('X-Tenant-Salt'))
+        except UnknownTenant as e:
+            self.close_connection = True
+            self._send_json(403, {'error': e.args[0]})
+            return False
+        return True
+
+    def _process(self, input_text: str, opts: Dict[str, Any]) -> Dict[str, Any]:
+        pool = getattr(self.server, 'process_pool', None)
+        engine = self._engine()
+        # Worker processes only hold the shared engine; tenants run here.
+        if pool is None or isinstance(engine, TenantEngine):
+            return engine.process_language(input_text, opts)
+        # The result cache lives in this process and fronts the pool.
+        result = engine.cached_result(input_text, opts)
+        if result is None:
+            result = pool.submit(input_text, opts, block=False, timeout=POOL_RESULT_TIMEOUT).result()
+            engine.store_result(input_text, opts, result)
+        return result
+
+    def _process_many(self, records: Iterable[Any], options: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        pool = getattr(self.server, 'process_pool', None)
+        if pool is None or self._tenant is not None:
+            return self._engine().process_many(records, options)
+        return pool.map(records, options, timeout=POOL_RESULT_TIMEOUT)
+
+    def _send_text(self, status: int, text: str, content_type: str = 'text/plain; charset=utf-8'):
+        data = text.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_json(self, status: int, payload: Any):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_body_chunks(self) -> Iterator[bytes]:
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            while True:
+                size = int(self.rfile.readline().split(b';', 1)[0].strip() or b'0', 16)
+                if size == 0:
+                    # Drain optional trailers up to the terminating blank line.
+                    while self.rfile.readline() not in (b'\r\n', b'\n', b''):
+                        pass
+                    return
+                yield self.rfile.read(size)
+                self.rfile.readline()
+        else:
+            remaining = int(self.headers.get('Content-Length') or 0)
+            while remaining > 0:
+                chunk = self.rfile.read(min(remaining, 65536))
+                if not chunk:
+                    return
+                remaining -= len(chunk)
+                yield chunk
+
+    def _iter_ndjson(self) -> Iterator[Any]:
+        buffered = b''
+        for chunk in self._read_body_chunks():
+            buffered += chunk
+            *lines, buffered = buffered.split(b'\n')
+            for line in lines:
+                if line.strip():
+                    yield parse_batch_record(line)
+        if buffered.strip():
+            yield parse_batch_record(buffered)
+
+    def _write_chunk(self, data: bytes):
+        if data:
+            self.wfile.write(b'%x\r\n%s\r\n' % (len(data), data))
+
+    def _process_batch(self, query: str):
+        options = query_options(query)
+        ndjson = self.headers.get('Content-Type', '').split(';', 1)[0].strip() in NDJSON_TYPES
+        if ndjson:
+            records = self._iter_ndjson()
+        else:
+            try:
+                body = json.loads(b''.join(self._read_body_chunks()).decode('utf-8'))
+                if isinstance(body, dict):
+                    options.update(body.get('options') or {})
+                    body = body.get('inputs')
+                if not isinstance(body, list):
+                    raise ValueError('expected a JSON array or {"inputs": [...]}')
+            except Exception as e:
+                self.close_connection = True
+                self._send_json(400, {'error': str(e)})
+                return
+            records = (r if isinstance(r, (str, dict)) else BatchRecordError('record must be a string or an object')
+                       for r in body)
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson' if ndjson else 'application/json')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+        # Results stream back in input order, BATCH_FLUSH_ITEMS per chunk;
+        # a bad record becomes an in-place error entry instead of failing the batch.
+        separator = b'\n' if ndjson else b','
+        first = True
+        pending: List[Any] = []
+
+        def flush(results):
+            nonlocal first
+            encoded = separator.join(json.dumps(r).encode('utf-8') for r in results)
+            if not encoded:
+                return
+            if ndjson:
+                self._write_chunk(encoded + b'\n')
+            else:
+                self._write_chunk((b'[' if first else b',') + encoded)
+            first = False
+
+        try:
+            for record in records:
+                if isinstance(record, BatchRecordError):
+                    flush(list(self._process_many(pending, options)))
+                    pending = []
+                    flush([{'error': str(record)}])
+                    continue
+                pending.append(record)
+                if len(pending) >= BATCH_FLUSH_ITEMS:
+                    flush(list(self._process_many(pending, options)))
+                    pending = []
+            flush(list(self._process_many(pending, options)))
+        except Exception:
+            # Headers are already out; dropping the connection without the
+            # terminating chunk is the only way left to signal failure.
+            self.close_connection = True
+            return
+        if not ndjson:
+            self._write_chunk(b'[]' if first else b']')
+        self.wfile.write(b'0\r\n\r\n')
+
+    def _process_binary(self, query: str):
+        # application/octet-stream /process: the body is read into one buffer,
+        # encrypted in place for encoding=raw and written back from it.
+        options = query_options(query)
+        try:
+            length = int(self.headers.get('Content-Length', ''))
+            if length < 0:
+                raise ValueError(length)
+        except ValueError:
+            self.close_connection = True
+            self._send_json(411, {'error': 'Content-Length required'})
+            return
+        body = bytearray(length)
+        view = memoryview(body)
+        received = 0
+        while received < length:
+            n = self.rfile.readinto(view[received:])
+            if not n:
+                self.close_connection = True
+                return
+            received += n
+        try:
+            in_place = body if options.get('encoding') == 'raw' else None
+            result = self._engine().process_bytes(body, options, out=in_place)
+        except Exception as e:
+            self.close_connection = True
+            self._send_json(400, {'error': str(e)})
+            return
+        output = result['output']
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(len(output)))
+        self.send_header('X-Detected-Language', result['detected_language'])
+        self.send_header('X-Encoding', result['encoding'])
+        if 'protocol_encoding' in result:
+            self.send_header('X-Protocol-Encoding', result['protocol_encoding'])
+        self.end_headers()
+        self.wfile.write(output)
+
+    def do_POST(self):
+        path, _, query = self.path.partition('?')
+        if not self._resolve_tenant():
+            return
+        if path == '/process/batch':
+            self._process_batch(query)
+        elif path == '/process' and self.headers.get('Content-Type', '').split(';', 1)[0].strip() == OCTET_STREAM:
+            self._process_binary(query)
+        elif path == '/process':
+            try:
+                content_length = int(self.headers['Content-Length'])
+                post_data = self.rfile.read(content_length)
+                body = json.loads(post_data)
+                input_text = body.get('input', '')
+                opts = body.get('options', {})
+                result = self._process(input_text, opts)
+                self._send_json(200, result)
+            except (PoolBusy, WorkerLost) as e:
+                self.close_connection = True
+                self._send_json(503, {'error': str(e)})
+            except TimeoutError as e:
+                self.close_connection = True
+                self._send_json(504, {'error': str(e)})
+            except Exception as e:
+                self.close_connection = True
+                self._send_json(400, {'error': str(e)})
+        elif self._admin_denied(path):
+            pass
+        elif path == '/reload' and getattr(self.server, 'shared_engine', None):
+            self._send_json(200, self.server.shared_engine.reload())
+        elif path == '/cache/clear' and getattr(self.server, 'result_cache', None):
+            self.server.result_cache.clear()
+            self._send_json(200, self.server.result_cache.stats())
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def _admin_denied(self, path: str) -> bool:
+        # Answers 403 and returns True when path is an admin route this caller may not use.
+        token = getattr(self.server, 'admin_token', None)
+        if path not in ADMIN_ROUTES or admin_allowed(token, self.headers.get('Authorization'), self.client_address[0]):
+            return False
+        self.close_connection = True
+        self._send_json(403, {'error': 'admin token required' if token
+                              else 'admin routes are limited to loopback clients'})
+        return True
+
+    def _profile(self, query: str):
+        try:
+            seconds = float(parse_qs(query).get('seconds', [DEFAULT_PROFILE_SECONDS])[-1])
+        except ValueError:
+            self._send_json(400, {'error': 'seconds must be a number'})
+            return
+        if not 0 < seconds <= MAX_PROFILE_SECONDS:
+            self._send_json(400, {'error': f'seconds must be above 0 and at most {MAX_PROFILE_SECONDS:g}'})
+            return
+        try:
+            samples = metrics.sample_profile(seconds)
+        except metrics.ProfilerBusy as e:
+            self._send_json(409, {'error': str(e)})
+            return
+        self._send_text(200, metrics.render_profile(samples))
+
+    def do_GET(self):
+        path, _, query = self.path.partition('?')
+        if self._admin_denied(path):
+            return
+        if path == '/metrics' and metrics.enabled():
+            self._send_text(200, metrics.REGISTRY.render(), 'text/plain; version=0.0.4; charset=utf-8')
+        elif path == '/debug/profile' and metrics.enabled():
+            self._profile(query)
+        elif path == '/health' and hasattr(self.server, 'stats'):
+            self._send_json(200, {'status': 'ok', 'engine': self.server.shared_engine.info(),
+                                  'server': self.server.stats()})
+        elif path == '/tenants' and getattr(self.server, 'tenant_pool', None):
+            pool = self.server.tenant_pool
+            self._send_json(200, {**pool.stats(), 'largest': pool.usage()})
+        elif path == '/cache' and hasattr(self.server, 'result_cache'):
+            cache = self.server.result_cache
+            self._send_json(200, cache.stats() if cache else {'enabled': False})
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+
+class QuietRequestHandler(RequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(host: str = DEFAULT_HOST, port: int = 8080, workers: int = DEFAULT_WORKERS,
+                backlog: int = DEFAULT_BACKLOG, shared_engine: SharedEngine = None,
+                handler_class=None, process_pool: Optional[ProcessEnginePool] = None,
+                result_cache: Optional[ResultCache] = None, tenants: Optional[Dict[str, Any]] = None,
+                max_tenants: int = DEFAULT_MAX_TENANTS, tenant_bytes: int = DEFAULT_MAX_TENANT_BYTES,
+                allow_tenant_keys: bool = False, admin_token: Optional[str] = None) -> EngineHTTPServer:
+    # result_cache is handed to every engine the shared engine builds; /reload
+    # clears it and keys carry the build generation.
+    if shared_engine is None:
+        shared_engine = SharedEngine(lambda: AdvancedLanguageEngine(result_cache=result_cache))
+    shared_engine.warm()
+    tenant_pool = TenantPool(shared_engine, tenants, max_tenants, tenant_bytes, allow_tenant_keys)
+    return EngineHTTPServer((host, port), handler_class or RequestHandler, shared_engine, workers=workers,
+                            backlog=backlog, process_pool=process_pool, result_cache=result_cache,
+                            tenant_pool=tenant_pool, admin_token=admin_token)
+
+
+def serve(port: int = 8080, host: str = DEFAULT_HOST, workers: int = DEFAULT_WORKERS,
+          backlog: int = DEFAULT_BACKLOG, processes: int = 0, result_cache: Optional[ResultCache] = None,
+          tenants: Optional[Dict[str, Any]] = None, max_tenants: int = DEFAULT_MAX_TENANTS,
+          tenant_bytes: int = DEFAULT_MAX_TENANT_BYTES, batch_size: int = MAP_CHUNK_ITEMS,
+          allow_tenant_keys: bool = False, admin_token: Optional[str] = None):
+    # Returns 1 if the process pool broke and the server stopped, so a
+    # supervisor can restart it; None after a normal shutdown.
+    broken: List[str] = []
+    servers: List[EngineHTTPServer] = []
+
+    def pool_broken(reason: str):
+        broken.append(reason)
+        print(f'Error: {reason}; shutting down', file=sys.stderr)
+        if servers:
+            threading.Thread(target=servers[0].shutdown, daemon=True).start()
+
+    # Fork engine processes before any server thread exists.
+    pool = ProcessEnginePool(processes, queue_size=backlog, chunk_items=batch_size,
+                             on_broken=pool_broken) if processes > 0 else None
+    server = make_server(host, port, workers, backlog, process_pool=pool, result_cache=result_cache,
+                         tenants=tenants, max_tenants=max_tenants, tenant_bytes=tenant_bytes,
+                         allow_tenant_keys=allow_tenant_keys, admin_token=admin_token)
+    servers.append(server)
+    shared = server.shared_engine
+    info = shared.info()
+    print(f"[Seraphina AGI] Engine {info['version']} warmed in {info['load_ms']} ms ({info['cipher_count']} ciphers)")
+    if pool:
+        print(f'[Seraphina AGI] {pool.processes} engine worker processes ready')
+    if result_cache:
+        print(f'[Seraphina AGI] Result cache enabled ({result_cache.max_bytes // (1024 * 1024)} MiB, '
+              f'{result_cache.max_entries} entries, ttl {result_cache.ttl}s)')
+    if tenants:
+        print(f'[Seraphina AGI] {len(tenants)} configured tenants (pool: {max_tenants} tenants, '
+              f'{tenant_bytes // (1024 * 1024)} MiB)')
+    print(f"[Seraphina AGI] POST /reload, POST /cache/clear, GET /tenants and GET /debug/profile "
+          f"{'need the admin token' if server.admin_token else 'are limited to loopback clients'}")
+    if allow_tenant_keys:
+        print('[Seraphina AGI] Accepting X-Tenant-Key for tenants missing from the config')
+    if hasattr(signal, 'SIGHUP'):
+        # Reload from a worker thread so the handler never blocks the accept loop.
+        signal.signal(signal.SIGHUP, lambda *_: threading.Thread(target=shared.reload, daemon=True).start())
+    print(f'[Seraphina AGI] HTTP API listening on {host}:{port} '
+          f'({workers} workers, backlog {backlog}; POST /process, POST /process/batch, POST /reload, '
+          f'GET /health, GET /cache, GET /tenants, GET /metrics, GET /debug/profile)')
+    try:
+        if not broken:
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if pool:
+            pool.close()
+    return 1 if broken else None
@@ -0,0 +1,261 @@
+"""
+Background uploader for anonymized share_data payloads.
+Callers only hash the result and enqueue it; a daemon thread batches queued
+payloads into one POST over a pooled keep-alive requests.Session, retrying
+with exponential backoff. When the bounded queue is full, or a batch still
+fails after its retries, payloads are appended to an optional NDJSON journal
+(or dropped and counted) and replayed by a later run. Pending payloads are
+flushed at interpreter exit; a batch whose POST is still running when the
+close timeout ends is journaled too, so it may be delivered twice but is
+never lost.
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+DEFAULT_SHARE_URL = 'https://httpbin.org/post'  # Placeholder server
+SHARE_URL_ENV = 'SERAPHINA_SHARE_URL'
+DEFAULT_QUEUE_SIZE = 1024
+DEFAULT_BATCH_SIZE = 64
+FLUSH_INTERVAL = 1.0
+REQUEST_TIMEOUT = 5.0
+MAX_RETRIES = 4
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+EXIT_FLUSH_TIMEOUT = 5.0
+
+logger = logging.getLogger(__name__)
+
+
+def anonymize(data: Any) -> Dict[str, str]:
+    hashed = hashlib.sha256(json.dumps(data).encode()).hexdigest()
+    return {'hash': hashed, 'type': 'agi_processing'}
+
+
+class BackgroundUploader:
+    def __init__(self, server_url: Optional[str] = None, queue_size: int = DEFAULT_QUEUE_SIZE,
+                 batch_size: int = DEFAULT_BATCH_SIZE, flush_interval: float = FLUSH_INTERVAL,
+                 timeout: float = REQUEST_TIMEOUT, max_retries: int = MAX_RETRIES,
+                 journal_path: Optional[str] = None, session=None,
+                 close_timeout: Optional[float] = EXIT_FLUSH_TIMEOUT):
+        # journal_path: NDJSON file that takes payloads the queue or the
+        # collector cannot; None drops them instead. session: any object with
+        # requests.Session's post(); one is created on first upload otherwise.
+        # close_timeout: how long close() at interpreter exit waits for the
+        # queue and the batch in flight; None waits for them indefinitely.
+        self.server_url = server_url or os.environ.get(SHARE_URL_ENV) or DEFAULT_SHARE_URL
+        self.queue_size = max(queue_size, 1)
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.journal_path = journal_path
+        self._session = session
+        self._queue: deque = deque()
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        # The batch being sent; close() takes it over to journal it when the
+        # send outlives the timeout, and _run then leaves it alone.
+        self._in_flight_batch: Optional[List[Dict[str, str]]] = None
+        self._flush_waiters = 0
+        self._closed = False
+        self._stopped = threading.Event()
+        self._journal_lock = threading.Lock()
+        self.counters = {'queued': 0, 'sent': 0, 'batches': 0, 'retries': 0, 'dropped': 0, 'spilled': 0,
+                         'replayed': 0}
+        self._replay_path = self._claim_journal()
+        self._thread = threading.Thread(target=self._run, name='seraphina-share-uploader', daemon=True)
+        self._thread.start()
+        atexit.register(self.close, close_timeout)
+
+    def submit(self, data: Any) -> bool:
+        """
+        Hash data and queue it for upload without blocking on the network.
+
+        Returns:
+            True if queued, False if it was spilled to the journal or dropped
+        """
+        payload = anonymize(data)
+        with self._cond:
+            if not self._closed and len(self._queue) < self.queue_size:
+                self._queue.append(payload)
+                self._count('queued')
+                self._cond.notify()
+                return True
+        self._spill([payload])
+        return False
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued payload has been sent or given up on; False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._flush_waiters += 1
+            self._cond.notify_all()
+            try:
+                while self._queue or self._in_flight:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+            finally:
+                self._flush_waiters -= 1
+        return True
+
+    def close(self, timeout: Optional[float] = EXIT_FLUSH_TIMEOUT):
+        # Anything still queued after the timeout goes to the journal, and so
+        # does a batch whose POST has not returned by then.
+        if self._closed:
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._stopped.set()
+            leftover = list(self._queue)
+            self._queue.clear()
+            self._cond.notify_all()
+        if leftover:
+            self._spill(leftover)
+        self._thread.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+        with self._cond:
+            stuck, self._in_flight_batch = self._in_flight_batch, None
+        if stuck:
+            self._spill(stuck)
+        atexit.unregister(self.close)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {**self.counters, 'pending': len(self._queue) + self._in_flight}
+
+    def _count(self, name: str, n: int = 1):
+        with self._cond:
+            self.counters[name] += n
+
+    def _run(self):
+        self._replay_journal()
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                # Give a burst up to flush_interval to fill the batch, unless
+                # someone is waiting in flush().
+                deadline = time.monotonic() + self.flush_interval
+                while len(self._queue) < self.batch_size and not self._closed and not self._flush_waiters:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                self._in_flight = len(batch)
+                self._in_flight_batch = batch
+            try:
+                if batch and not self._upload(batch) and self._release(batch):
+                    self._spill(batch)
+            finally:
+                with self._cond:
+                    self._in_flight = 0
+                    self._in_flight_batch = None
+                    self._cond.notify_all()
+
+    def _release(self, batch: List[Dict[str, str]]) -> bool:
+        # False when close() already journaled the batch.
+        with self._cond:
+            owned = self._in_flight_batch is batch
+            self._in_flight_batch = None
+            return owned
+
+    def _upload(self, batch: List[Dict[str, str]]) -> bool:
+        body = {'type': 'agi_processing_batch', 'items': batch}
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self._count('retries')
+                delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+                if self._stopped.wait(delay):
+                    return False
+            try:
+                response = self._get_session().post(self.server_url, json=body, timeout=self.timeout)
+            except Exception as e:
+                logger.debug('share upload failed: %s', e)
+                continue
+            if response.status_code < 300:
+                self._count('sent', len(batch))
+                self._count('batches')
+                return True
+            if response.status_code < 500 and response.status_code != 429:
+                logger.debug('share upload rejected with HTTP %s', response.status_code)
+                return False
+        return False
+
+    def _get_session(self):
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
+
+    def _spill(self, payloads: List[Dict[str, str]]):
+        if not self.journal_path:
+            self._count('dropped', len(payloads))
+            return
+        try:
+            with self._journal_lock:
+                directory = os.path.dirname(self.journal_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.journal_path, 'a', encoding='utf-8') as f:
+                    f.write(''.join(json.dumps(p) + '\n' for p in payloads))
+            self._count('spilled', len(payloads))
+        except OSError as e:
+            logger.debug('share journal write failed: %s', e)
+            self._count('dropped', len(payloads))
+
+    def _claim_journal(self) -> Optional[str]:
+        # Move the journal left by earlier runs aside before this instance can
+        # spill into it; a replay file a crashed run left behind is kept.
+        if not self.journal_path:
+            return None
+        replay = self.journal_path + '.replay'
+        try:
+            if os.path.exists(self.journal_path):
+                if os.path.exists(replay):
+                    with open(self.journal_path, 'rb') as src, open(replay, 'ab') as dst:
+                        dst.write(src.read())
+                    os.unlink(self.journal_path)
+                else:
+                    os.replace(self.journal_path, replay)
+        except OSError as e:
+            logger.debug('share journal claim failed: %s', e)
+        return replay if os.path.exists(replay) else None
+
+    def _replay_journal(self):
+        # Batches that fail again are spilled back into the live journal.
+        if not self._replay_path:
+            return
+        try:
+            with open(self._replay_path, encoding='utf-8') as f:
+                payloads = [json.loads(line) for line in f if line.strip()]
+            os.unlink(self._replay_path)
+        except (OSError, ValueError) as e:
+            logger.debug('share journal replay failed: %s', e)
+            return
+        for i in range(0, len(payloads), self.batch_size):
+            rest = payloads[i:]
+            with self._cond:
+                self._in_flight_batch = rest
+            batch = rest[:self.batch_size]
+            sent = not self._stopped.is_set() and self._upload(batch)
+            if not self._release(rest):
+                return
+            if not sent:
+                self._spill(rest)
+                return
+            self._count('replayed', len(batch))
@@ -0,0 +1,71 @@
+"""
+Shared language engine for long-running servers.
+Builds one AdvancedLanguageEngine up front and hands the same instance to
+every request; reload() swaps in a freshly built engine without a restart
+and drops results the old one cached.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .advanced_language_engine import AdvancedLanguageEngine
+
+
+class SharedEngine:
+    def __init__(self, factory: Callable[[], AdvancedLanguageEngine] = AdvancedLanguageEngine):
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._engine: Optional[AdvancedLanguageEngine] = None
+        self.generation = 0
+        self.loaded_at: Optional[float] = None
+        self.load_seconds: Optional[float] = None
+
+    def get(self) -> AdvancedLanguageEngine:
+        engine = self._engine
+        if engine is None:
+            with self._lock:
+                if self._engine is None:
+                    self._install(*self._build())
+                engine = self._engine
+        return engine
+
+    def warm(self) -> Dict[str, Any]:
+        self.get()
+        return self.info()
+
+    def reload(self) -> Dict[str, Any]:
+        # Build outside the lock: in-flight requests keep the old engine,
+        # new ones pick up the replacement as soon as it is published.
+        engine, elapsed = self._build()
+        with self._lock:
+            self._install(engine, elapsed)
+        # Old entries are unreachable under the new generation; free them now.
+        if engine.result_cache is not None:
+            engine.result_cache.clear()
+        return self.info()
+
+    def info(self) -> Dict[str, Any]:
+        engine = self._engine
+        return {
+            'engine_id': engine.engine_id if engine else None,
+            'version': engine.version if engine else None,
+            'generation': self.generation,
+            'loaded_at': self.loaded_at,
+            'load_ms': round(self.load_seconds * 1000, 3) if self.load_seconds is not None else None,
+            'cipher_count': len(engine.octabit_encryption['frequency_cipher']) if engine else 0
+        }
+
+    def _build(self):
+        start = time.perf_counter()
+        engine = self._factory()
+        return engine, time.perf_counter() - start
+
+    def _install(self, engine: AdvancedLanguageEngine, elapsed: float):
+        self.generation += 1
+        # Keys result-cache entries by build, so requests still running on
+        # the old engine cannot store results the new one would serve.
+        engine.cache_generation = self.generation
+        self._engine = engine
+        self.loaded_at = time.time()
+        self.load_seconds = elapsed
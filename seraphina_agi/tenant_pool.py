@@ -0,0 +1,257 @@
+"""
+Per-tenant cipher keys over one shared language engine.
+A TenantEngine shares every immutable part of a base AdvancedLanguageEngine
+(language metadata, detector, translator, codecs) and replaces only the
+cipher table. Each tenant's key for a language code is the base key masked
+with a keyed BLAKE2b of the code under the tenant's master key and salt,
+derived the first time the code is used. TenantPool keeps TenantEngines in
+an LRU bounded by tenant count and approximate bytes, and rebuilds them
+when the shared engine is reloaded.
+"""
+
+import hashlib
+import json
+import operator
+import sys
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Union
+
+from .advanced_language_engine import AdvancedLanguageEngine
+from .result_cache import ResultCache
+from .shared_engine import SharedEngine
+
+DEFAULT_MAX_TENANTS = 10_000
+DEFAULT_MAX_TENANT_BYTES = 64 * 1024 * 1024
+# Pool bookkeeping per tenant (LRU node, entry key, size slot) on top of nbytes.
+ENTRY_OVERHEAD_BYTES = 250
+# BLAKE2b limits: 64-byte key, 16-byte salt and personalization.
+_PERSON = b'seraphina-tenant'
+
+Secret = Union[str, bytes]
+
+
+class UnknownTenant(KeyError):
+    pass
+
+
+def _secret(value: Secret, limit: int) -> bytes:
+    data = value.encode('utf-8') if isinstance(value, str) else bytes(value)
+    return data if len(data) <= limit else hashlib.blake2b(data, digest_size=limit).digest()
+
+
+def key_fingerprint(master_key: Secret, salt: Secret = b'') -> str:
+    """Short public identifier of a master key and salt (never the key itself)."""
+    return hashlib.blake2b(_secret(salt, 16), key=_secret(master_key, 64), person=_PERSON,
+                           digest_size=8).hexdigest()
+
+
+class TenantCipherTable(Mapping):
+    def __init__(self, base: Mapping[str, Mapping[str, Any]], master_key: Secret, salt: Secret = b''):
+        """
+        Read-only cipher registry that derives a tenant's cipher per code on first access.
+
+        Args:
+            base: The shared engine's frequency_cipher registry
+            master_key: Tenant master key (str or bytes)
+            salt: Tenant salt (str or bytes)
+        """
+        self._base = base
+        self._key = _secret(master_key, 64)
+        self._salt = _secret(salt, 16)
+        self._ciphers: Dict[str, Mapping[str, Any]] = {}
+        self.nbytes = sum(map(sys.getsizeof, (self, self.__dict__, self._ciphers, self._key, self._salt)))
+
+    def __getitem__(self, code: str) -> Mapping[str, Any]:
+        cipher = self._ciphers.get(code)
+        if cipher is None:
+            base = self._base[code]
+            base_key = bytes(base['encryption_key'])
+            mask = hashlib.blake2b(code.encode('utf-8'), key=self._key, salt=self._salt, person=_PERSON,
+                                   digest_size=max(len(base_key), 1)).digest()
+            key = tuple((int.from_bytes(base_key, 'big') ^ int.from_bytes(mask[:len(base_key)], 'big'))
+                        .to_bytes(len(base_key), 'big'))
+            fields = {**base, 'encryption_key': key,
+                      'quantum_signature': sum(map(operator.mul, key, range(1, len(key) + 1))) % 65536}
+            cipher = MappingProxyType(fields)
+            # Concurrent first uses derive the same value; either write wins.
+            self._ciphers[code] = cipher
+            self.nbytes += sys.getsizeof(fields) + sys.getsizeof(key) + sys.getsizeof(cipher)
+        return cipher
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._base)
+
+    def __len__(self) -> int:
+        return len(self._base)
+
+    @property
+    def derived(self) -> int:
+        return len(self._ciphers)
+
+
+class TenantEngine(AdvancedLanguageEngine):
+    def __init__(self, base: AdvancedLanguageEngine, tenant_id: str, master_key: Secret, salt: Secret = b''):
+        # No engine build: share the base engine's attributes by reference
+        # and swap in a lazily derived cipher table.
+        self.__dict__.update(base.__dict__)
+        self.base_engine = base
+        self.tenant_id = tenant_id
+        self.key_fingerprint = key_fingerprint(master_key, salt)
+        table = TenantCipherTable(base.octabit_encryption['frequency_cipher'], master_key, salt)
+        self.octabit_encryption = {
+            'enabled': base.octabit_encryption['enabled'],
+            'encryption_key': self.key_fingerprint,
+            'quantum_salt': hashlib.sha256(_secret(salt, 16)).hexdigest()[:32],
+            'frequency_cipher': table
+        }
+        self._overhead = ENTRY_OVERHEAD_BYTES + sum(map(sys.getsizeof, (
+            self, self.__dict__, self.octabit_encryption, tenant_id, self.key_fingerprint,
+            self.octabit_encryption['quantum_salt'])))
+
+    @property
+    def nbytes(self) -> int:
+        return self._overhead + self.octabit_encryption['frequency_cipher'].nbytes
+
+    def _cache_key(self, input_text: str, source_lang: str, target_lang: str, encryption_enabled: bool) -> bytes:
+        # A shared result cache must never answer one tenant with another's ciphertext.
+        return ResultCache.key(input_text, source_lang, target_lang, encryption_enabled,
+                               f'{self.version}/{self.cache_generation}/{self.tenant_id}/{self.key_fingerprint}')
+
+
+class TenantPool:
+    def __init__(self, shared_engine: Optional[SharedEngine] = None, tenants: Optional[Dict[str, Any]] = None,
+                 max_tenants: int = DEFAULT_MAX_TENANTS, max_bytes: int = DEFAULT_MAX_TENANT_BYTES,
+                 allow_request_keys: bool = False):
+        """
+        LRU of TenantEngines over one shared engine.
+
+        Args:
+            shared_engine: Source of the base engine; reloads are picked up on the next get()
+            tenants: Configured secrets, {tenant_id: {'key': ..., 'salt': ...}}
+            max_tenants: Most TenantEngines kept
+            max_bytes: Approximate byte budget across kept TenantEngines
+            allow_request_keys: Accept a key with the request for tenants not in the
+                config. Off by default, since any client could then create tenants
+                and push configured ones out of the LRU
+        """
+        self.shared_engine = shared_engine or SharedEngine()
+        self.tenants = {tid: (spec['key'], spec.get('salt', '')) for tid, spec in (tenants or {}).items()}
+        self.max_tenants = max_tenants
+        self.max_bytes = max_bytes
+        self.allow_request_keys = allow_request_keys
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self.create_seconds = 0.0
+        self._entries: 'OrderedDict[tuple, TenantEngine]' = OrderedDict()
+        self._sizes: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, tenant_id: str, master_key: Optional[Secret] = None, salt: Optional[Secret] = None) -> TenantEngine:
+        """
+        TenantEngine for a tenant, created on first use.
+
+        Configured tenants always use their configured secrets; a key sent with
+        the request is only used for tenants missing from the config, and only
+        with allow_request_keys.
+
+        Raises:
+            UnknownTenant: The tenant is not configured and no usable key was given
+        """
+        if tenant_id in self.tenants:
+            master_key, salt = self.tenants[tenant_id]
+        elif master_key is None or not self.allow_request_keys:
+            raise UnknownTenant(f'unknown tenant {tenant_id!r}')
+        salt = salt or ''
+        entry_key = (tenant_id, key_fingerprint(master_key, salt))
+        base = self.shared_engine.get()
+        with self._lock:
+            engine = self._entries.get(entry_key)
+            if engine is not None and engine.base_engine is base:
+                self._entries.move_to_end(entry_key)
+                self.hits += 1
+                # Ciphers are derived after the engine is handed out; charge them now.
+                self._resize(entry_key, engine)
+                return engine
+            self.misses += 1
+        start = time.perf_counter()
+        engine = TenantEngine(base, tenant_id, master_key, salt)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.create_seconds += elapsed
+            if entry_key in self._entries:
+                self.bytes -= self._sizes.pop(entry_key)
+                del self._entries[entry_key]
+            self._entries[entry_key] = engine
+            self._resize(entry_key, engine)
+            self._evict()
+        return engine
+
+    def _resize(self, entry_key: tuple, engine: TenantEngine):
+        size = engine.nbytes
+        self.bytes += size - self._sizes.get(entry_key, 0)
+        self._sizes[entry_key] = size
+        self._evict()
+
+    def _evict(self):
+        # Never evict the entry just used, even if it alone is over budget.
+        while len(self._entries) > 1 and (len(self._entries) > self.max_tenants or self.bytes > self.max_bytes):
+            evicted, _ = self._entries.popitem(last=False)
+            self.bytes -= self._sizes.pop(evicted)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.bytes = 0
+
+    def usage(self, limit: int = 20) -> List[Dict[str, Any]]:
+        # Largest tenants first.
+        with self._lock:
+            rows = [{'tenant': tid, 'key_fingerprint': fp, 'bytes': self._sizes[(tid, fp)],
+                     'ciphers_derived': engine.octabit_encryption['frequency_cipher'].derived}
+                    for (tid, fp), engine in self._entries.items()]
+        rows.sort(key=lambda r: r['bytes'], reverse=True)
+        return rows[:limit]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            count = len(self._entries)
+            created = self.misses
+            return {
+                'tenants': count,
+                'configured_tenants': len(self.tenants),
+                'bytes': self.bytes,
+                'avg_tenant_bytes': round(self.bytes / count) if count else 0,
+                'max_tenants': self.max_tenants,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'avg_create_us': round(self.create_seconds / created * 1e6, 1) if created else None
+            }
+
+
+def load_tenants(path: str) -> Dict[str, Dict[str, str]]:
+    """
+    Read tenant secrets from a JSON file.
+
+    The file maps tenant ids to {"key": ..., "salt": ...} (salt optional),
+    either at the top level or under "tenants".
+
+    Raises:
+        ValueError: The file is not in that shape
+    """
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict) and isinstance(data.get('tenants'), dict):
+        data = data['tenants']
+    if not isinstance(data, dict) or not all(isinstance(v, dict) and isinstance(v.get('key'), str)
+                                             for v in data.values()):
+        raise ValueError(f'{path}: expected {{tenant_id: {{"key": ..., "salt": ...}}}}')
+    return data
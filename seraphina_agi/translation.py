@@ -0,0 +1,149 @@
+"""
+Phrase-table translation for natural language pairs.
+Each source/target pair has a table of phrase -> replacement entries, loaded
+from `<source>.<target>.tsv` files into a character trie and applied in one
+left-to-right pass with longest-match replacement. Bundled tables live in
+seraphina_agi/data/translations; extra directories can be passed in or listed
+in SERAPHINA_TRANSLATION_PATH (os.pathsep-separated) and take precedence.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+BUNDLED_TABLE_DIR = os.path.join(os.path.dirname(__file__), 'data', 'translations')
+TABLE_PATH_ENV = 'SERAPHINA_TRANSLATION_PATH'
+
+# Sentences longer than this are translated but not cached.
+CACHEABLE_CHARS = 4096
+
+_END = ''  # trie terminal marker; never clashes with a one-character edge
+
+
+class PhraseTable:
+    def __init__(self, entries: Mapping[str, str]):
+        self._root: Dict[str, Any] = {}
+        self.size = 0
+        for phrase, replacement in entries.items():
+            if not phrase:
+                continue
+            node = self._root
+            for ch in phrase:
+                node = node.setdefault(ch, {})
+            if _END not in node:
+                self.size += 1
+            node[_END] = replacement
+
+    @classmethod
+    def load(cls, path: str) -> 'PhraseTable':
+        entries = {}
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.rstrip('\r\n')
+                if not line or line.startswith('#'):
+                    continue
+                phrase, sep, replacement = line.partition('\t')
+                if sep:
+                    entries[phrase] = replacement
+        return cls(entries)
+
+    def replace(self, text: str) -> str:
+        root = self._root
+        out: List[str] = []
+        n = len(text)
+        i = last = 0
+        while i < n:
+            node = root.get(text[i])
+            if node is None:
+                i += 1
+                continue
+            j = i + 1
+            match_end = j if _END in node else 0
+            match = node.get(_END)
+            while j < n:
+                node = node.get(text[j])
+                if node is None:
+                    break
+                j += 1
+                if _END in node:
+                    match_end, match = j, node[_END]
+            if match_end:
+                out.append(text[last:i])
+                out.append(match)
+                i = last = match_end
+            else:
+                i += 1
+        if not out:
+            return text
+        out.append(text[last:])
+        return ''.join(out)
+
+
+class Translator:
+    def __init__(self, languages: Iterable[str], table_dirs: Optional[Iterable[str]] = None,
+                 cache_size: int = 1024):
+        self.languages = frozenset(languages)
+        if table_dirs is None:
+            table_dirs = [d for d in os.environ.get(TABLE_PATH_ENV, '').split(os.pathsep) if d]
+        self.table_dirs = list(table_dirs) + [BUNDLED_TABLE_DIR]
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._tables: Dict[Tuple[str, str], Optional[PhraseTable]] = {}
+        self._cache: 'OrderedDict[Tuple[str, str, str], str]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, source: str, target: str, table: PhraseTable):
+        with self._lock:
+            self._tables[(source, target)] = table
+            self._cache.clear()
+
+    def table(self, source: str, target: str) -> Optional[PhraseTable]:
+        key = (source, target)
+        if key in self._tables:
+            return self._tables[key]
+        table = None
+        if source in self.languages and target in self.languages:
+            for directory in self.table_dirs:
+                path = os.path.join(directory, f'{source}.{target}.tsv')
+                if os.path.isfile(path):
+                    table = PhraseTable.load(path)
+                    break
+        with self._lock:
+            return self._tables.setdefault(key, table)
+
+    def translate(self, text: str, source: str, target: str) -> Dict[str, Any]:
+        if source == target:
+            return {'text': text, 'confidence': 0.95}
+        table = self.table(source, target)
+        if table is None:
+            return {'text': f'[{target}] {text}', 'confidence': 0.7}
+        prefix = target.split('-', 1)[0].upper()
+        return {'text': f'[{prefix}] {self._replace(table, text, source, target)}', 'confidence': 0.9}
+
+    def _replace(self, table: PhraseTable, text: str, source: str, target: str) -> str:
+        if self.cache_size <= 0 or len(text) > CACHEABLE_CHARS:
+            return table.replace(text)
+        key = (source, target, text)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+        translated = table.replace(text)
+        with self._lock:
+            self._cache[key] = translated
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return translated
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'tables_loaded': sorted(f'{s}->{t}' for (s, t), table in self._tables.items() if table is not None),
+            'cache_entries': len(self._cache),
+            'cache_hits': self.hits,
+            'cache_misses': self.misses
+        }
@@ -1,10 +1,23 @@
 """
 Voice interaction module for Seraphina AGI Companion
 Provides text-to-speech and speech-to-text functionality.
+The audio backends are imported on first use so that importing the package
+does not pay for (or require) them.
+
+speak() and listen() are one-shot helpers that set up their backend per call.
+VoiceSession keeps the TTS engine, recognizer and microphone open for a whole
+conversation, calibrates for ambient noise once and speaks replies on a
+background thread; its backends can be injected to run headless.
 """
 
-import pyttsx3
-import speech_recognition as sr
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Reply to an utterance that listen() could not recognize.
+NOT_UNDERSTOOD = "Sorry, I didn't understand that."
+
 
 def speak(text: str, language: str = 'en-US') -> None:
     """
@@ -15,6 +28,7 @@ def speak(text: str, language: str = 'en-US') -> None:
         language: Language code (currently not used, defaults to system default)
     """
     try:
+        import pyttsx3
         engine = pyttsx3.init()
         engine.say(text)
         engine.runAndWait()
@@ -31,6 +45,11 @@ def listen(timeout: int = 5) -> str:
     Returns:
         The recognized text, or empty string if recognition failed
     """
+    try:
+        import speech_recognition as sr
+    except ImportError as e:
+        print(f"Microphone error: {e}")
+        return ""
     try:
         recognizer = sr.Recognizer()
         with sr.Microphone() as source:
@@ -47,4 +66,158 @@ def listen(timeout: int = 5) -> str:
         return ""
     except Exception as e:
         print(f"Microphone error: {e}")
-        return ""
\ No newline at end of file
+        return ""
+
+class VoiceSession:
+    def __init__(self, tts: Any = None, recognizer: Any = None, microphone: Any = None,
+                 listen_timeout: Optional[float] = 5, calibrate_seconds: float = 0.5,
+                 recognize: Optional[Callable[[Any], str]] = None):
+        """
+        Long-lived voice I/O for a conversation loop.
+
+        Args:
+            tts: pyttsx3-style engine (say, runAndWait); default pyttsx3.init() on the speech thread
+            recognizer: speech_recognition-style Recognizer (adjust_for_ambient_noise, listen)
+            microphone: context manager yielding the audio source; default sr.Microphone()
+            listen_timeout: Seconds to wait for speech to start
+            calibrate_seconds: Ambient-noise calibration done once at start; 0 skips it
+            recognize: Turns captured audio into text; default recognizer.recognize_google
+        """
+        self.listen_timeout = listen_timeout
+        self.calibrate_seconds = calibrate_seconds
+        self.turns: List[Dict[str, Any]] = []
+        self._tts = tts
+        self._recognizer = recognizer
+        self._microphone = microphone
+        self._recognize = recognize
+        self._source = None
+        self._sr = None
+        self._speech: 'queue.Queue' = queue.Queue()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._unspoken = 0
+        self._lock = threading.Lock()
+        self._speaker: Optional[threading.Thread] = None
+        self._turn: Optional[Dict[str, Any]] = None
+
+    def start(self) -> 'VoiceSession':
+        if self._recognizer is None or self._microphone is None:
+            import speech_recognition as sr
+            self._sr = sr
+            self._recognizer = self._recognizer or sr.Recognizer()
+            self._microphone = self._microphone or sr.Microphone()
+        if self._recognize is None:
+            self._recognize = self._recognizer.recognize_google
+        self._source = self._microphone.__enter__()
+        if self.calibrate_seconds:
+            self._recognizer.adjust_for_ambient_noise(self._source, duration=self.calibrate_seconds)
+        self._speaker = threading.Thread(target=self._speak_loop, name='seraphina-voice-tts', daemon=True)
+        self._speaker.start()
+        return self
+
+    def close(self):
+        if self._speaker is not None:
+            self._speech.put(None)
+            self._speaker.join()
+            self._speaker = None
+        if self._source is not None:
+            self._microphone.__exit__(None, None, None)
+            self._source = None
+
+    def __enter__(self) -> 'VoiceSession':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def listen(self) -> str:
+        """
+        Capture and recognize one utterance; starts a new turn record.
+
+        Waits for the previous reply to finish playing so it is not picked up
+        by the microphone. Returns "" when nothing was understood; callers
+        answer that with NOT_UNDERSTOOD.
+        """
+        self._idle.wait()
+        start = time.perf_counter()
+        text = ''
+        try:
+            audio = self._recognizer.listen(self._source, timeout=self.listen_timeout)
+            captured = time.perf_counter()
+            text = self._recognize(audio) or ''
+        except Exception as e:
+            captured = time.perf_counter()
+            if not self._is_silence(e):
+                print(f"Speech recognition error: {e}")
+        heard = time.perf_counter()
+        self._turn = {
+            'heard': text,
+            'listen_ms': round((captured - start) * 1000, 1),
+            'recognize_ms': round((heard - captured) * 1000, 1),
+            '_heard_at': heard
+        }
+        self.turns.append(self._turn)
+        return text
+
+    def say(self, text: str):
+        """Queue text to be spoken and return at once; the next listen() waits for it."""
+        if self._speaker is None:
+            raise RuntimeError('VoiceSession is not started')
+        turn = self._turn
+        if turn is not None and 'respond_ms' not in turn:
+            turn['respond_ms'] = round((time.perf_counter() - turn.pop('_heard_at')) * 1000, 1)
+        with self._lock:
+            self._unspoken += 1
+            self._idle.clear()
+        self._speech.put((text, turn))
+
+    def wait_spoken(self, timeout: Optional[float] = None) -> bool:
+        return self._idle.wait(timeout)
+
+    def latency_report(self) -> Dict[str, Any]:
+        done = [t for t in self.turns if 'respond_ms' in t]
+
+        def mean(key):
+            values = [t[key] for t in done if key in t]
+            return round(sum(values) / len(values), 1) if values else None
+
+        return {
+            'turns': len(done),
+            'mean_listen_ms': mean('listen_ms'),
+            'mean_recognize_ms': mean('recognize_ms'),
+            'mean_respond_ms': mean('respond_ms'),
+            'mean_speak_ms': mean('speak_ms')
+        }
+
+    def _is_silence(self, error: Exception) -> bool:
+        if self._sr is None:
+            return False
+        return isinstance(error, (self._sr.WaitTimeoutError, self._sr.UnknownValueError))
+
+    def _speak_loop(self):
+        # pyttsx3 engines must be driven from the thread that created them.
+        tts = self._tts
+        try:
+            if tts is None:
+                import pyttsx3
+                tts = pyttsx3.init()
+        except Exception as e:
+            print(f"Speech synthesis error: {e}")
+        while True:
+            item = self._speech.get()
+            if item is None:
+                return
+            text, turn = item
+            start = time.perf_counter()
+            try:
+                if tts is not None:
+                    tts.say(text)
+                    tts.runAndWait()
+            except Exception as e:
+                print(f"Speech synthesis error: {e}")
+            if turn is not None:
+                turn['speak_ms'] = round((time.perf_counter() - start) * 1000, 1)
+            with self._lock:
+                self._unspoken -= 1
+                if not self._unspoken:
+                    self._idle.set()
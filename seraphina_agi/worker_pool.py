@@ -0,0 +1,427 @@
+"""
+Multi-process engine pool for CPU-bound language processing.
+Each worker process builds one AdvancedLanguageEngine at start-up and then
+serves tasks from a shared bounded queue, so throughput scales with cores
+instead of being capped by the GIL. Inputs and results above a size threshold
+travel through multiprocessing.shared_memory rather than being pickled.
+A worker that dies mid-task fails that task with WorkerLost and is replaced.
+If one dies idle, the pool starts over with fresh queues and workers and
+queues every pending task again. Only workers that die before their engine is
+ready leave the pool broken: on_broken is called and every task fails with
+WorkerLost. Tasks submitted with a timeout fail with TimeoutError once it runs out.
+"""
+
+import heapq
+import itertools
+import json
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from multiprocessing import connection, shared_memory
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    from multiprocessing import resource_tracker
+except ImportError:  # Windows has no resource tracker
+    resource_tracker = None
+
+from .advanced_language_engine import AdvancedLanguageEngine
+
+# Payloads at or above this many UTF-8 bytes go through shared memory.
+SHM_THRESHOLD = 64 * 1024
+TASKS_PER_WORKER = 4
+# map() packs up to this many small items into one task to amortise IPC.
+MAP_CHUNK_ITEMS = 32
+
+
+class PoolBusy(RuntimeError):
+    pass
+
+
+class WorkerLost(RuntimeError):
+    pass
+
+
+def _to_wire(text: str, threshold: int) -> Tuple[str, Any]:
+    data = text.encode('utf-8')
+    if len(data) < threshold:
+        return 'inline', text
+    block = shared_memory.SharedMemory(create=True, size=len(data))
+    block.buf[:len(data)] = data
+    name = block.name
+    # The receiver unlinks the block once it has read it.
+    block.close()
+    return 'shm', (name, len(data))
+
+
+def _release(task: Tuple) -> None:
+    # Unlink the shared memory block of a task no worker will read.
+    if task[1] == 'shm':
+        try:
+            _from_wire(task[1], task[2])
+        except FileNotFoundError:
+            pass
+
+
+def _from_wire(kind: str, payload: Any) -> str:
+    if kind == 'inline':
+        return payload
+    name, size = payload
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        return bytes(block.buf[:size]).decode('utf-8')
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _worker_main(tasks, results, cache_dir: Optional[str], threshold: int):
+    engine = AdvancedLanguageEngine(cache_dir=cache_dir)
+    pid = os.getpid()
+    results.put((None, 'ready', pid))
+    while True:
+        task = tasks.get()
+        if task is None:
+            return
+        task_id, kind, payload, options = task
+        # Tells the pool which task to fail if this process dies.
+        results.put((task_id, 'started', pid))
+        try:
+            if kind == 'many':
+                result = [engine.process_language(text, opts) for text, opts in payload]
+            else:
+                result = engine.process_language(_from_wire(kind, payload), options)
+            results.put((task_id, *_to_wire(json.dumps(result), threshold)))
+        except Exception as e:
+            results.put((task_id, 'error', f'{type(e).__name__}: {e}'))
+
+
+class ProcessEnginePool:
+    def __init__(self, processes: int, queue_size: Optional[int] = None,
+                 cache_dir: Optional[str] = None, shm_threshold: int = SHM_THRESHOLD,
+                 chunk_items: int = MAP_CHUNK_ITEMS, on_broken: Optional[Callable[[str], None]] = None):
+        # on_broken(reason) runs once if the pool gives up; see the module docstring.
+        self.processes = max(processes, 1)
+        self.queue_size = queue_size or self.processes * TASKS_PER_WORKER
+        self.shm_threshold = shm_threshold
+        self.chunk_items = max(chunk_items, 1)
+        ctx = multiprocessing.get_context()
+        if resource_tracker is not None:
+            # Start the tracker before forking so workers share it; otherwise a
+            # block created in a worker and unlinked here is "leaked" twice.
+            resource_tracker.ensure_running()
+        self._ctx = ctx
+        self._cache_dir = cache_dir
+        self._on_broken = on_broken
+        self._tasks = ctx.Queue(maxsize=self.queue_size)
+        self._results = ctx.Queue()
+        # task id -> (future, task as queued, text behind a shared memory task)
+        self._pending: Dict[int, Tuple[Future, Tuple, Optional[str]]] = {}
+        # (deadline, task id) for tasks submitted with a timeout.
+        self._deadlines: List[Tuple[float, int]] = []
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self._worker_ids = itertools.count()
+        self._closing = False
+        self._broken: Optional[str] = None
+        # Only the dispatcher thread touches these three.
+        self._ready = set()
+        self._running: Dict[int, int] = {}  # pid -> id of the task it is running
+        self._owners: Dict[int, int] = {}  # task id -> pid running it
+        self._wake_reader, self._wake_writer = ctx.Pipe(duplex=False)
+        self._workers = [self._spawn() for _ in range(self.processes)]
+        # Block until every worker holds a warm engine.
+        while len(self._ready) < len(self._workers):
+            try:
+                self._ready.add(self._results.get(timeout=1.0)[2])
+            except queue.Empty:
+                if not all(worker.is_alive() for worker in self._workers):
+                    for worker in self._workers:
+                        worker.terminate()
+                    raise WorkerLost('engine worker exited during start-up')
+        self._dispatcher = threading.Thread(target=self._dispatch, name='seraphina-engine-results', daemon=True)
+        self._dispatcher.start()
+        self._monitor = threading.Thread(target=self._watch, name='seraphina-engine-monitor', daemon=True)
+        self._monitor.start()
+
+    def _spawn(self) -> multiprocessing.Process:
+        worker = self._ctx.Process(target=_worker_main,
+                                   args=(self._tasks, self._results, self._cache_dir, self.shm_threshold),
+                                   name=f'seraphina-engine-{next(self._worker_ids)}', daemon=True)
+        worker.start()
+        return worker
+
+    def _wake(self):
+        self._wake_writer.send_bytes(b'\0')
+
+    def _watch(self):
+        # Waits on worker sentinels and the nearest task deadline. A death is
+        # reported through the results queue so the dispatcher sees it after
+        # everything the worker managed to send.
+        while True:
+            with self._lock:
+                if self._closing:
+                    return
+                watched = {worker.sentinel: worker for worker in self._workers}
+                deadline = self._deadlines[0][0] if self._deadlines else None
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            for ready in connection.wait([self._wake_reader, *watched], timeout):
+                if ready is self._wake_reader:
+                    while self._wake_reader.poll():
+                        self._wake_reader.recv_bytes()
+                else:
+                    worker = watched[ready]
+                    with self._lock:
+                        # Workers retired by _rebuild() are no longer listed.
+                        if worker in self._workers:
+                            self._workers.remove(worker)
+                            self._results.put((None, 'dead', worker.pid))
+            self._expire()
+
+    def _expire(self):
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            while self._deadlines and self._deadlines[0][0] <= now:
+                entry = self._pending.pop(heapq.heappop(self._deadlines)[1], None)
+                if entry is not None:
+                    expired.append(entry[0])
+        for future in expired:
+            future.set_exception(TimeoutError('engine pool task timed out'))
+
+    def _worker_died(self, pid: int):
+        task_id = self._running.pop(pid, None)
+        self._owners.pop(task_id, None)
+        was_ready = pid in self._ready
+        self._ready.discard(pid)
+        lost = []
+        retired = []
+        broken = None
+        with self._lock:
+            if self._closing:
+                return
+            if task_id is not None:
+                # It died inside a task, away from the queues' locks. Fail that
+                # task, which may be what killed it, and replace the worker.
+                entry = self._pending.pop(task_id, None)
+                if entry is not None:
+                    lost.append(entry)
+                self._workers.append(self._spawn())
+                self._wake()
+            elif was_ready:
+                retired = self._rebuild()
+            elif not self._workers:
+                # The rest died loading their engine too; respawning would loop.
+                broken = self._broken = f'engine worker {pid} exited before its engine was ready'
+                lost.extend(self._pending.values())
+                self._pending.clear()
+        for future, task, _ in lost:
+            _release(task)
+            future.set_exception(WorkerLost(broken or f'engine worker {pid} exited'))
+        for worker in retired:
+            worker.join(timeout=5)
+        if broken and self._on_broken:
+            self._on_broken(broken)
+
+    def _rebuild(self) -> List[multiprocessing.Process]:
+        # Called with the lock held. An idle worker may have died holding the
+        # task queue's read lock, which would stall the others, so start over
+        # with fresh queues and workers and queue every pending task again.
+        # Returns the retired workers for the caller to reap.
+        retired = self._workers
+        for worker in retired:
+            worker.terminate()
+        for old in (self._tasks, self._results):
+            old.cancel_join_thread()
+        self._tasks = self._ctx.Queue(maxsize=self.queue_size)
+        self._results = self._ctx.Queue()
+        self._running.clear()
+        self._owners.clear()
+        self._ready.clear()
+        self._workers = [self._spawn() for _ in range(self.processes)]
+        requeue = []
+        for task_id, (future, task, text) in sorted(self._pending.items()):
+            if text is not None:  # a worker may already have read and unlinked the block
+                _release(task)
+                task = (task_id, *_to_wire(text, self.shm_threshold), task[3])
+                self._pending[task_id] = (future, task, text)
+            requeue.append(task)
+        self._wake()
+        threading.Thread(target=self._requeue, args=(self._tasks, requeue), name='seraphina-engine-requeue',
+                         daemon=True).start()
+        return retired
+
+    def _requeue(self, tasks, requeue: List[Tuple]):
+        # Off the dispatcher thread: the new queue only drains once the new
+        # workers have built their engines.
+        for task in requeue:
+            while True:
+                with self._lock:
+                    current = tasks is self._tasks and not self._closing and task[0] in self._pending
+                if not current:
+                    break
+                try:
+                    tasks.put(task, timeout=0.5)
+                    break
+                except queue.Full:
+                    pass
+
+    def _dispatch(self):
+        while True:
+            message = self._results.get()
+            if message is None:
+                return
+            task_id, kind, payload = message
+            if kind == 'started':
+                self._running[payload] = task_id
+                self._owners[task_id] = payload
+                continue
+            if kind == 'ready':
+                self._ready.add(payload)
+                continue
+            if kind == 'dead':
+                self._worker_died(payload)
+                continue
+            pid = self._owners.pop(task_id, None)
+            if self._running.get(pid) == task_id:
+                del self._running[pid]
+            with self._lock:
+                entry = self._pending.pop(task_id, None)
+            if entry is None:
+                if kind == 'shm':
+                    _from_wire(kind, payload)  # timed out or lost; release the block
+                continue
+            future = entry[0]
+            if kind == 'error':
+                future.set_exception(RuntimeError(payload))
+            else:
+                future.set_result(json.loads(_from_wire(kind, payload)))
+
+    def submit(self, text: str, options: Optional[Dict[str, Any]] = None,
+               block: bool = True, timeout: Optional[float] = None) -> Future:
+        """
+        Queue one process_language call.
+
+        Args:
+            timeout: seconds to wait for a queue slot and then for the result; when
+                it runs out the future fails with TimeoutError
+
+        Raises:
+            PoolBusy: if the task queue stays full for the whole timeout (or at once when block=False)
+            WorkerLost: if the pool is broken (see the module docstring)
+
+        The future fails with WorkerLost if the worker running the task dies.
+        """
+        return self._enqueue(*_to_wire(text, self.shm_threshold), options, block, timeout, text)
+
+    def _enqueue(self, kind: str, payload: Any, options: Optional[Dict[str, Any]],
+                 block: bool, timeout: Optional[float], text: Optional[str] = None) -> Future:
+        task_id = next(self._ids)
+        task = (task_id, kind, payload, options)
+        future: Future = Future()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            broken = self._broken
+            tasks = self._tasks
+            if broken is None:
+                # Shared memory is unlinked once read, so keep the text in case
+                # the task has to be queued again.
+                self._pending[task_id] = (future, task, text if kind == 'shm' else None)
+        if broken is not None:
+            _release(task)
+            raise WorkerLost(f'engine pool is broken: {broken}')
+        try:
+            tasks.put(task, block, timeout)
+        except queue.Full as e:
+            with self._lock:
+                # A rebuild in the meantime has queued it again already.
+                requeued = tasks is not self._tasks and task_id in self._pending
+                if not requeued:
+                    self._pending.pop(task_id, None)
+            if not requeued:
+                _release(task)
+                raise PoolBusy('engine pool queue is full') from e
+        if deadline is not None:
+            with self._lock:
+                heapq.heappush(self._deadlines, (deadline, task_id))
+                if self._deadlines[0][1] == task_id:
+                    self._wake()
+        return future
+
+    def process_language(self, text: str, options: Optional[Dict[str, Any]] = None,
+                         timeout: Optional[float] = None) -> Dict[str, Any]:
+        return self.submit(text, options, timeout=timeout).result()
+
+    def map(self, items: Iterable[Union[str, Dict[str, Any]]],
+            options: Optional[Dict[str, Any]] = None,
+            chunk_items: Optional[int] = None, timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        # Same item format as AdvancedLanguageEngine.process_many. Small items
+        # travel chunk_items (default: the pool's) per task, large ones alone
+        # through shared memory; results are yielded in input order with a
+        # bounded window. timeout applies to each task as in submit(); a lost
+        # worker or an expired task raises from the iterator.
+        chunk_items = chunk_items or self.chunk_items
+        window = deque()
+        limit = self.queue_size + self.processes
+        chunk = []
+        chunk_bytes = 0
+
+        def drain(keep: int):
+            while len(window) > keep:
+                future, many = window.popleft()
+                if many:
+                    yield from future.result()
+                else:
+                    yield future.result()
+
+        def flush_chunk():
+            nonlocal chunk, chunk_bytes
+            if chunk:
+                window.append((self._enqueue('many', chunk, None, True, timeout), True))
+                chunk, chunk_bytes = [], 0
+
+        for item in items:
+            if isinstance(item, str):
+                text, opts = item, options
+            else:
+                text, opts = item.get('input', ''), {**(options or {}), **(item.get('options') or {})}
+            size = len(text) * 4  # UTF-8 upper bound, avoids encoding twice
+            if size >= self.shm_threshold:
+                flush_chunk()
+                window.append((self.submit(text, opts, timeout=timeout), False))
+            else:
+                chunk.append((text, opts))
+                chunk_bytes += size
+                if len(chunk) >= chunk_items or chunk_bytes >= self.shm_threshold:
+                    flush_chunk()
+            yield from drain(limit)
+        flush_chunk()
+        yield from drain(0)
+
+    def close(self):
+        with self._lock:
+            self._closing = True
+            self._wake()
+        self._monitor.join(timeout=5)
+        workers = list(self._workers)
+        for _ in workers:
+            try:
+                self._tasks.put(None, timeout=1.0)
+            except queue.Full:  # workers stalled; they are terminated below
+                break
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        self._results.put(None)
+        self._dispatcher.join(timeout=5)
+
+    def __enter__(self) -> 'ProcessEnginePool':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
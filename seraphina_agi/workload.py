@@ -0,0 +1,32 @@
+"""
+Synthetic /process request logs.
+A few greetings and templated messages dominate (Zipf-distributed) and a
+share of requests is unique, as in a recorded request log. optimize uses one
+as its default workload; the result cache benchmark replays one.
+"""
+
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+GREETINGS = ['Hello world', 'Hi there!', 'Good morning', '¡Hola! ¿Qué tal?', 'Bonjour à tous', 'Guten Tag']
+TEMPLATES = [
+    'Your order {n} has shipped and will arrive in {d} days.',
+    'Reminder: your appointment is on day {d} at slot {n}.',
+    'Thank you for contacting support, ticket {n} is open.'
+]
+OPTIONS = [None, {'target_language': 'es-ES'}, {'target_language': 'fr-FR', 'encryption_enabled': False}]
+
+
+def request_log(count: int, unique_share: float = 0.2, seed: int = 3) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+    """(text, options) pairs; options is None for the defaults."""
+    rng = random.Random(seed)
+    common = GREETINGS + [t.format(n=n, d=n % 7 + 1) for t in TEMPLATES for n in range(40)]
+    weights = [1 / (rank + 1) for rank in range(len(common))]
+    log = []
+    for i in range(count):
+        if rng.random() < unique_share:
+            text = f'Message {i}: ' + ' '.join(rng.choice(GREETINGS) for _ in range(3))
+        else:
+            text = rng.choices(common, weights)[0]
+        log.append((text, rng.choice(OPTIONS)))
+    return log
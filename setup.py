@@ -10,6 +10,7 @@ setup(
     author_email="seraphina@agi.example.com",
     url="https://github.com/SynerGro-AI/Seraphina-agi-python",
     packages=find_packages(),
+    package_data={"seraphina_agi": ["data/translations/*.tsv", "data/langdetect/*"]},
     install_requires=[
         "requests",  # for HTTP
         "cryptography",  # for crypto
@@ -0,0 +1,48 @@
+import asyncio
+import importlib
+import json
+
+import pytest
+
+from seraphina_agi import asgi
+
+
+@pytest.fixture
+def fresh_asgi():
+    module = importlib.reload(asgi)
+    yield module
+    importlib.reload(asgi)
+
+
+def call(app, method, path):
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {'type': 'http', 'method': method, 'path': path, 'query_string': b'', 'headers': [],
+             'client': ('127.0.0.1', 1234)}
+    asyncio.run(app(scope, receive, send))
+    body = b''.join(m.get('body', b'') for m in messages if m['type'] == 'http.response.body')
+    return messages[0]['status'], json.loads(body)
+
+
+def test_import_creates_no_app(fresh_asgi):
+    assert fresh_asgi._app is None
+    assert 'app' not in vars(fresh_asgi)
+
+
+def test_app_is_created_once_on_access(fresh_asgi):
+    app = fresh_asgi.app
+    assert isinstance(app, fresh_asgi.EngineASGIApp)
+    assert fresh_asgi.app is app
+    status, health = call(app, 'GET', '/health')
+    assert status == 200 and health['status'] == 'ok'
+
+
+def test_unknown_attributes_still_raise(fresh_asgi):
+    with pytest.raises(AttributeError):
+        fresh_asgi.not_there
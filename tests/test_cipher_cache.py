@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+from seraphina_agi.advanced_language_engine import AdvancedLanguageEngine
+from seraphina_agi.cipher_cache import default_cache_dir
+
+
+@pytest.fixture
+def env(monkeypatch, tmp_path):
+    for name in ('SERAPHINA_CACHE_DIR', 'SERAPHINA_CIPHER_CACHE', 'XDG_CACHE_HOME'):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv('HOME', str(tmp_path))
+    return monkeypatch
+
+
+def test_default_is_under_home(env, tmp_path):
+    assert default_cache_dir() == os.path.join(str(tmp_path), '.cache', 'seraphina-agi')
+
+
+def test_xdg_cache_home_is_honoured(env, tmp_path):
+    env.setenv('XDG_CACHE_HOME', str(tmp_path / 'xdg'))
+    assert default_cache_dir() == os.path.join(str(tmp_path / 'xdg'), 'seraphina-agi')
+
+
+def test_relative_xdg_cache_home_is_ignored(env, tmp_path):
+    env.setenv('XDG_CACHE_HOME', 'relative/cache')
+    assert default_cache_dir() == os.path.join(str(tmp_path), '.cache', 'seraphina-agi')
+
+
+def test_explicit_dir_wins_and_off_disables(env, tmp_path):
+    env.setenv('XDG_CACHE_HOME', str(tmp_path / 'xdg'))
+    env.setenv('SERAPHINA_CACHE_DIR', str(tmp_path / 'mine'))
+    assert default_cache_dir() == str(tmp_path / 'mine')
+    env.setenv('SERAPHINA_CIPHER_CACHE', 'off')
+    assert default_cache_dir() is None
+
+
+def test_library_engine_writes_nothing(env, tmp_path):
+    env.setenv('XDG_CACHE_HOME', str(tmp_path / 'xdg'))
+    AdvancedLanguageEngine().process_language('Hello world, how are you today?')
+    assert os.listdir(tmp_path) == []
+
+
+def test_engine_caches_only_in_the_given_dir(env, tmp_path):
+    AdvancedLanguageEngine(cache_dir=str(tmp_path / 'ciphers'))
+    assert os.listdir(tmp_path) == ['ciphers']
+    assert os.listdir(tmp_path / 'ciphers')
@@ -0,0 +1,43 @@
+import sys
+
+import pytest
+
+from seraphina_agi import run_agi, server
+
+
+def serve_overrides(monkeypatch, tmp_path, *flags):
+    calls = []
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    monkeypatch.setattr(server, 'serve', lambda port, **overrides: calls.append(overrides))
+    monkeypatch.setattr(sys, 'argv', ['seraphina-agi', 'serve', *flags])
+    # serve's return value becomes the exit status.
+    with pytest.raises(SystemExit) as exc:
+        run_agi.main()
+    if exc.value.code is not None:
+        raise exc.value
+    return calls[0]
+
+
+def test_serve_has_no_result_cache_by_default(monkeypatch, tmp_path):
+    assert 'result_cache' not in serve_overrides(monkeypatch, tmp_path)
+
+
+@pytest.mark.parametrize('flags, entries, ttl', [
+    (['--cache-entries', '50'], 50, None),
+    (['--cache-ttl', '30'], 10_000, 30.0),
+    (['--cache-mb', '1', '--cache-entries', '7', '--cache-ttl', '5'], 7, 5.0)
+])
+def test_cache_limits_turn_the_cache_on(monkeypatch, tmp_path, flags, entries, ttl):
+    cache = serve_overrides(monkeypatch, tmp_path, *flags)['result_cache']
+    assert (cache.max_entries, cache.ttl) == (entries, ttl)
+
+
+@pytest.mark.parametrize('flags', [
+    ['--cache-mb', '0', '--cache-ttl', '30'],
+    ['--cache-entries', '0'],
+    ['--cache-ttl', '-1']
+])
+def test_conflicting_cache_flags_exit(monkeypatch, tmp_path, flags):
+    with pytest.raises(SystemExit) as exc:
+        serve_overrides(monkeypatch, tmp_path, *flags)
+    assert exc.value.code == 2
@@ -0,0 +1,44 @@
+import pytest
+
+from seraphina_agi.advanced_language_engine import AdvancedLanguageEngine
+from seraphina_agi.language_detection import DEFAULT_LANGUAGE, LanguageDetector
+
+
+@pytest.fixture(scope='module')
+def detector():
+    return LanguageDetector()
+
+
+@pytest.mark.parametrize('text', ['Hello', 'test', 'OK', 'abc', 'deadbeef', '', '   ', '12345'])
+def test_short_or_ambiguous_latin_falls_back_to_default(detector, text):
+    assert detector.detect(text) == (DEFAULT_LANGUAGE, 0.0)
+
+
+def test_fallback_keeps_spanish_markers(detector):
+    assert detector.detect('¡Hola!')[0] == 'es-ES'
+
+
+@pytest.mark.parametrize('text, code', [
+    ('Hello world, how are you today?', 'en-US'),
+    ('Bonjour à tous, comment allez-vous ?', 'fr-FR'),
+    ('Guten Tag, wie geht es Ihnen?', 'de-DE'),
+    ('¡Hola! ¿Qué tal?', 'es-ES'),
+    ('Привет, как дела?', 'ru-RU'),
+    ('こんにちは世界', 'ja-JP')
+])
+def test_confident_detection(detector, text, code):
+    language, confidence = detector.detect(text)
+    assert language == code
+    assert confidence > 0
+
+
+def test_memoized_result_matches_uncached(detector):
+    text = 'Ceci est une phrase en français.'
+    assert detector.detect(text) == detector._detect(text) == detector.detect(text)
+
+
+def test_engine_short_input_keeps_default_cipher_and_translation():
+    engine = AdvancedLanguageEngine()
+    result = engine.process_language('Hello')
+    assert result['detected_language'] == 'en-US'
+    assert result['encrypted_input'] == engine.encrypt_with_octabit('Hello', 'en-US')
@@ -0,0 +1,45 @@
+import pytest
+
+from seraphina_agi.octabit_archive import MAX_CODES, ArchiveError, ArchiveReader, ArchiveWriter
+
+CIPHERS = {'en-US': {'encryption_key': b'\x13\x37\x42'}, 'fr-FR': {'encryption_key': b'\x01\x02'}}
+
+
+@pytest.fixture
+def archive(tmp_path):
+    path = str(tmp_path / 'records.soar')
+    with ArchiveWriter(path, CIPHERS, engine_version='test') as writer:
+        for i in range(10):
+            writer.append(f'record {i}', 'en-US' if i % 2 else 'fr-FR')
+    return path
+
+
+def test_round_trip(archive):
+    with ArchiveReader(archive, CIPHERS) as reader:
+        assert len(reader) == 10
+        assert reader.text(3) == 'record 3'
+        assert reader.language(4) == 'fr-FR'
+        assert [record_id for record_id, _ in reader.scan('en-US')] == [1, 3, 5, 7, 9]
+        assert [data for _, _, data in reader.records()] == [f'record {i}'.encode() for i in range(10)]
+
+
+def test_abandoned_iterators_do_not_block_close(archive):
+    reader = ArchiveReader(archive, CIPHERS)
+    records, scan = reader.records(), reader.scan()
+    next(records)
+    next(scan)
+    reader.close()
+
+
+def test_code_limit_fits_the_code_count(tmp_path):
+    path = str(tmp_path / 'codes.soar')
+    with ArchiveWriter(path, CIPHERS) as writer:
+        for i in range(MAX_CODES):
+            writer.append_raw(b'x', f'c{i}')
+        with pytest.raises(ArchiveError):
+            writer.append_raw(b'x', 'one-too-many')
+        assert len(writer) == MAX_CODES
+    with ArchiveReader(path) as reader:
+        assert not reader.recovered
+        assert len(reader.codes) == MAX_CODES
+        assert reader.language(MAX_CODES - 1) == f'c{MAX_CODES - 1}'
@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+from seraphina_agi.advanced_language_engine import AdvancedLanguageEngine
+from seraphina_agi.octabit_archive import ArchiveReader, ArchiveWriter
+from seraphina_agi.protocol_codecs import ProtocolError
+
+NOTIFY = {'id': None, 'method': 'mining.notify',
+          'params': ['bf', '4d16b6f85af6e2198f44ae2a6de67f78487ae5611b77c6c0440b921e00000000', '01000000', '0a', [],
+                     '00000002', '1c2ac4af', '504e86b9', False]}
+MESSAGES = {
+    'proto:stratum.notify': json.dumps(NOTIFY, separators=(',', ':')),
+    'proto:stratum.set_difficulty': '{"id":null,"method":"mining.set_difficulty","params":[2]}',
+    'proto:stratum.submit': '{"id":4,"method":"mining.submit",'
+                            '"params":["worker","bf","00000001","504e86ed","b2957c02"]}',
+    'proto:json-rpc': '{"jsonrpc":"2.0","id":1,"method":"getwork","params":[]}',
+    'proto:blockheader.hex': 'ab' * 80,
+    'proto:merkle.hex': 'cd' * 64,
+    'proto:coinbase.hex': '01000000010000',
+    'proto:nbits': '1d00ffff',
+    'proto:ntime': '504e86b9',
+    'proto:nonce': 'deadbeef',
+    'proto:extranonce': 'abc123',
+    'proto:sha256-hash': '00' * 32,
+    'proto:base64': 'aGVsbG8gd29ybGQ=',
+    'proto:f2pool-tag': 'Mined by F2Pool'
+}
+
+
+@pytest.fixture(scope='module')
+def engine():
+    return AdvancedLanguageEngine()
+
+
+def test_every_codec_is_covered(engine):
+    assert set(MESSAGES) == set(engine.protocol_codecs)
+
+
+@pytest.mark.parametrize('code', sorted(MESSAGES))
+def test_packed_round_trip(engine, code):
+    result = engine.process_language(MESSAGES[code], {'source_language': code})
+    assert result['protocol_encoding'] == 'packed'
+    token = result['encrypted_input']
+    assert engine.decrypt_with_octabit(token, code, 'packed') == MESSAGES[code]
+    assert engine.decrypt_with_octabit(token, code) == MESSAGES[code]
+
+
+def test_text_fallback_round_trip(engine):
+    result = engine.process_language('not a nonce', {'source_language': 'proto:nonce'})
+    assert result['protocol_encoding'] == 'text'
+    assert engine.decrypt_with_octabit(result['encrypted_input'], 'proto:nonce', 'text') == 'not a nonce'
+
+
+def test_packed_decrypt_rejects_text(engine):
+    token = engine.process_language('not a nonce', {'source_language': 'proto:nonce'})['encrypted_input']
+    with pytest.raises(ProtocolError):
+        engine.decrypt_with_octabit(token, 'proto:nonce', 'packed')
+
+
+def test_process_bytes_reports_encoding(engine):
+    result = engine.process_bytes(b'deadbeef', {'source_language': 'proto:nonce'})
+    assert result['protocol_encoding'] == 'packed'
+    assert engine.decrypt_with_octabit(bytes(result['output']).decode('ascii'), 'proto:nonce', 'packed') == 'deadbeef'
+
+
+def test_natural_languages_have_no_protocol_encoding(engine):
+    assert 'protocol_encoding' not in engine.process_language('Hello world, how are you today?')
+
+
+def test_archive_unpacks_protocol_records(engine, tmp_path):
+    path = str(tmp_path / 'proto.soar')
+    json_rpc = engine.process_language(MESSAGES['proto:json-rpc'], {'source_language': 'proto:json-rpc'})
+    with ArchiveWriter(path, engine) as writer:
+        writer.append('deadbeef', 'proto:nonce')
+        writer.append('not a nonce', 'proto:nonce')
+        writer.append_token(json_rpc['encrypted_input'], 'proto:json-rpc', json_rpc['protocol_encoding'])
+    with ArchiveReader(path, engine) as reader:
+        assert [reader.packed(i) for i in range(3)] == [True, False, True]
+        assert reader.text(0) == 'deadbeef'
+        assert reader.text(1) == 'not a nonce'
+        assert reader.text(2) == MESSAGES['proto:json-rpc']
+        assert [data for _, _, data in reader.records()] == [b'deadbeef', b'not a nonce',
+                                                               MESSAGES['proto:json-rpc'].encode()]
+
+
+@pytest.mark.parametrize('text, value', [
+    ('12345678', 12345678),
+    ('42', 42),
+    ('0x12345678', 0x12345678),
+    ('deadbeef', 0xDEADBEEF),
+    ('1d00ffff', 0x1D00FFFF)
+])
+def test_numeric_codec_reads_decimal_unless_hex(engine, text, value):
+    assert engine.encode_protocol(text, 'proto:nonce') == value.to_bytes(4, 'big')
+
+
+@pytest.mark.parametrize('text', ['4294967296', '0x100000000', '-1', 'nonce'])
+def test_numeric_codec_rejects(engine, text):
+    with pytest.raises(ProtocolError):
+        engine.encode_protocol(text, 'proto:nonce')
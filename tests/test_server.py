@@ -0,0 +1,232 @@
+import http.client
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+from seraphina_agi import server as server_module
+from seraphina_agi.advanced_language_engine import AdvancedLanguageEngine
+from seraphina_agi.result_cache import ResultCache
+from seraphina_agi.server import QuietRequestHandler, admin_allowed, make_server
+from seraphina_agi.shared_engine import SharedEngine
+
+
+@pytest.fixture(scope='module')
+def server():
+    httpd = make_server('127.0.0.1', 0, workers=2, handler_class=QuietRequestHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def request(server, method, path, body=None, headers=None):
+    conn = http.client.HTTPConnection('127.0.0.1', server.server_address[1], timeout=10)
+    try:
+        payload = json.dumps(body).encode() if body is not None else None
+        conn.request(method, path, payload, {'Content-Type': 'application/json', **(headers or {})})
+        response = conn.getresponse()
+        return response.status, json.loads(response.read() or b'null')
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize('path', ['/process', '/process?trace=1'])
+def test_process_ignores_query_string(server, path):
+    status, result = request(server, 'POST', path, {'input': 'Hello world, how are you today?'})
+    assert status == 200
+    assert result['detected_language'] == 'en-US'
+
+
+@pytest.mark.parametrize('path', ['/health?verbose=1', '/tenants?limit=5', '/cache?x=1'])
+def test_get_routes_ignore_query_string(server, path):
+    assert request(server, 'GET', path)[0] == 200
+
+
+def test_unknown_route_is_404(server):
+    assert request(server, 'GET', '/nope?x=1')[0] == 404
+
+
+def tenant_server(allow_tenant_keys):
+    httpd = make_server('127.0.0.1', 0, workers=1, handler_class=QuietRequestHandler,
+                        tenants={'acme': {'key': 'configured-secret'}}, max_tenants=1,
+                        allow_tenant_keys=allow_tenant_keys)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+@pytest.mark.parametrize('allow_tenant_keys', [False, True])
+def test_request_tenant_keys_are_opt_in(allow_tenant_keys):
+    httpd = tenant_server(allow_tenant_keys)
+    try:
+        body = {'input': 'Hello world, how are you today?'}
+        assert request(httpd, 'POST', '/process', body, {'X-Tenant-Id': 'acme'})[0] == 200
+        status, _ = request(httpd, 'POST', '/process', body, {'X-Tenant-Id': 'intruder', 'X-Tenant-Key': 'k'})
+        assert status == (200 if allow_tenant_keys else 403)
+        assert request(httpd, 'POST', '/process', body, {'X-Tenant-Id': 'nobody'})[0] == 403
+        tenants = [row['tenant'] for row in httpd.tenant_pool.usage()]
+        assert tenants == (['intruder'] if allow_tenant_keys else ['acme'])
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.mark.parametrize('host, allowed', [
+    ('127.0.0.1', True), ('::1', True), ('::ffff:127.0.0.1', True), ('10.0.0.5', False), ('', False)
+])
+def test_admin_routes_without_token_are_loopback_only(host, allowed):
+    assert admin_allowed(None, None, host) is allowed
+
+
+@pytest.mark.parametrize('authorization, allowed', [
+    ('Bearer s3cret', True), ('bearer s3cret', True), ('Bearer wrong', False), ('s3cret', False), (None, False)
+])
+def test_admin_token_is_required_when_configured(authorization, allowed):
+    assert admin_allowed('s3cret', authorization, '127.0.0.1') is allowed
+
+
+@pytest.mark.parametrize('path', ['/reload', '/cache/clear?now=1'])
+def test_admin_routes_check_the_token(monkeypatch, path):
+    monkeypatch.setenv('SERAPHINA_ADMIN_TOKEN', 's3cret')
+    httpd = make_server('127.0.0.1', 0, workers=1, handler_class=QuietRequestHandler, result_cache=ResultCache())
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        assert request(httpd, 'POST', path)[0] == 403
+        assert request(httpd, 'POST', path, headers={'Authorization': 'Bearer s3cret'})[0] == 200
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_metrics_families_are_not_repeated_across_servers():
+    cache = ResultCache()
+    servers = [make_server('127.0.0.1', 0, workers=1, handler_class=QuietRequestHandler, result_cache=cache)
+               for _ in range(2)]
+    for httpd in servers:
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        body = {'input': 'Hello world, how are you today?'}
+        for httpd in servers:
+            assert request(httpd, 'POST', '/process', body)[0] == 200
+        conn = http.client.HTTPConnection('127.0.0.1', servers[0].server_address[1], timeout=10)
+        conn.request('GET', '/metrics')
+        text = conn.getresponse().read().decode()
+        conn.close()
+    finally:
+        for httpd in servers:
+            httpd.shutdown()
+            httpd.server_close()
+    helps = [line.split()[2] for line in text.splitlines() if line.startswith('# HELP')]
+    assert len(helps) == len(set(helps))
+    # Both servers share one cache: one miss, then one hit, counted once.
+    assert 'seraphina_result_cache_hits_total 1\n' in text
+    assert 'seraphina_result_cache_misses_total 1\n' in text
+
+
+def test_tenant_listing_is_an_admin_route(monkeypatch):
+    monkeypatch.setenv('SERAPHINA_ADMIN_TOKEN', 's3cret')
+    httpd = make_server('127.0.0.1', 0, workers=1, handler_class=QuietRequestHandler,
+                        tenants={'acme': {'key': 'configured-secret'}})
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        assert request(httpd, 'GET', '/tenants')[0] == 403
+        status, body = request(httpd, 'GET', '/tenants', headers={'Authorization': 'Bearer s3cret'})
+        assert status == 200 and 'largest' in body
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.mark.parametrize('query, status', [('', 200), ('?seconds=0.1', 200), ('?seconds=30', 400),
+                                           ('?seconds=0', 400), ('?seconds=x', 400)])
+def test_profile_duration_is_capped(server, query, status):
+    conn = http.client.HTTPConnection('127.0.0.1', server.server_address[1], timeout=10)
+    try:
+        conn.request('GET', '/debug/profile' + query)
+        response = conn.getresponse()
+        response.read()
+        assert response.status == status
+    finally:
+        conn.close()
+
+
+def test_profile_needs_the_admin_token(monkeypatch):
+    monkeypatch.setenv('SERAPHINA_ADMIN_TOKEN', 's3cret')
+    httpd = make_server('127.0.0.1', 0, workers=1, handler_class=QuietRequestHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        assert request(httpd, 'GET', '/debug/profile?seconds=0.1')[0] == 403
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_idle_keepalive_connections_do_not_hold_workers():
+    httpd = make_server('127.0.0.1', 0, workers=1, handler_class=QuietRequestHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    idle = [http.client.HTTPConnection('127.0.0.1', httpd.server_address[1], timeout=10) for _ in range(8)]
+    try:
+        for conn in idle:
+            conn.request('GET', '/health')
+            response = conn.getresponse()
+            response.read()
+            assert response.status == 200
+        assert request(httpd, 'GET', '/health')[0] == 200
+        # The idle connections are still usable afterwards.
+        idle[0].request('GET', '/health')
+        assert idle[0].getresponse().status == 200
+    finally:
+        for conn in idle:
+            conn.close()
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_pipelined_requests_are_all_answered(server):
+    with socket.create_connection(server.server_address, timeout=10) as sock:
+        sock.sendall(b'GET /health HTTP/1.1\r\nHost: x\r\n\r\n' * 2
+                     + b'GET /health HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n')
+        data = b''
+        while chunk := sock.recv(65536):
+            data += chunk
+    assert data.count(b'HTTP/1.1 200') == 3
+
+
+def test_trickled_headers_time_out(monkeypatch):
+    monkeypatch.setattr(server_module, 'REQUEST_HEADER_TIMEOUT', 0.3)
+    httpd = make_server('127.0.0.1', 0, workers=1, handler_class=QuietRequestHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        with socket.create_connection(httpd.server_address, timeout=10) as sock:
+            sock.sendall(b'GET /health HTTP/1.1\r\n')
+            for _ in range(6):
+                time.sleep(0.1)
+                try:
+                    sock.sendall(b'X: y\r\n')
+                except OSError:
+                    break
+            sock.settimeout(5)
+            try:
+                assert b' 200 ' not in sock.recv(65536)
+            except ConnectionResetError:
+                pass
+        assert request(httpd, 'GET', '/health')[0] == 200
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_reload_drops_cached_results():
+    cache = ResultCache()
+    shared = SharedEngine(lambda: AdvancedLanguageEngine(result_cache=cache))
+    old = shared.get()
+    list(old.process_many(['hello']))
+    assert cache.stats()['entries'] == 1
+    shared.reload()
+    assert cache.stats()['entries'] == 0
+    # A request still running on the old engine cannot seed the new one.
+    old.store_result('hello', None, {'stale': True})
+    assert shared.get().cached_result('hello') is None
@@ -0,0 +1,145 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip('requests')
+
+from seraphina_agi import share_uploader  # noqa: E402
+from seraphina_agi.share_uploader import BackgroundUploader, anonymize  # noqa: E402
+
+
+class Collector(ThreadingHTTPServer):
+    # Stand-in share collector: fails the first `failures` POSTs with 503 and
+    # answers each after `delay` seconds.
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _CollectorHandler)
+        self.delay = 0.0
+        self.failures = 0
+        self.posts = []
+        self.items = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server_address[1]}/collect'
+
+
+class _CollectorHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        time.sleep(self.server.delay)
+        with self.server.lock:
+            self.server.posts.append(time.monotonic())
+            failed = len(self.server.posts) <= self.server.failures
+            if not failed:
+                self.server.items.extend(body['items'])
+        self.send_response(503 if failed else 200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def collector():
+    server = Collector()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def fast_backoff(monkeypatch):
+    monkeypatch.setattr(share_uploader, 'BACKOFF_BASE', 0.02)
+
+
+def test_delivers_batched_payloads(collector):
+    uploader = BackgroundUploader(collector.url, batch_size=4, flush_interval=0.05)
+    try:
+        data = [{'result': i} for i in range(10)]
+        assert all(uploader.submit(d) for d in data)
+        assert uploader.flush(5.0)
+    finally:
+        uploader.close(1.0)
+    assert collector.items == [anonymize(d) for d in data]
+    assert len(collector.posts) == 3
+    assert uploader.stats()['sent'] == 10
+    assert uploader.stats()['pending'] == 0
+
+
+def test_retries_with_backoff(collector, fast_backoff):
+    collector.failures = 2
+    uploader = BackgroundUploader(collector.url, flush_interval=0.01, max_retries=3)
+    try:
+        uploader.submit({'result': 1})
+        assert uploader.flush(5.0)
+    finally:
+        uploader.close(1.0)
+    assert len(collector.posts) == 3
+    assert collector.items == [anonymize({'result': 1})]
+    assert uploader.stats()['retries'] == 2
+    # Jittered exponential backoff: at least half of 0.02 s, then of 0.04 s.
+    first, second, third = collector.posts
+    assert second - first >= 0.01
+    assert third - second >= 0.02
+
+
+def test_failed_batches_are_journaled_and_replayed(collector, fast_backoff, tmp_path):
+    journal = str(tmp_path / 'shares.ndjson')
+    collector.failures = 2
+    uploader = BackgroundUploader(collector.url, flush_interval=0.01, max_retries=1, journal_path=journal)
+    uploader.submit({'result': 1})
+    assert uploader.flush(5.0)
+    uploader.close(1.0)
+    assert uploader.stats()['spilled'] == 1
+    assert collector.items == []
+
+    replay = BackgroundUploader(collector.url, journal_path=journal)
+    try:
+        deadline = time.monotonic() + 5.0
+        while not collector.items and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        replay.close(1.0)
+    assert collector.items == [anonymize({'result': 1})]
+    assert replay.stats()['replayed'] == 1
+
+
+def test_submit_and_close_do_not_wait_for_a_slow_collector(collector, tmp_path):
+    collector.delay = 3.0
+    journal = str(tmp_path / 'shares.ndjson')
+    uploader = BackgroundUploader(collector.url, batch_size=1, flush_interval=0.01, journal_path=journal)
+    start = time.monotonic()
+    for i in range(3):
+        assert uploader.submit({'result': i})
+    assert time.monotonic() - start < 0.1
+    time.sleep(0.1)
+    start = time.monotonic()
+    uploader.close(0.2)
+    assert time.monotonic() - start < 2.0
+    # The two still queued went to the journal, then the batch stuck in flight.
+    assert uploader.stats()['spilled'] == 3
+    with open(journal, encoding='utf-8') as f:
+        assert [json.loads(line) for line in f] == [anonymize({'result': i}) for i in (1, 2, 0)]
+
+
+def test_close_waits_for_the_batch_in_flight(collector, tmp_path):
+    collector.delay = 0.5
+    journal = str(tmp_path / 'shares.ndjson')
+    uploader = BackgroundUploader(collector.url, batch_size=1, flush_interval=0.01, journal_path=journal)
+    uploader.submit({'result': 0})
+    time.sleep(0.1)
+    uploader.close(5.0)
+    assert uploader.stats()['sent'] == 1
+    assert uploader.stats()['spilled'] == 0
+    assert collector.items == [anonymize({'result': 0})]
@@ -0,0 +1,129 @@
+import sys
+import threading
+import time
+
+from seraphina_agi import run_agi
+from seraphina_agi.voice import NOT_UNDERSTOOD, VoiceSession
+
+
+class FakeTTS:
+    def __init__(self, play_s: float = 0.0):
+        self.play_s = play_s
+        self.spoken = []
+        self.finished = []
+        self.thread = None
+        self._pending = ''
+
+    def say(self, text):
+        self.thread = threading.current_thread()
+        self._pending = text
+
+    def runAndWait(self):
+        time.sleep(self.play_s)
+        self.spoken.append(self._pending)
+        self.finished.append(time.monotonic())
+
+
+class FakeMicrophone:
+    def __init__(self):
+        self.entered = self.exited = 0
+
+    def __enter__(self):
+        self.entered += 1
+        return self
+
+    def __exit__(self, *exc):
+        self.exited += 1
+
+
+class FakeRecognizer:
+    # Each scripted utterance is returned as the captured audio; an exception
+    # instance is raised instead.
+    def __init__(self, script):
+        self.script = list(script)
+        self.calibrations = []
+        self.listened = []
+
+    def adjust_for_ambient_noise(self, source, duration=1.0):
+        self.calibrations.append(duration)
+
+    def listen(self, source, timeout=None):
+        self.listened.append(time.monotonic())
+        item = self.script.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+def session_for(script, play_s=0.0):
+    tts, recognizer, microphone = FakeTTS(play_s), FakeRecognizer(script), FakeMicrophone()
+    session = VoiceSession(tts=tts, recognizer=recognizer, microphone=microphone, recognize=str.strip,
+                           calibrate_seconds=0.25)
+    return session, tts, recognizer, microphone
+
+
+def test_session_sets_up_backends_once():
+    session, tts, recognizer, microphone = session_for([' hello ', 'again'])
+    with session:
+        assert session.listen() == 'hello'
+        session.say('hi')
+        assert session.listen() == 'again'
+        session.say('hi again')
+        assert session.wait_spoken(5.0)
+    assert recognizer.calibrations == [0.25]
+    assert (microphone.entered, microphone.exited) == (1, 1)
+    assert tts.spoken == ['hi', 'hi again']
+    assert tts.thread is not threading.main_thread()
+
+
+def test_say_returns_before_playback_and_listen_waits_for_it():
+    session, tts, recognizer, _ = session_for(['one', 'two'], play_s=0.2)
+    with session:
+        session.listen()
+        start = time.monotonic()
+        session.say('a reply that takes a while')
+        assert time.monotonic() - start < 0.1
+        session.listen()
+    assert recognizer.listened[1] >= tts.finished[0]
+
+
+def test_failed_recognition_returns_empty_text(capsys):
+    session, _, _, _ = session_for([RuntimeError('service down'), 'fine'])
+    with session:
+        assert session.listen() == ''
+        assert session.listen() == 'fine'
+    assert 'service down' in capsys.readouterr().out
+
+
+def test_latency_report_counts_answered_turns():
+    session, _, _, _ = session_for(['one', 'two'])
+    with session:
+        session.listen()
+        session.say('reply')
+        session.listen()
+        session.wait_spoken(5.0)
+    report = session.latency_report()
+    assert report['turns'] == 1
+    assert set(session.turns[0]) == {'heard', 'listen_ms', 'recognize_ms', 'respond_ms', 'speak_ms'}
+
+
+def test_voice_command_answers_unrecognized_speech(monkeypatch, tmp_path, capsys):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    session, tts, _, _ = session_for([RuntimeError('no match'), 'Hello world, how are you today?', 'exit'])
+    monkeypatch.setattr(run_agi, 'VoiceSession', lambda: session)
+    monkeypatch.setattr(sys, 'argv', ['seraphina-agi', 'voice', '--quiet'])
+    run_agi.main()
+    assert tts.spoken[0] == NOT_UNDERSTOOD
+    assert tts.spoken[-1] == 'Goodbye!'
+    assert len(tts.spoken) == 3
+    assert f'AGI: {NOT_UNDERSTOOD}' in capsys.readouterr().out
+
+
+def test_process_voice_does_not_process_unrecognized_speech(monkeypatch, capsys):
+    spoken = []
+    monkeypatch.setattr(run_agi, 'listen', lambda: '')
+    monkeypatch.setattr(run_agi, 'speak', spoken.append)
+    monkeypatch.setattr(sys, 'argv', ['seraphina-agi', 'process', '--voice'])
+    run_agi.main()
+    assert spoken == [NOT_UNDERSTOOD]
+    assert 'detected_language' not in capsys.readouterr().out
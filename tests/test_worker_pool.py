@@ -0,0 +1,136 @@
+import json
+import os
+import signal
+import time
+
+import pytest
+
+from seraphina_agi import worker_pool
+from seraphina_agi.worker_pool import ProcessEnginePool, WorkerLost
+
+TEXT = 'Hello world, how are you today?'
+
+
+@pytest.fixture
+def pool():
+    pool = ProcessEnginePool(2)
+    yield pool
+    pool.close()
+
+
+def slow_worker_main(tasks, results, cache_dir, threshold):
+    # Stands in for _worker_main: reports ready and started like it, then
+    # holds each task long enough to be killed or to time out.
+    pid = os.getpid()
+    results.put((None, 'ready', pid))
+    while True:
+        task = tasks.get()
+        if task is None:
+            return
+        results.put((task[0], 'started', pid))
+        time.sleep(1.0)
+
+
+def busy_pid(pool, deadline=5.0):
+    end = time.monotonic() + deadline
+    while not pool._running and time.monotonic() < end:
+        time.sleep(0.01)
+    return next(iter(pool._running))
+
+
+def test_results_come_back(pool):
+    assert pool.process_language(TEXT, timeout=30)['detected_language'] == 'en-US'
+    assert len(list(pool.map([TEXT] * 10, timeout=30))) == 10
+
+
+def test_dead_worker_fails_its_task_and_is_replaced(monkeypatch):
+    monkeypatch.setattr(worker_pool, '_worker_main', slow_worker_main)
+    pool = ProcessEnginePool(1)
+    try:
+        future = pool.submit(TEXT)
+        os.kill(busy_pid(pool), signal.SIGKILL)
+        with pytest.raises(WorkerLost):
+            future.result(10)
+        end = time.monotonic() + 10
+        while len(pool._ready) < 1 and time.monotonic() < end:
+            time.sleep(0.01)
+        assert len(pool._workers) == 1 and pool._workers[0].is_alive()
+    finally:
+        pool.close()
+
+
+def echo_worker_main(tasks, results, cache_dir, threshold):
+    # Answers each task with its input after a short delay.
+    pid = os.getpid()
+    results.put((None, 'ready', pid))
+    while True:
+        task = tasks.get()
+        if task is None:
+            return
+        results.put((task[0], 'started', pid))
+        time.sleep(0.3)
+        results.put((task[0], 'inline', json.dumps({'input': task[2]})))
+
+
+def failing_worker_main(tasks, results, cache_dir, threshold):
+    os._exit(1)
+
+
+def wait_for(predicate, deadline=10.0):
+    end = time.monotonic() + deadline
+    while not predicate() and time.monotonic() < end:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_idle_worker_death_rebuilds_the_pool(pool):
+    os.kill(pool._workers[0].pid, signal.SIGKILL)
+    assert wait_for(lambda: len(pool._ready) == 2)
+    assert pool._broken is None
+    assert pool.process_language(TEXT, timeout=30)['detected_language'] == 'en-US'
+
+
+def test_rebuild_queues_pending_tasks_again(monkeypatch):
+    monkeypatch.setattr(worker_pool, '_worker_main', echo_worker_main)
+    pool = ProcessEnginePool(2)
+    try:
+        future = pool.submit('first')
+        busy = busy_pid(pool)
+        idle = next(w.pid for w in pool._workers if w.pid != busy)
+        os.kill(idle, signal.SIGKILL)
+        assert future.result(10) == {'input': 'first'}
+        assert pool.process_language('second', timeout=10) == {'input': 'second'}
+        assert busy not in [w.pid for w in pool._workers]
+    finally:
+        pool.close()
+
+
+def test_workers_dying_before_ready_break_the_pool(monkeypatch):
+    monkeypatch.setattr(worker_pool, '_worker_main', slow_worker_main)
+    reasons = []
+    pool = ProcessEnginePool(1, on_broken=reasons.append)
+    try:
+        future = pool.submit(TEXT)
+        monkeypatch.setattr(worker_pool, '_worker_main', failing_worker_main)
+        os.kill(busy_pid(pool), signal.SIGKILL)
+        with pytest.raises(WorkerLost):
+            future.result(10)
+        assert wait_for(lambda: reasons)
+        with pytest.raises(WorkerLost):
+            pool.submit(TEXT)
+    finally:
+        pool.close()
+
+
+def test_timeout_fails_the_task(monkeypatch):
+    monkeypatch.setattr(worker_pool, '_worker_main', slow_worker_main)
+    pool = ProcessEnginePool(1)
+    try:
+        start = time.monotonic()
+        with pytest.raises(TimeoutError):
+            pool.submit(TEXT, timeout=0.2).result(10)
+        assert time.monotonic() - start < 5
+        with pytest.raises(TimeoutError):
+            list(pool.map([TEXT], timeout=0.2))
+    finally:
+        pool.close()